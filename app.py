@@ -2,7 +2,7 @@ import streamlit as st
 import os
 import sys
 import uuid
-import subprocess
+import pandas as pd
 import shutil
 
 # Critical Path Configuration for Streamlit Cloud
@@ -13,6 +13,12 @@ if scripts_path not in sys.path:
 
 from file_io.header_parser import detect_target_column
 from file_io.schema_check import validate_schemas
+from pipeline_api import ensure_extensions_built, run_pipeline
+
+@st.cache_resource
+def load_engine() -> bool:
+    # once per server process: compiles the c++ extensions only when they are missing
+    return ensure_extensions_built()
 
 st.set_page_config(page_title="Vector | Direction for your data", layout="wide")
 
@@ -49,15 +55,21 @@ if uploaded_files:
         if st.button("RUN VECTOR ENGINE"):
             with st.spinner("Processing..."):
                 try:
-                    subprocess.run(["make", "build"], check=True)
-                    subprocess.run(["python3", "src/python_scripts/run_preprocessing.py"], check=True)
-                    subprocess.run(["python3", "src/python_scripts/main_full_run.py"], check=True)
+                    load_engine()
+                    # runs in this process on the session workspace; preprocessing and
+                    # model results are reused while the uploaded data is unchanged
+                    result = run_pipeline(
+                        workspace,
+                        os.path.join(workspace, "raw", train_file.name),
+                        os.path.join(workspace, "raw", test_file.name)
+                    )
                     st.success("Analysis Complete.")
+                    st.dataframe(pd.DataFrame(result["leaderboard"]))
                     
                     zip_name = f"Vector_Results_{st.session_state.session_id}"
-                    shutil.make_archive(zip_name, 'zip', "data/processed")
+                    zip_path = shutil.make_archive(os.path.join(workspace, zip_name), 'zip', f"{workspace}/processed")
                     
-                    with open(f"{zip_name}.zip", "rb") as f:
+                    with open(zip_path, "rb") as f:
                         st.download_button(
                             label="DOWNLOAD ALL RESULTS (ZIP)",
                             data=f,
@@ -1,29 +1,151 @@
-from fastapi import FastAPI, UploadFile, File, Form
-from typing import List
-import os, uuid, shutil
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+import asyncio, multiprocessing, os, sys, time, uuid
 
-app = FastAPI()
+current_dir = os.path.dirname(os.path.abspath(__file__))
+scripts_path = os.path.join(current_dir, "src", "python_scripts")
+if scripts_path not in sys.path:
+    sys.path.append(scripts_path)
 
-@app.post("/api/run")
+from job_runner import resolve_models, run_job
+from training.model_registry import get_model_spec
+
+# at most MAX_RUNNING_JOBS pipelines run at once; up to MAX_PENDING_JOBS more
+# wait in the pool's queue, anything beyond that is rejected with 429
+MAX_RUNNING_JOBS = int(os.environ.get("BIOBEAT_MAX_RUNNING_JOBS", 2))
+MAX_PENDING_JOBS = int(os.environ.get("BIOBEAT_MAX_PENDING_JOBS", 4))
+UPLOAD_CHUNK_BYTES = 1 << 20
+# finished jobs are forgotten after JOB_TTL_SECONDS, and only the newest
+# MAX_RETAINED_JOBS are kept (their files stay under RUNS_DIR)
+JOB_TTL_SECONDS = float(os.environ.get("BIOBEAT_JOB_TTL_SECONDS", 24 * 3600))
+MAX_RETAINED_JOBS = int(os.environ.get("BIOBEAT_MAX_RETAINED_JOBS", 100))
+RUNS_DIR = os.environ.get("BIOBEAT_RUNS_DIR", "runs")
+
+jobs: Dict[str, Dict[str, Any]] = {}
+_pool: Dict[str, ProcessPoolExecutor] = {}
+
+def get_job_threads() -> int:
+    # split the cores between concurrent jobs so they don't oversubscribe
+    return max(1, (os.cpu_count() or 1) // MAX_RUNNING_JOBS)
+
+def get_job_pool() -> ProcessPoolExecutor:
+    if "executor" not in _pool:
+        # spawn: forking a threaded server process can deadlock the child
+        _pool["executor"] = ProcessPoolExecutor(
+            max_workers=MAX_RUNNING_JOBS, mp_context=multiprocessing.get_context("spawn"))
+    return _pool["executor"]
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    if "executor" in _pool:
+        _pool.pop("executor").shutdown(wait=False, cancel_futures=True)
+
+app = FastAPI(lifespan=lifespan)
+
+def count_active_jobs() -> int:
+    # a job holds its slot from the moment it is reserved, uploads included
+    return sum(job["_future"] is None or not job["_future"].done() for job in jobs.values())
+
+def evict_finished_jobs(now: float) -> None:
+    """
+    drop finished jobs older than JOB_TTL_SECONDS, then the oldest
+    finished ones beyond MAX_RETAINED_JOBS, so the registry stays bounded
+    """
+    finished = sorted((job["finished_at"], job_id) for job_id, job in jobs.items() if "finished_at" in job)
+    n_over = len(finished) - MAX_RETAINED_JOBS
+    for k, (finished_at, job_id) in enumerate(finished):
+        if k < n_over or now - finished_at > JOB_TTL_SECONDS:
+            jobs.pop(job_id, None)
+
+async def save_upload(upload: UploadFile, path: str) -> None:
+    """
+    stream an upload to disk in fixed-size chunks
+    file writes run on a worker thread so the event loop never blocks
+    """
+    handle = await asyncio.to_thread(open, path, "wb")
+    try:
+        while chunk := await upload.read(UPLOAD_CHUNK_BYTES):
+            await asyncio.to_thread(handle.write, chunk)
+    finally:
+        await asyncio.to_thread(handle.close)
+
+async def track_job(job_id: str) -> None:
+    job = jobs[job_id]
+    try:
+        job["result"] = await asyncio.wrap_future(job["_future"])
+        job["status"] = "done"
+    except Exception as e:
+        job["status"] = "failed"
+        job["error"] = f"{type(e).__name__}: {e}"
+    job["finished_at"] = time.time()
+
+@app.post("/api/run", status_code=202)
 async def run_engine(
     mode: str = Form(...),
     models: str = Form(...),
     files: List[UploadFile] = File(...)
 ):
-    job_id = str(uuid.uuid4())[:8]
-    save_dir = f"runs/{job_id}"
-    os.makedirs(save_dir, exist_ok=True)
-
-    saved_files = []
-    for f in files:
-        path = os.path.join(save_dir, f.filename)
-        with open(path, "wb") as buffer:
-            shutil.copyfileobj(f.file, buffer)
-        saved_files.append(path)
+    evict_finished_jobs(time.time())
+    try:
+        model_names = resolve_models(mode, models)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if count_active_jobs() >= MAX_RUNNING_JOBS + MAX_PENDING_JOBS:
+        raise HTTPException(status_code=429, detail="Too many jobs in flight, retry later")
 
-    return {
+    job_id = str(uuid.uuid4())[:8]
+    save_dir = os.path.join(RUNS_DIR, job_id)
+    # reserve the slot before the first await, so concurrent uploads count against the limit
+    jobs[job_id] = {
         "job_id": job_id,
+        "status": "uploading",
         "saved_to": save_dir,
-        "models": models,
-        "files": saved_files
+        "models": model_names,
+        "files": [],
+        "created_at": time.time(),
+        "_future": None,
     }
+    try:
+        os.makedirs(save_dir, exist_ok=True)
+        for f in files:
+            path = os.path.join(save_dir, os.path.basename(f.filename))
+            await save_upload(f, path)
+            jobs[job_id]["files"].append(path)
+
+        # the ML work runs in the process pool; the event loop only awaits its future
+        model_modules = [get_model_spec(n).module for n in model_names]
+        jobs[job_id]["_future"] = get_job_pool().submit(
+            run_job, save_dir, jobs[job_id]["files"], model_modules, get_job_threads())
+    except BaseException:
+        jobs.pop(job_id, None)
+        raise
+    jobs[job_id]["status"] = "queued"
+    jobs[job_id]["_task"] = asyncio.create_task(track_job(job_id))
+    return public_view(jobs[job_id])
+
+def public_view(job: Dict[str, Any]) -> Dict[str, Any]:
+    view = {k: v for k, v in job.items() if k != "result" and not k.startswith("_")}
+    if view["status"] == "queued" and job["_future"].running():
+        view["status"] = "running"
+    return view
+
+def get_job(job_id: str) -> Dict[str, Any]:
+    if job_id not in jobs:
+        raise HTTPException(status_code=404, detail=f"Unknown job {job_id}")
+    return jobs[job_id]
+
+@app.get("/api/jobs/{job_id}")
+async def job_status(job_id: str):
+    return public_view(get_job(job_id))
+
+@app.get("/api/jobs/{job_id}/result")
+async def job_result(job_id: str):
+    job = get_job(job_id)
+    if job["status"] == "failed":
+        raise HTTPException(status_code=500, detail=job["error"])
+    if job["status"] != "done":
+        raise HTTPException(status_code=409, detail=f"Job {job_id} is {public_view(job)['status']}")
+    return {"job_id": job_id, **job["result"]}
@@ -1,16 +1,108 @@
+#include <algorithm>
+#include <stdexcept>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 #include "cleaning.h"
+#include "../common/parallel.h"
 
 namespace py = pybind11;
 
+// c-contiguous float64 buffer; noconvert() on the argument keeps
+// lists on the std::vector overloads and numpy arrays on these
+using DoubleArray = py::array_t<double, py::array::c_style | py::array::forcecast>;
+
+// views a 1-D array as one column, a 2-D array as (rows x columns)
+static void matrix_shape(const DoubleArray& matrix, std::size_t& n_rows, std::size_t& n_cols) {
+    if (matrix.ndim() == 1) {
+        n_rows = static_cast<std::size_t>(matrix.shape(0));
+        n_cols = 1;
+    } else if (matrix.ndim() == 2) {
+        n_rows = static_cast<std::size_t>(matrix.shape(0));
+        n_cols = static_cast<std::size_t>(matrix.shape(1));
+    } else {
+        throw std::invalid_argument("expected a 1-D column or a 2-D (rows x features) matrix");
+    }
+}
+
+static py::array_t<long long> counts_to_numpy(const std::vector<std::size_t>& counts) {
+    py::array_t<long long> out(static_cast<py::ssize_t>(counts.size()));
+    std::copy(counts.begin(), counts.end(), out.mutable_data());
+    return out;
+}
+
 /*
 creates python bindings for the c++ engine
 exposes cleaning module functions
 handles type conversion between std::vector and python list
+numpy overloads read the array buffer directly (no list copies)
 */
 PYBIND11_MODULE(biobeat_cleaning, m) {
     m.doc() = "c++ cleaning engine for biobeat pipeline";
-    m.def("remove_invalids", &remove_invalids, "removes infinite and nan values from a list");
+    m.attr("has_openmp") = has_openmp();
+
+    m.def("remove_invalids", [](const DoubleArray& column, int num_threads) {
+        std::size_t n = static_cast<std::size_t>(column.size());
+        std::vector<double> buffer(n);
+        const double* data = column.data();
+        std::size_t kept;
+        {
+            py::gil_scoped_release release;
+            kept = remove_invalids(data, n, buffer.data(), num_threads);
+        }
+        DoubleArray clean(static_cast<py::ssize_t>(kept));
+        std::copy(buffer.begin(), buffer.begin() + kept, clean.mutable_data());
+        return clean;
+    }, py::arg("column").noconvert(), py::arg("num_threads") = 1,
+       "removes infinite and nan values from a float64 numpy array");
+    m.def("remove_invalids", [](const std::vector<double>& column, int num_threads) {
+        return remove_invalids(column, num_threads);
+    }, py::arg("column"), py::arg("num_threads") = 1, "removes infinite and nan values from a list");
+
+    m.def("calculate_median", [](const DoubleArray& column) {
+        // nth_element reorders, so work on a scratch copy of the buffer
+        std::vector<double> scratch(column.data(), column.data() + column.size());
+        py::gil_scoped_release release;
+        return calculate_median_inplace(scratch.data(), scratch.size());
+    }, py::arg("column").noconvert(), "calculates the median of a float64 numpy array");
     m.def("calculate_median", &calculate_median, "calculates the median of a list");
+
+    m.def("calculate_median_inplace", [](DoubleArray column) {
+        double* data = column.mutable_data();
+        std::size_t n = static_cast<std::size_t>(column.size());
+        py::gil_scoped_release release;
+        return calculate_median_inplace(data, n);
+    }, py::arg("column").noconvert(), "calculates the median of a writable float64 numpy array, reordering it");
+
+    m.def("fill_invalids", [](DoubleArray matrix, const DoubleArray& fill_values, int num_threads) {
+        std::size_t n_rows, n_cols;
+        matrix_shape(matrix, n_rows, n_cols);
+        if (static_cast<std::size_t>(fill_values.size()) != n_cols) {
+            throw std::invalid_argument("fill_values needs one value per column");
+        }
+        double* data = matrix.mutable_data();
+        const double* fill = fill_values.data();
+        std::vector<std::size_t> counts(n_cols, 0);
+        {
+            py::gil_scoped_release release;
+            fill_invalids(data, n_rows, n_cols, fill, counts.data(), num_threads);
+        }
+        return counts_to_numpy(counts);
+    }, py::arg("matrix").noconvert(), py::arg("fill_values"), py::arg("num_threads") = 1,
+       "replaces nan/inf in place with a per-column fill value, returns per-column counts");
+
+    m.def("impute_median", [](DoubleArray matrix, int num_threads) {
+        std::size_t n_rows, n_cols;
+        matrix_shape(matrix, n_rows, n_cols);
+        double* data = matrix.mutable_data();
+        DoubleArray medians(static_cast<py::ssize_t>(n_cols));
+        double* median_data = medians.mutable_data();
+        std::vector<std::size_t> counts(n_cols, 0);
+        {
+            py::gil_scoped_release release;
+            impute_median(data, n_rows, n_cols, median_data, counts.data(), num_threads);
+        }
+        return py::make_tuple(counts_to_numpy(counts), medians);
+    }, py::arg("matrix").noconvert(), py::arg("num_threads") = 1,
+       "replaces nan/inf in place with the column median, returns (per-column counts, medians)");
 }
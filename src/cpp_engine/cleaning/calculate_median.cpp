@@ -3,24 +3,34 @@
 #include "cleaning.h"
 
 /*
-given a vector of doubles
+given a pointer to n contiguous doubles
 return a double representing the median
-sorts vector to find middle value
+partially reorders the buffer in place to find the middle value
 returns 0.0 if empty
 */
-double calculate_median(std::vector<double> column) {
-    if (column.empty()) {
+double calculate_median_inplace(double* data, std::size_t n) {
+    if (n == 0) {
         return 0.0;
     }
     
-    size_t n = column.size() / 2;
+    std::size_t mid = n / 2;
     // nth_element is highly optimized and memory efficient
-    std::nth_element(column.begin(), column.begin() + n, column.end());
+    std::nth_element(data, data + mid, data + n);
     
-    if (column.size() % 2 == 0) {
-        auto max_it = std::max_element(column.begin(), column.begin() + n);
-        return (*max_it + column[n]) / 2.0;
+    if (n % 2 == 0) {
+        double* max_it = std::max_element(data, data + mid);
+        return (*max_it + data[mid]) / 2.0;
     }
     
-    return column[n];
+    return data[mid];
+}
+
+/*
+given a vector of doubles
+return a double representing the median
+works on its own copy so the caller's data is untouched
+returns 0.0 if empty
+*/
+double calculate_median(std::vector<double> column) {
+    return calculate_median_inplace(column.data(), column.size());
 }
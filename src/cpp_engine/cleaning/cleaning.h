@@ -1,9 +1,17 @@
 #ifndef CLEANING_H
 #define CLEANING_H
 
+#include <cstddef>
 #include <vector>
 
-std::vector<double> remove_invalids(const std::vector<double>& column);
+// num_threads: 1 runs serially, 0 or less uses every core (needs openmp)
+std::size_t remove_invalids(const double* data, std::size_t n, double* out, int num_threads = 1);
+std::vector<double> remove_invalids(const std::vector<double>& column, int num_threads = 1);
+double calculate_median_inplace(double* data, std::size_t n);
 double calculate_median(std::vector<double> column);
+void fill_invalids(double* data, std::size_t n_rows, std::size_t n_cols, const double* fill_values,
+                   std::size_t* counts, int num_threads = 1);
+void impute_median(double* data, std::size_t n_rows, std::size_t n_cols, double* medians,
+                   std::size_t* counts, int num_threads = 1);
 
 #endif
@@ -0,0 +1,89 @@
+#include <vector>
+#include <cmath>
+#include <algorithm>
+#include "cleaning.h"
+#include "../common/parallel.h"
+
+static inline bool is_invalid(double val) {
+    return std::isnan(val) || std::isinf(val);
+}
+
+/*
+given a row-major (n_rows x n_cols) matrix, one fill value per column, and a thread count
+overwrite every nan/inf cell in place with its column's fill value
+rows are never dropped, so columns stay aligned
+writes the per-column replacement count into counts
+*/
+void fill_invalids(double* data, std::size_t n_rows, std::size_t n_cols, const double* fill_values,
+                   std::size_t* counts, int num_threads) {
+    const long n_blocks = static_cast<long>(count_chunks(n_cols, COLUMN_BLOCK));
+    const int threads = resolve_threads(num_threads);
+
+    for (std::size_t j = 0; j < n_cols; ++j) counts[j] = 0;
+
+    if (n_cols == 1) {
+        // single column: split the rows instead of the columns
+        const long n_chunks = static_cast<long>(count_chunks(n_rows, REDUCTION_CHUNK));
+        std::vector<std::size_t> partial(n_chunks, 0);
+
+        #pragma omp parallel for num_threads(threads) schedule(static) if(threads > 1)
+        for (long c = 0; c < n_chunks; ++c) {
+            std::size_t begin = static_cast<std::size_t>(c) * REDUCTION_CHUNK;
+            std::size_t end = std::min(n_rows, begin + REDUCTION_CHUNK);
+            for (std::size_t i = begin; i < end; ++i) {
+                if (is_invalid(data[i])) {
+                    data[i] = fill_values[0];
+                    ++partial[c];
+                }
+            }
+        }
+
+        for (long c = 0; c < n_chunks; ++c) counts[0] += partial[c];
+        return;
+    }
+
+    #pragma omp parallel for num_threads(threads) schedule(dynamic) if(threads > 1)
+    for (long b = 0; b < n_blocks; ++b) {
+        std::size_t col_begin = static_cast<std::size_t>(b) * COLUMN_BLOCK;
+        std::size_t col_end = std::min(n_cols, col_begin + COLUMN_BLOCK);
+        for (std::size_t i = 0; i < n_rows; ++i) {
+            double* row = data + i * n_cols;
+            for (std::size_t j = col_begin; j < col_end; ++j) {
+                if (is_invalid(row[j])) {
+                    row[j] = fill_values[j];
+                    ++counts[j];
+                }
+            }
+        }
+    }
+}
+
+/*
+given a row-major (n_rows x n_cols) matrix and a thread count
+compute each column's median over its finite values (0.0 if none)
+then overwrite every nan/inf cell in place with that median
+writes the medians and per-column imputation counts into the output buffers
+*/
+void impute_median(double* data, std::size_t n_rows, std::size_t n_cols, double* medians,
+                   std::size_t* counts, int num_threads) {
+    const long cols = static_cast<long>(n_cols);
+    const int threads = resolve_threads(num_threads);
+
+    #pragma omp parallel num_threads(threads) if(threads > 1)
+    {
+        std::vector<double> scratch;
+        scratch.reserve(n_rows);
+
+        #pragma omp for schedule(dynamic)
+        for (long j = 0; j < cols; ++j) {
+            scratch.clear();
+            for (std::size_t i = 0; i < n_rows; ++i) {
+                double val = data[i * n_cols + j];
+                if (!is_invalid(val)) scratch.push_back(val);
+            }
+            medians[j] = calculate_median_inplace(scratch.data(), scratch.size());
+        }
+    }
+
+    fill_invalids(data, n_rows, n_cols, medians, counts, num_threads);
+}
@@ -1,6 +1,62 @@
 #include <vector>
 #include <cmath>
+#include <algorithm>
 #include "cleaning.h"
+#include "../common/parallel.h"
+
+static inline bool is_valid(double val) {
+    return !std::isinf(val) && !std::isnan(val);
+}
+
+/*
+given a pointer to n contiguous doubles, an output buffer of at least n,
+and a thread count
+copies every finite value into out, preserving order
+counts survivors per row chunk, then each chunk writes at its prefix offset
+return the number of values written
+*/
+std::size_t remove_invalids(const double* data, std::size_t n, double* out, int num_threads) {
+    const int threads = resolve_threads(num_threads);
+    if (threads <= 1) {
+        std::size_t kept = 0;
+        for (std::size_t i = 0; i < n; ++i) {
+            if (is_valid(data[i])) {
+                out[kept++] = data[i];
+            }
+        }
+        return kept;
+    }
+
+    const long n_chunks = static_cast<long>(count_chunks(n, REDUCTION_CHUNK));
+    std::vector<std::size_t> offsets(n_chunks + 1, 0);
+
+    #pragma omp parallel for num_threads(threads) schedule(static)
+    for (long c = 0; c < n_chunks; ++c) {
+        std::size_t begin = static_cast<std::size_t>(c) * REDUCTION_CHUNK;
+        std::size_t end = std::min(n, begin + REDUCTION_CHUNK);
+        std::size_t kept = 0;
+        for (std::size_t i = begin; i < end; ++i) {
+            if (is_valid(data[i])) ++kept;
+        }
+        offsets[c + 1] = kept;
+    }
+
+    for (long c = 0; c < n_chunks; ++c) {
+        offsets[c + 1] += offsets[c];
+    }
+
+    #pragma omp parallel for num_threads(threads) schedule(static)
+    for (long c = 0; c < n_chunks; ++c) {
+        std::size_t begin = static_cast<std::size_t>(c) * REDUCTION_CHUNK;
+        std::size_t end = std::min(n, begin + REDUCTION_CHUNK);
+        std::size_t pos = offsets[c];
+        for (std::size_t i = begin; i < end; ++i) {
+            if (is_valid(data[i])) out[pos++] = data[i];
+        }
+    }
+
+    return offsets[n_chunks];
+}
 
 /*
 given a vector of doubles
@@ -8,16 +64,9 @@ return a new vector of doubles
 infinite values removed
 nan values removed
 */
-std::vector<double> remove_invalids(const std::vector<double>& column) {
-    std::vector<double> clean_column;
+std::vector<double> remove_invalids(const std::vector<double>& column, int num_threads) {
     // Pre-allocate memory to prevent expensive resizing during the loop
-    clean_column.reserve(column.size());
-    
-    for (double val : column) {
-        if (!std::isinf(val) && !std::isnan(val)) {
-            clean_column.push_back(val);
-        }
-    }
-    
+    std::vector<double> clean_column(column.size());
+    clean_column.resize(remove_invalids(column.data(), column.size(), clean_column.data(), num_threads));
     return clean_column;
 }
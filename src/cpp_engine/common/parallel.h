@@ -0,0 +1,45 @@
+#ifndef PARALLEL_H
+#define PARALLEL_H
+
+#include <cstddef>
+#include <thread>
+
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
+// reductions always sum fixed-size chunks, then combine the chunk partials
+// serially in chunk order, so results never depend on the thread count
+const std::size_t REDUCTION_CHUNK = 1 << 15;
+
+// column block width for matrix kernels (one thread owns a whole block)
+const std::size_t COLUMN_BLOCK = 16;
+
+/*
+given the requested thread count (0 or less means all cores)
+return the number of threads a kernel should use
+always 1 when the engine was built without openmp
+*/
+inline int resolve_threads(int num_threads) {
+#ifdef _OPENMP
+    if (num_threads <= 0) return omp_get_max_threads();
+    return num_threads;
+#else
+    (void)num_threads;
+    return 1;
+#endif
+}
+
+inline bool has_openmp() {
+#ifdef _OPENMP
+    return true;
+#else
+    return false;
+#endif
+}
+
+inline std::size_t count_chunks(std::size_t n, std::size_t chunk) {
+    return (n + chunk - 1) / chunk;
+}
+
+#endif
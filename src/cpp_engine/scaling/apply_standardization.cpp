@@ -1,18 +1,32 @@
 #include <vector>
 #include "scaling.h"
+#include "../common/parallel.h"
+
+/*
+given input and output buffers of n doubles, the mean, the standard deviation,
+and a thread count
+writes the standardized values into out, split across row chunks
+out may alias data for in-place scaling
+*/
+void apply_standardization(const double* data, double* out, std::size_t n, double mean, double std_dev,
+                           int num_threads) {
+    const long count = static_cast<long>(n);
+    const int threads = resolve_threads(num_threads);
+
+    #pragma omp parallel for num_threads(threads) schedule(static) if(threads > 1)
+    for (long i = 0; i < count; ++i) {
+        out[i] = (data[i] - mean) / std_dev;
+    }
+}
 
 /*
 given a vector of doubles, the mean, and the standard deviation
 return a new vector of standardized doubles
 applies z-score formula to each element
 */
-std::vector<double> apply_standardization(const std::vector<double>& column, double mean, double std_dev) {
-    std::vector<double> scaled_column;
-    scaled_column.reserve(column.size());
-    
-    for (double val : column) {
-        scaled_column.push_back((val - mean) / std_dev);
-    }
-    
+std::vector<double> apply_standardization(const std::vector<double>& column, double mean, double std_dev,
+                                          int num_threads) {
+    std::vector<double> scaled_column(column.size());
+    apply_standardization(column.data(), scaled_column.data(), column.size(), mean, std_dev, num_threads);
     return scaled_column;
 }
@@ -1,16 +1,104 @@
+#include <algorithm>
+#include <stdexcept>
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 #include "scaling.h"
+#include "../common/parallel.h"
 
 namespace py = pybind11;
 
+// c-contiguous float64 buffer; noconvert() on the argument keeps
+// lists on the std::vector overloads and numpy arrays on these
+using DoubleArray = py::array_t<double, py::array::c_style | py::array::forcecast>;
+
+template <typename T>
+static py::array_t<T> to_numpy(const std::vector<T>& values) {
+    py::array_t<T> out(static_cast<py::ssize_t>(values.size()));
+    std::copy(values.begin(), values.end(), out.mutable_data());
+    return out;
+}
+
 /*
 creates python bindings for the c++ scaling engine
 exposes mean, std, and standardization functions
+numpy overloads read the array buffer directly (no list copies)
+every kernel takes num_threads (1 = serial, 0 = all cores)
 */
 PYBIND11_MODULE(biobeat_scaling, m) {
     m.doc() = "c++ scaling engine for biobeat pipeline";
-    m.def("calculate_mean", &calculate_mean, "calculates mean of a list");
-    m.def("calculate_std", &calculate_std, "calculates standard deviation of a list");
-    m.def("apply_standardization", &apply_standardization, "applies standard scaling to a list");
+    m.attr("has_openmp") = has_openmp();
+
+    m.def("calculate_mean", [](const DoubleArray& column, int num_threads) {
+        const double* data = column.data();
+        std::size_t n = static_cast<std::size_t>(column.size());
+        py::gil_scoped_release release;
+        return calculate_mean(data, n, num_threads);
+    }, py::arg("column").noconvert(), py::arg("num_threads") = 1, "calculates mean of a float64 numpy array");
+    m.def("calculate_mean", [](const std::vector<double>& column, int num_threads) {
+        return calculate_mean(column, num_threads);
+    }, py::arg("column"), py::arg("num_threads") = 1, "calculates mean of a list");
+
+    m.def("calculate_std", [](const DoubleArray& column, double mean, int num_threads) {
+        const double* data = column.data();
+        std::size_t n = static_cast<std::size_t>(column.size());
+        py::gil_scoped_release release;
+        return calculate_std(data, n, mean, num_threads);
+    }, py::arg("column").noconvert(), py::arg("mean"), py::arg("num_threads") = 1,
+       "calculates standard deviation of a float64 numpy array");
+    m.def("calculate_std", [](const std::vector<double>& column, double mean, int num_threads) {
+        return calculate_std(column, mean, num_threads);
+    }, py::arg("column"), py::arg("mean"), py::arg("num_threads") = 1, "calculates standard deviation of a list");
+
+    m.def("apply_standardization", [](const DoubleArray& column, double mean, double std_dev, int num_threads) {
+        DoubleArray scaled(std::vector<py::ssize_t>(column.shape(), column.shape() + column.ndim()));
+        const double* data = column.data();
+        double* out = scaled.mutable_data();
+        std::size_t n = static_cast<std::size_t>(column.size());
+        {
+            py::gil_scoped_release release;
+            apply_standardization(data, out, n, mean, std_dev, num_threads);
+        }
+        return scaled;
+    }, py::arg("column").noconvert(), py::arg("mean"), py::arg("std_dev"), py::arg("num_threads") = 1,
+       "applies standard scaling to a float64 numpy array, returns a new array");
+    m.def("apply_standardization", [](const std::vector<double>& column, double mean, double std_dev, int num_threads) {
+        return apply_standardization(column, mean, std_dev, num_threads);
+    }, py::arg("column"), py::arg("mean"), py::arg("std_dev"), py::arg("num_threads") = 1,
+       "applies standard scaling to a list");
+
+    m.def("apply_standardization_inplace", [](DoubleArray column, double mean, double std_dev, int num_threads) {
+        double* data = column.mutable_data();
+        std::size_t n = static_cast<std::size_t>(column.size());
+        py::gil_scoped_release release;
+        apply_standardization(data, data, n, mean, std_dev, num_threads);
+    }, py::arg("column").noconvert(), py::arg("mean"), py::arg("std_dev"), py::arg("num_threads") = 1,
+       "applies standard scaling in place to a writable float64 numpy array");
+
+    m.def("calculate_column_stats", [](const DoubleArray& matrix, bool with_median, int num_threads) {
+        if (matrix.ndim() != 2) {
+            throw std::invalid_argument("calculate_column_stats expects a 2-D (rows x features) matrix");
+        }
+        const double* data = matrix.data();
+        std::size_t n_rows = static_cast<std::size_t>(matrix.shape(0));
+        std::size_t n_cols = static_cast<std::size_t>(matrix.shape(1));
+        ColumnStats stats;
+        {
+            py::gil_scoped_release release;
+            calculate_column_stats(data, n_rows, n_cols, with_median, stats, num_threads);
+        }
+
+        py::dict result;
+        result["count"] = to_numpy(std::vector<long long>(stats.count.begin(), stats.count.end()));
+        result["invalid_count"] = to_numpy(std::vector<long long>(stats.invalid_count.begin(), stats.invalid_count.end()));
+        result["mean"] = to_numpy(stats.mean);
+        result["variance"] = to_numpy(stats.variance);
+        result["min"] = to_numpy(stats.min);
+        result["max"] = to_numpy(stats.max);
+        if (with_median) {
+            result["median"] = to_numpy(stats.median);
+        }
+        return result;
+    }, py::arg("matrix"), py::arg("with_median") = false, py::arg("num_threads") = 1,
+       "single-sweep per-column count, invalid count, mean, variance, min, max (and median) of a 2-D float64 matrix");
 }
@@ -0,0 +1,92 @@
+#include <vector>
+#include <cmath>
+#include <limits>
+#include <algorithm>
+#include "scaling.h"
+#include "../cleaning/cleaning.h"
+#include "../common/parallel.h"
+
+/*
+given a row-major (n_rows x n_cols) matrix of doubles and a thread count
+fill stats with per-column count, nan/inf count, mean, sample variance, min and max
+columns are split into fixed blocks; each block is one sweep over the rows
+using welford updates (numerically stable), so a column's result is the
+same whichever thread owns it
+non-finite values are counted as invalid and skipped
+optional median per column via nth_element on a per-thread scratch buffer
+*/
+void calculate_column_stats(const double* data, std::size_t n_rows, std::size_t n_cols,
+                            bool with_median, ColumnStats& stats, int num_threads) {
+    const double nan = std::numeric_limits<double>::quiet_NaN();
+    stats.count.assign(n_cols, 0);
+    stats.invalid_count.assign(n_cols, 0);
+    stats.mean.assign(n_cols, 0.0);
+    stats.variance.assign(n_cols, 0.0);
+    stats.min.assign(n_cols, nan);
+    stats.max.assign(n_cols, nan);
+    stats.median.clear();
+
+    // m2 holds the running sum of squared deviations per column
+    std::vector<double> m2(n_cols, 0.0);
+    const long n_blocks = static_cast<long>(count_chunks(n_cols, COLUMN_BLOCK));
+    const int threads = resolve_threads(num_threads);
+
+    #pragma omp parallel for num_threads(threads) schedule(dynamic) if(threads > 1)
+    for (long b = 0; b < n_blocks; ++b) {
+        std::size_t col_begin = static_cast<std::size_t>(b) * COLUMN_BLOCK;
+        std::size_t col_end = std::min(n_cols, col_begin + COLUMN_BLOCK);
+
+        for (std::size_t i = 0; i < n_rows; ++i) {
+            const double* row = data + i * n_cols;
+            for (std::size_t j = col_begin; j < col_end; ++j) {
+                double val = row[j];
+                if (std::isnan(val) || std::isinf(val)) {
+                    ++stats.invalid_count[j];
+                    continue;
+                }
+
+                std::size_t count = ++stats.count[j];
+                double delta = val - stats.mean[j];
+                stats.mean[j] += delta / count;
+                m2[j] += delta * (val - stats.mean[j]);
+
+                if (count == 1) {
+                    stats.min[j] = val;
+                    stats.max[j] = val;
+                } else {
+                    if (val < stats.min[j]) stats.min[j] = val;
+                    if (val > stats.max[j]) stats.max[j] = val;
+                }
+            }
+        }
+
+        for (std::size_t j = col_begin; j < col_end; ++j) {
+            if (stats.count[j] > 1) {
+                stats.variance[j] = m2[j] / (stats.count[j] - 1);
+            }
+        }
+    }
+
+    if (!with_median) return;
+
+    stats.median.assign(n_cols, 0.0);
+    const long cols = static_cast<long>(n_cols);
+
+    #pragma omp parallel num_threads(threads) if(threads > 1)
+    {
+        std::vector<double> scratch;
+        scratch.reserve(n_rows);
+
+        #pragma omp for schedule(dynamic)
+        for (long j = 0; j < cols; ++j) {
+            scratch.clear();
+            for (std::size_t i = 0; i < n_rows; ++i) {
+                double val = data[i * n_cols + j];
+                if (!std::isnan(val) && !std::isinf(val)) {
+                    scratch.push_back(val);
+                }
+            }
+            stats.median[j] = calculate_median_inplace(scratch.data(), scratch.size());
+        }
+    }
+}
@@ -1,15 +1,38 @@
 #include <vector>
 #include <numeric>
+#include <algorithm>
 #include "scaling.h"
+#include "../common/parallel.h"
+
+/*
+given a pointer to n contiguous doubles and a thread count
+return a double representing the mathematical mean
+sums fixed-size chunks in parallel, then adds the partials in order
+returns 0.0 if the buffer is empty
+*/
+double calculate_mean(const double* data, std::size_t n, int num_threads) {
+    if (n == 0) return 0.0;
+
+    const long n_chunks = static_cast<long>(count_chunks(n, REDUCTION_CHUNK));
+    std::vector<double> partial(n_chunks, 0.0);
+    const int threads = resolve_threads(num_threads);
+
+    #pragma omp parallel for num_threads(threads) schedule(static) if(threads > 1)
+    for (long c = 0; c < n_chunks; ++c) {
+        std::size_t begin = static_cast<std::size_t>(c) * REDUCTION_CHUNK;
+        std::size_t end = std::min(n, begin + REDUCTION_CHUNK);
+        partial[c] = std::accumulate(data + begin, data + end, 0.0);
+    }
+
+    double sum = std::accumulate(partial.begin(), partial.end(), 0.0);
+    return sum / n;
+}
 
 /*
 given a vector of doubles
 return a double representing the mathematical mean
 returns 0.0 if vector is empty
 */
-double calculate_mean(const std::vector<double>& column) {
-    if (column.empty()) return 0.0;
-    
-    double sum = std::accumulate(column.begin(), column.end(), 0.0);
-    return sum / column.size();
+double calculate_mean(const std::vector<double>& column, int num_threads) {
+    return calculate_mean(column.data(), column.size(), num_threads);
 }
@@ -1,23 +1,47 @@
 #include <vector>
 #include <cmath>
+#include <numeric>
+#include <algorithm>
 #include "scaling.h"
+#include "../common/parallel.h"
 
 /*
-given a vector of doubles and its mean
+given a pointer to n contiguous doubles, their mean, and a thread count
 return a double representing the sample standard deviation
-returns 1.0 for zero variance or empty vectors to prevent division by zero
+squared deviations are summed per fixed chunk, then combined in order
+returns 1.0 for zero variance or empty buffers to prevent division by zero
 */
-double calculate_std(const std::vector<double>& column, double mean) {
-    if (column.size() <= 1) return 1.0;
-    
-    double variance_sum = 0.0;
-    for (double val : column) {
-        variance_sum += (val - mean) * (val - mean);
+double calculate_std(const double* data, std::size_t n, double mean, int num_threads) {
+    if (n <= 1) return 1.0;
+
+    const long n_chunks = static_cast<long>(count_chunks(n, REDUCTION_CHUNK));
+    std::vector<double> partial(n_chunks, 0.0);
+    const int threads = resolve_threads(num_threads);
+
+    #pragma omp parallel for num_threads(threads) schedule(static) if(threads > 1)
+    for (long c = 0; c < n_chunks; ++c) {
+        std::size_t begin = static_cast<std::size_t>(c) * REDUCTION_CHUNK;
+        std::size_t end = std::min(n, begin + REDUCTION_CHUNK);
+        double chunk_sum = 0.0;
+        for (std::size_t i = begin; i < end; ++i) {
+            chunk_sum += (data[i] - mean) * (data[i] - mean);
+        }
+        partial[c] = chunk_sum;
     }
-    
-    double std_dev = std::sqrt(variance_sum / (column.size() - 1));
+
+    double variance_sum = std::accumulate(partial.begin(), partial.end(), 0.0);
+    double std_dev = std::sqrt(variance_sum / (n - 1));
     
     // safe fallback for zero variance
     if (std_dev == 0.0) return 1.0;
     return std_dev;
 }
+
+/*
+given a vector of doubles and its mean
+return a double representing the sample standard deviation
+returns 1.0 for zero variance or empty vectors to prevent division by zero
+*/
+double calculate_std(const std::vector<double>& column, double mean, int num_threads) {
+    return calculate_std(column.data(), column.size(), mean, num_threads);
+}
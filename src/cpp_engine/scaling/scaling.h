@@ -1,10 +1,31 @@
 #ifndef SCALING_H
 #define SCALING_H
 
+#include <cstddef>
 #include <vector>
 
-double calculate_mean(const std::vector<double>& column);
-double calculate_std(const std::vector<double>& column, double mean);
-std::vector<double> apply_standardization(const std::vector<double>& column, double mean, double std_dev);
+// num_threads: 1 runs serially, 0 or less uses every core (needs openmp)
+double calculate_mean(const double* data, std::size_t n, int num_threads = 1);
+double calculate_mean(const std::vector<double>& column, int num_threads = 1);
+double calculate_std(const double* data, std::size_t n, double mean, int num_threads = 1);
+double calculate_std(const std::vector<double>& column, double mean, int num_threads = 1);
+void apply_standardization(const double* data, double* out, std::size_t n, double mean, double std_dev,
+                           int num_threads = 1);
+std::vector<double> apply_standardization(const std::vector<double>& column, double mean, double std_dev,
+                                          int num_threads = 1);
+
+// per-column summary of a row-major matrix; median is empty unless requested
+struct ColumnStats {
+    std::vector<std::size_t> count;
+    std::vector<std::size_t> invalid_count;
+    std::vector<double> mean;
+    std::vector<double> variance;
+    std::vector<double> min;
+    std::vector<double> max;
+    std::vector<double> median;
+};
+
+void calculate_column_stats(const double* data, std::size_t n_rows, std::size_t n_cols,
+                            bool with_median, ColumnStats& stats, int num_threads = 1);
 
 #endif
@@ -1,20 +1,52 @@
+import os
+import tempfile
 from setuptools import setup, Extension
+from setuptools.command.build_ext import build_ext
 import pybind11
 
+BASE_COMPILE_ARGS = ["-std=c++11", "-O3"]
+
+class OpenMPBuildExt(build_ext):
+    """
+    adds -fopenmp when the compiler accepts it
+    falls back to the serial build otherwise (e.g. stock apple clang)
+    set BIOBEAT_NO_OPENMP=1 to force the serial build
+    """
+    def build_extensions(self):
+        if not os.environ.get("BIOBEAT_NO_OPENMP") and self._supports_openmp():
+            for ext in self.extensions:
+                ext.extra_compile_args.append("-fopenmp")
+                ext.extra_link_args.append("-fopenmp")
+        build_ext.build_extensions(self)
+
+    def _supports_openmp(self) -> bool:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            src = os.path.join(tmp_dir, "check_openmp.cpp")
+            with open(src, "w") as f:
+                f.write("#include <omp.h>\nint main() { return omp_get_max_threads() > 0 ? 0 : 1; }\n")
+            try:
+                objects = self.compiler.compile([src], output_dir=tmp_dir, extra_postargs=["-fopenmp"])
+                self.compiler.link_executable(objects, "check_openmp", output_dir=tmp_dir, extra_postargs=["-fopenmp"])
+            except Exception:
+                return False
+        return True
+
 ext_modules = [
     Extension(
         "biobeat_cleaning",
-        ["cleaning/remove_invalids.cpp", "cleaning/calculate_median.cpp", "cleaning/bindings.cpp"],
+        ["cleaning/remove_invalids.cpp", "cleaning/calculate_median.cpp", "cleaning/impute_invalids.cpp",
+         "cleaning/bindings.cpp"],
         include_dirs=[pybind11.get_include()],
         language="c++",
-        extra_compile_args=["-std=c++11", "-O3"]
+        extra_compile_args=list(BASE_COMPILE_ARGS)
     ),
     Extension(
         "biobeat_scaling",
-        ["scaling/calculate_mean.cpp", "scaling/calculate_std.cpp", "scaling/apply_standardization.cpp", "scaling/bindings.cpp"],
+        ["scaling/calculate_mean.cpp", "scaling/calculate_std.cpp", "scaling/apply_standardization.cpp",
+         "scaling/calculate_column_stats.cpp", "cleaning/calculate_median.cpp", "scaling/bindings.cpp"],
         include_dirs=[pybind11.get_include()],
         language="c++",
-        extra_compile_args=["-std=c++11", "-O3"]
+        extra_compile_args=list(BASE_COMPILE_ARGS)
     ),
 ]
 
@@ -22,4 +54,5 @@ setup(
     name="biobeat_cpp_engine",
     version="1.0",
     ext_modules=ext_modules,
+    cmdclass={"build_ext": OpenMPBuildExt},
 )
@@ -0,0 +1,294 @@
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.append(SCRIPTS_DIR)
+
+from pipeline_api import ensure_extensions_built
+from benchmarks.synthetic_data import generate_biosignal_frame, get_column_names, write_synthetic_csv
+
+SUITES = ("kernels", "pipeline", "cv", "blend")
+DEFAULT_SIZES = [(10_000, 10), (100_000, 50)]
+# the list overloads copy every element into a std::vector; past this they only measure the copy
+LIST_MAX_ROWS = 1_000_000
+# a case regresses when its best time grows by more than this fraction
+REGRESSION_TOLERANCE = 0.2
+
+# the pipeline modules import the compiled extensions (and model frameworks)
+# at import time, so each suite imports what it needs after ensure_extensions_built()
+
+def time_call(fn: Callable[[], Any], repeats: int = 3, setup: Optional[Callable[[], Any]] = None) -> Dict[str, float]:
+    """
+    given a callable (and an optional untimed setup whose result is passed to it)
+    run it repeats times
+    return {"min_s", "median_s", "repeats"} wall-clock seconds
+    """
+    times = []
+    for _ in range(repeats):
+        args = () if setup is None else (setup(),)
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return {"min_s": min(times), "median_s": float(np.median(times)), "repeats": repeats}
+
+def _record(suite: str, case: str, impl: str, n_rows: int, n_columns: int, timing: Dict[str, Any], **params: Any) -> Dict[str, Any]:
+    return {"suite": suite, "case": case, "impl": impl, "n_rows": n_rows, "n_columns": n_columns,
+            "params": params, **timing}
+
+def _column_stats_numpy(matrix: np.ndarray) -> Dict[str, np.ndarray]:
+    # what calculate_column_stats(matrix, True) computes, in plain numpy
+    masked = np.where(np.isfinite(matrix), matrix, np.nan)
+    return {
+        "count": np.count_nonzero(~np.isnan(masked), axis=0),
+        "mean": np.nanmean(masked, axis=0),
+        "variance": np.nanvar(masked, axis=0, ddof=1),
+        "min": np.nanmin(masked, axis=0),
+        "max": np.nanmax(masked, axis=0),
+        "median": np.nanmedian(masked, axis=0),
+    }
+
+def _impute_median_numpy(matrix: np.ndarray) -> np.ndarray:
+    invalid = ~np.isfinite(matrix)
+    medians = np.nanmedian(np.where(invalid, np.nan, matrix), axis=0)
+    np.copyto(matrix, np.broadcast_to(medians, matrix.shape), where=invalid)
+    return medians
+
+def bench_kernels(n_rows: int, n_columns: int, repeats: int = 3, num_threads: int = 1, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    given a size
+    time every biobeat_scaling/biobeat_cleaning kernel against its numpy equivalent
+    on synthetic data with 1% invalid cells
+    """
+    import biobeat_cleaning
+    import biobeat_scaling
+
+    df = generate_biosignal_frame(n_rows, n_columns, seed, invalid_fraction=0.01)
+    matrix = np.ascontiguousarray(df[get_column_names(n_columns)].to_numpy(dtype=np.float64))
+    del df
+    raw = np.ascontiguousarray(matrix[:, 0])
+    column = raw[np.isfinite(raw)]
+    mean, std = float(column.mean()), float(column.std(ddof=1))
+
+    cases: List[Tuple[str, str, Callable, Optional[Callable]]] = [
+        ("mean", "cpp", lambda: biobeat_scaling.calculate_mean(column, num_threads=num_threads), None),
+        ("mean", "numpy", lambda: column.mean(), None),
+        ("std", "cpp", lambda: biobeat_scaling.calculate_std(column, mean, num_threads=num_threads), None),
+        ("std", "numpy", lambda: column.std(ddof=1), None),
+        ("standardize", "cpp", lambda: biobeat_scaling.apply_standardization(column, mean, std, num_threads=num_threads), None),
+        ("standardize", "numpy", lambda: (column - mean) / std, None),
+        ("standardize_inplace", "cpp", lambda c: biobeat_scaling.apply_standardization_inplace(c, mean, std, num_threads=num_threads), column.copy),
+        ("standardize_inplace", "numpy", lambda c: np.divide(np.subtract(c, mean, out=c), std, out=c), column.copy),
+        ("remove_invalids", "cpp", lambda: biobeat_cleaning.remove_invalids(raw, num_threads=num_threads), None),
+        ("remove_invalids", "numpy", lambda: raw[np.isfinite(raw)], None),
+        ("median", "cpp", lambda: biobeat_cleaning.calculate_median(column), None),
+        ("median", "numpy", lambda: np.median(column), None),
+        ("median_inplace", "cpp", lambda c: biobeat_cleaning.calculate_median_inplace(c), column.copy),
+        ("median_inplace", "numpy", lambda c: np.median(c, overwrite_input=True), column.copy),
+        ("column_stats", "cpp", lambda: biobeat_scaling.calculate_column_stats(matrix, True, num_threads), None),
+        ("column_stats", "numpy", lambda: _column_stats_numpy(matrix), None),
+        ("impute_median", "cpp", lambda m: biobeat_cleaning.impute_median(m, num_threads), matrix.copy),
+        ("impute_median", "numpy", _impute_median_numpy, matrix.copy),
+    ]
+    if n_rows <= LIST_MAX_ROWS:
+        values = column.tolist()
+        cases += [
+            ("mean", "cpp_list", lambda: biobeat_scaling.calculate_mean(values), None),
+            ("std", "cpp_list", lambda: biobeat_scaling.calculate_std(values, mean), None),
+            ("standardize", "cpp_list", lambda: biobeat_scaling.apply_standardization(values, mean, std), None),
+            ("median", "cpp_list", lambda: biobeat_cleaning.calculate_median(values), None),
+        ]
+
+    records = []
+    for case, impl, fn, setup in cases:
+        timing = time_call(fn, repeats, setup)
+        records.append(_record("kernels", case, impl, n_rows, n_columns, timing, num_threads=num_threads))
+    return records
+
+def bench_pipeline(n_rows: int, n_columns: int, workdir: str, repeats: int = 1, num_threads: int = 1, seed: int = 0, batch_size: int = 100_000) -> List[Dict[str, Any]]:
+    """
+    given a size and a scratch dir
+    time run_full_pipeline from a synthetic raw csv, single-pass and batched
+    """
+    from run_preprocessing import run_full_pipeline
+
+    raw_path = write_synthetic_csv(os.path.join(workdir, "raw", f"synthetic_{n_rows}x{n_columns}_{seed}.csv"),
+                                   n_rows, n_columns, seed, invalid_fraction=0.01)
+    out_dir = os.path.join(workdir, "pipeline")
+    records = []
+    for mode, kwargs in (("single_pass", {}), ("batched", {"batch_size": batch_size})):
+        timing = time_call(lambda: run_full_pipeline(raw_path, out_dir, "train.csv", num_threads=num_threads, **kwargs), repeats)
+        records.append(_record("pipeline", "run_full_pipeline", mode, n_rows, n_columns, timing, num_threads=num_threads, **kwargs))
+    return records
+
+def bench_cross_validation(n_rows: int, n_columns: int, models: Optional[List[str]] = None, repeats: int = 1, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    given a size and registered model names (default: the cheap ones)
+    time run_5_fold_cv per model; models that cannot be built are
+    recorded with their error instead of a timing
+    """
+    from training.cross_validation import run_5_fold_cv
+    from training.fold_cache import FoldViews
+    from training.model_registry import build_model, list_models
+
+    df = generate_biosignal_frame(n_rows, n_columns, seed)
+    X = df[get_column_names(n_columns)].to_numpy(dtype=np.float64)
+    y = df['smoking'].to_numpy()
+    del df
+    folds = FoldViews(X, y)
+
+    records = []
+    for name in models or list_models("cheap"):
+        try:
+            build_model(name)
+        except Exception as e:
+            records.append(_record("cv", "run_5_fold_cv", name, n_rows, n_columns, {"error": f"{type(e).__name__}: {e}"}))
+            continue
+        timing = time_call(lambda model: run_5_fold_cv(model, X, y, folds=folds), repeats, lambda: build_model(name))
+        records.append(_record("cv", "run_5_fold_cv", name, n_rows, n_columns, timing))
+    return records
+
+def bench_blender(n_rows: int, workdir: str, n_models: int = 10, repeats: int = 3, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    given a test-set row count and a scratch dir
+    time blend_smart_weighted for every method over n_models stored prediction vectors
+    """
+    from file_io.results_store import write_leaderboard
+    from training.blender import BLEND_METHODS, blend_smart_weighted
+    from training.prediction_store import PredictionStore
+
+    rng = np.random.default_rng(seed)
+    blend_dir = os.path.join(workdir, "blend")
+    store = PredictionStore(os.path.join(blend_dir, "predictions"))
+    y = rng.integers(0, 2, n_rows)
+    names = [f"model_{k}" for k in range(n_models)]
+    for name in names:
+        store.save_oof(name, np.clip(y * 0.3 + rng.random(n_rows) * 0.7, 0, 1), y)
+        store.save_test(name, rng.random(n_rows))
+    results_path = os.path.join(blend_dir, "model_results.json")
+    write_leaderboard(pd.DataFrame({"model": names, "auc": np.linspace(0.7, 0.9, n_models)}), results_path)
+
+    records = []
+    for method in BLEND_METHODS:
+        output_path = os.path.join(blend_dir, f"blended_{method}.csv")
+        timing = time_call(lambda: blend_smart_weighted(blend_dir, results_path, output_path, method, store), repeats)
+        records.append(_record("blend", "blend_smart_weighted", method, n_rows, n_models, timing))
+    return records
+
+def get_environment() -> Dict[str, Any]:
+    """
+    return what a timing depends on besides the code: host, versions, commit
+    """
+    import biobeat_scaling
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, cwd=SCRIPTS_DIR).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "has_openmp": bool(biobeat_scaling.has_openmp),
+    }
+
+def run_benchmarks(output_path: str, sizes: List[Tuple[int, int]] = DEFAULT_SIZES, suites: Tuple[str, ...] = SUITES, workdir: str = "data/benchmarks/work", repeats: int = 3, num_threads: int = 1, models: Optional[List[str]] = None, seed: int = 0) -> Dict[str, Any]:
+    """
+    given where to save the results and (rows, columns) sizes
+    run the selected suites at every size and write
+    {"environment": ..., "results": [...]} as json
+    return the same dict
+    """
+    unknown = set(suites) - set(SUITES)
+    if unknown:
+        raise ValueError(f"unknown suites {sorted(unknown)}, expected a subset of {SUITES}")
+    ensure_extensions_built()
+    os.makedirs(workdir, exist_ok=True)
+
+    results: List[Dict[str, Any]] = []
+    for n_rows, n_columns in sizes:
+        print(f"⏱️  Benchmarking {n_rows} rows x {n_columns} columns...")
+        if "kernels" in suites:
+            results += bench_kernels(n_rows, n_columns, repeats, num_threads, seed)
+        if "pipeline" in suites:
+            results += bench_pipeline(n_rows, n_columns, workdir, 1, num_threads, seed)
+        if "cv" in suites:
+            results += bench_cross_validation(n_rows, n_columns, models, 1, seed)
+        if "blend" in suites:
+            results += bench_blender(n_rows, workdir, repeats=repeats, seed=seed)
+
+    report = {"environment": get_environment(), "results": results}
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Benchmark results saved: {output_path}")
+    return report
+
+def _case_key(record: Dict[str, Any]) -> str:
+    return json.dumps([record[k] for k in ("suite", "case", "impl", "n_rows", "n_columns", "params")], sort_keys=True)
+
+def compare_runs(baseline_path: str, current_path: str, tolerance: float = REGRESSION_TOLERANCE) -> pd.DataFrame:
+    """
+    given two files written by run_benchmarks
+    return the cases timed in both, with the ratio of best times
+    and a regressed flag where current is more than tolerance slower
+    """
+    frames = []
+    for path in (baseline_path, current_path):
+        with open(path) as f:
+            records = [r for r in json.load(f)["results"] if "min_s" in r]
+        frames.append(pd.DataFrame({"key": [_case_key(r) for r in records],
+                                    "suite": [r["suite"] for r in records], "case": [r["case"] for r in records],
+                                    "impl": [r["impl"] for r in records], "n_rows": [r["n_rows"] for r in records],
+                                    "n_columns": [r["n_columns"] for r in records], "min_s": [r["min_s"] for r in records]}))
+    merged = frames[0].merge(frames[1][["key", "min_s"]], on="key", suffixes=("_baseline", "_current")).drop(columns="key")
+    merged["ratio"] = merged["min_s_current"] / merged["min_s_baseline"]
+    merged["regressed"] = merged["ratio"] > 1 + tolerance
+    return merged
+
+def get_speedups(report: Dict[str, Any]) -> pd.DataFrame:
+    """
+    given a run_benchmarks report
+    return numpy time / c++ time for every kernel case (> 1 means c++ wins)
+    """
+    kernels = pd.DataFrame([r for r in report["results"] if r["suite"] == "kernels"])
+    if kernels.empty:
+        return kernels
+    table = kernels.pivot_table(index=["case", "n_rows", "n_columns"], columns="impl", values="min_s")
+    table["speedup"] = table["numpy"] / table["cpp"]
+    return table.reset_index()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the c++ engine and the training pipeline on synthetic data")
+    parser.add_argument("--sizes", nargs="+", default=[f"{r}x{c}" for r, c in DEFAULT_SIZES],
+                        help="ROWSxCOLUMNS sizes, e.g. 10000x10 1000000x100")
+    parser.add_argument("--suites", nargs="+", choices=SUITES, default=list(SUITES))
+    parser.add_argument("--models", nargs="+", help="registered models for the cv suite (default: cheap ones)")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=1, help="num_threads for the c++ kernels")
+    parser.add_argument("--output", default="data/benchmarks/results.json")
+    parser.add_argument("--workdir", default="data/benchmarks/work", help="synthetic files and pipeline outputs")
+    parser.add_argument("--baseline", help="earlier results file; exit 1 if any case regressed")
+    args = parser.parse_args()
+
+    sizes = [tuple(int(v) for v in size.lower().split("x")) for size in args.sizes]
+    report = run_benchmarks(args.output, sizes, tuple(args.suites), args.workdir, args.repeats, args.threads, args.models)
+    speedups = get_speedups(report)
+    if not speedups.empty:
+        print(speedups[["case", "n_rows", "n_columns", "speedup"]].to_string(index=False))
+    if args.baseline:
+        comparison = compare_runs(args.baseline, args.output)
+        print(comparison.to_string(index=False))
+        if comparison["regressed"].any():
+            sys.exit(1)
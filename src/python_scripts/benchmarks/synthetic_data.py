@@ -0,0 +1,87 @@
+import os
+import numpy as np
+import pandas as pd
+from typing import Iterator, List
+
+# columns of the real smoking/bio-signal dataset with (mean, std) of the
+# generated values, so the default feature spec finds its inputs
+BIOSIGNAL_COLUMNS = {
+    "age": (44.0, 12.0),
+    "height(cm)": (165.0, 9.0),
+    "weight(kg)": (65.0, 12.0),
+    "waist(cm)": (82.0, 9.0),
+    "systolic": (121.0, 13.0),
+    "relaxation": (76.0, 9.0),
+    "fasting blood sugar": (99.0, 20.0),
+    "Cholesterol": (196.0, 36.0),
+    "triglyceride": (126.0, 71.0),
+    "HDL": (57.0, 15.0),
+    "LDL": (115.0, 35.0),
+    "hemoglobin": (14.6, 1.6),
+    "serum creatinine": (0.9, 0.2),
+    "AST": (26.0, 10.0),
+    "ALT": (27.0, 18.0),
+    "GTP": (39.0, 38.0),
+}
+
+# rows generated (and written) per chunk, so 50M-row files never sit in memory
+GENERATE_CHUNK_ROWS = 500_000
+
+def get_column_names(n_columns: int) -> List[str]:
+    """
+    given a feature column count
+    return the bio-signal column names, padded with signal_<k> columns
+    """
+    names = list(BIOSIGNAL_COLUMNS)[:n_columns]
+    names += [f"signal_{k}" for k in range(n_columns - len(names))]
+    return names
+
+def iter_synthetic_chunks(n_rows: int, n_columns: int, seed: int = 0, invalid_fraction: float = 0.0, chunk_rows: int = GENERATE_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """
+    given a size, a seed and the fraction of cells to blank out
+    yield dataframes of at most chunk_rows rows with id, the feature columns
+    and a smoking target that depends on a few of the features
+    each chunk is seeded from (seed, start row), so files are reproducible
+    """
+    names = get_column_names(n_columns)
+    means = np.array([BIOSIGNAL_COLUMNS.get(c, (0.0, 1.0))[0] for c in names])
+    stds = np.array([BIOSIGNAL_COLUMNS.get(c, (0.0, 1.0))[1] for c in names])
+    # target weights on the standardized features, fixed by the seed
+    coef = np.random.default_rng(seed).normal(scale=1.0 / np.sqrt(min(n_columns, 8)), size=n_columns)
+    coef[8:] = 0.0
+
+    for start in range(0, n_rows, chunk_rows):
+        size = min(chunk_rows, n_rows - start)
+        rng = np.random.default_rng([seed, start])
+        z = rng.standard_normal((size, n_columns))
+        logit = z @ coef + rng.logistic(size=size)
+        values = z * stds + means
+        if invalid_fraction > 0:
+            values[rng.random(values.shape) < invalid_fraction] = np.nan
+        df = pd.DataFrame(values, columns=names)
+        df.insert(0, "id", np.arange(start, start + size))
+        df["smoking"] = (logit > 0).astype(np.int64)
+        yield df
+
+def generate_biosignal_frame(n_rows: int, n_columns: int, seed: int = 0, invalid_fraction: float = 0.0) -> pd.DataFrame:
+    """
+    given a size and a seed
+    return the whole synthetic dataset as one dataframe
+    """
+    return pd.concat(list(iter_synthetic_chunks(n_rows, n_columns, seed, invalid_fraction)), ignore_index=True)
+
+def write_synthetic_csv(output_path: str, n_rows: int, n_columns: int, seed: int = 0, invalid_fraction: float = 0.0) -> str:
+    """
+    given an output path and a size
+    write the synthetic dataset chunk by chunk (invalid cells become empty fields)
+    an existing file is reused; the name should encode the size and seed
+    return output_path
+    """
+    if os.path.exists(output_path):
+        return output_path
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    tmp_path = output_path + ".tmp"
+    for k, df in enumerate(iter_synthetic_chunks(n_rows, n_columns, seed, invalid_fraction)):
+        df.to_csv(tmp_path, mode='w' if k == 0 else 'a', header=k == 0, index=False)
+    os.replace(tmp_path, output_path)
+    return output_path
@@ -1,15 +1,39 @@
 import biobeat_cleaning
-from typing import List
+import numpy as np
+from typing import List, Tuple, Union
 
-def get_clean_median(column_data: List[float]) -> float:
+def get_clean_median(column_data: Union[List[float], np.ndarray], num_threads: int = 1) -> float:
     """
-    given a list of numeric floats representing a column
+    given a list or float64 array representing a column
     return the median value
-    uses c++ engine to strip invalids first
+    uses c++ engine to strip invalids first (row chunks across num_threads)
     uses c++ engine to calculate median
     """
-    if not column_data:
+    if len(column_data) == 0:
         return 0.0
 
-    clean_data = biobeat_cleaning.remove_invalids(column_data)
+    if isinstance(column_data, np.ndarray):
+        clean_data = biobeat_cleaning.remove_invalids(np.ascontiguousarray(column_data, dtype=np.float64), num_threads=num_threads)
+        # clean_data is our own copy, so the median may reorder it
+        return biobeat_cleaning.calculate_median_inplace(clean_data)
+
+    clean_data = biobeat_cleaning.remove_invalids(column_data, num_threads=num_threads)
     return biobeat_cleaning.calculate_median(clean_data)
+
+def impute_median_inplace(matrix: np.ndarray, num_threads: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    given a writable c-contiguous float64 column or (rows x features) matrix
+    replace nan/inf cells in place with their column's median
+    rows are kept, so every column stays aligned
+    return (per-column imputation counts, per-column medians)
+    """
+    return biobeat_cleaning.impute_median(matrix, num_threads)
+
+def fill_invalid_inplace(matrix: np.ndarray, fill_values: np.ndarray, num_threads: int = 1) -> np.ndarray:
+    """
+    given a writable c-contiguous float64 column or (rows x features) matrix
+    and one fill value per column (e.g. train-time medians)
+    replace nan/inf cells in place and return per-column counts
+    """
+    fill_values = np.ascontiguousarray(np.atleast_1d(fill_values), dtype=np.float64)
+    return biobeat_cleaning.fill_invalids(matrix, fill_values, num_threads)
@@ -0,0 +1,160 @@
+import itertools
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterator, List, Mapping, Sequence, Tuple, Union
+
+# a feature spec is a list of json-serializable entries:
+#   {"name": str, "op": str, "inputs": [column, ...], **params}
+# ops:
+#   ratio       a / (((b / scale) ** power) + offset)    params scale=1, power=1, offset=0
+#   difference  a - b
+#   product     a * b
+#   log         log(a + offset)                          params offset=1
+#   bin         index of the bin a falls in               params edges=[...] (increasing)
+FeatureSpec = List[Dict[str, Any]]
+ColumnData = Union[pd.DataFrame, Mapping[str, np.ndarray]]
+
+OP_ARITY = {"ratio": 2, "difference": 2, "product": 2, "log": 1, "bin": 1}
+
+# rows evaluated per pass; scratch space stays cache-sized however long the columns are
+BLOCK_ROWS = 1 << 15
+# features materialized at once by iter_feature_blocks
+BLOCK_FEATURES = 16
+
+DEFAULT_FEATURE_SPEC: FeatureSpec = [
+    # Body Mass Index (BMI) proxy
+    {"name": "bmi_proxy", "op": "ratio", "inputs": ["weight(kg)", "height(cm)"], "scale": 100, "power": 2},
+    # Cardiovascular Risk Interaction
+    {"name": "pulse_pressure", "op": "difference", "inputs": ["systolic", "relaxation"]},
+    # Liver/Metabolism Ratio (offset avoids div by zero)
+    {"name": "gtp_alt_ratio", "op": "ratio", "inputs": ["GTP", "ALT"], "offset": 1},
+]
+
+def validate_spec(spec: FeatureSpec) -> None:
+    """
+    given a feature spec
+    raise ValueError on unknown ops, wrong input counts or duplicate names
+    """
+    seen = set()
+    for entry in spec:
+        op = entry.get("op")
+        if op not in OP_ARITY:
+            raise ValueError(f"feature {entry.get('name')!r}: unknown op {op!r}")
+        if len(entry.get("inputs", [])) != OP_ARITY[op]:
+            raise ValueError(f"feature {entry['name']!r}: {op} takes {OP_ARITY[op]} input(s)")
+        if op == "bin" and np.any(np.diff(entry.get("edges", [])) <= 0):
+            raise ValueError(f"feature {entry['name']!r}: bin edges must be increasing")
+        if entry["name"] in seen:
+            raise ValueError(f"duplicate feature name {entry['name']!r}")
+        seen.add(entry["name"])
+
+def resolve_spec(spec: FeatureSpec, columns: Sequence[str]) -> FeatureSpec:
+    """
+    given a spec and the available column names
+    return the entries whose inputs are all present (the others are skipped)
+    """
+    available = set(columns)
+    return [entry for entry in spec if all(c in available for c in entry["inputs"])]
+
+def get_pairwise_spec(columns: Sequence[str], ops: Sequence[str] = ("product",)) -> FeatureSpec:
+    """
+    given column names and binary ops (product, difference, ratio)
+    return a spec with one feature per unordered column pair and op
+    """
+    suffix = {"product": "x", "difference": "minus", "ratio": "over"}
+    spec = []
+    for a, b in itertools.combinations(columns, 2):
+        for op in ops:
+            if op not in suffix:
+                raise ValueError(f"pairwise interactions support {tuple(suffix)}, got {op!r}")
+            spec.append({"name": f"{a}_{suffix[op]}_{b}", "op": op, "inputs": [a, b]})
+    return spec
+
+def _get_column(data: ColumnData, name: str) -> np.ndarray:
+    column = data[name]
+    if isinstance(column, pd.Series):
+        column = column.to_numpy(dtype=np.float64)
+    return np.asarray(column, dtype=np.float64)
+
+class CompiledFeatureSpec:
+    """
+    a feature spec bound to its input columns, ready to evaluate
+    evaluate() walks the rows in BLOCK_ROWS blocks and computes every feature
+    with numpy ufuncs writing into the preallocated output (out=), so the only
+    temporaries are one block-sized scratch buffer reused by all features
+    """
+
+    def __init__(self, spec: FeatureSpec):
+        validate_spec(spec)
+        self.spec = [dict(entry) for entry in spec]
+        self.names = [entry["name"] for entry in self.spec]
+        self.inputs = sorted({c for entry in self.spec for c in entry["inputs"]})
+
+    def __len__(self) -> int:
+        return len(self.spec)
+
+    def _eval_block(self, entry: Dict[str, Any], cols: Dict[str, np.ndarray], out: np.ndarray, scratch: np.ndarray) -> None:
+        op = entry["op"]
+        a = cols[entry["inputs"][0]]
+        if op == "difference":
+            np.subtract(a, cols[entry["inputs"][1]], out=out)
+        elif op == "product":
+            np.multiply(a, cols[entry["inputs"][1]], out=out)
+        elif op == "ratio":
+            den = cols[entry["inputs"][1]]
+            scale, power, offset = entry.get("scale", 1), entry.get("power", 1), entry.get("offset", 0)
+            if scale != 1 or power != 1 or offset != 0:
+                # each step only runs when set, so defaults never touch the bits
+                np.copyto(scratch, den)
+                if scale != 1:
+                    np.divide(scratch, scale, out=scratch)
+                if power == 2:
+                    np.square(scratch, out=scratch)
+                elif power != 1:
+                    np.power(scratch, power, out=scratch)
+                if offset != 0:
+                    np.add(scratch, offset, out=scratch)
+                den = scratch
+            np.divide(a, den, out=out)
+        elif op == "log":
+            np.add(a, entry.get("offset", 1), out=out)
+            np.log(out, out=out)
+        elif op == "bin":
+            out[:] = np.searchsorted(np.asarray(entry["edges"], dtype=np.float64), a, side='right')
+
+    def evaluate(self, data: ColumnData, out: np.ndarray = None) -> np.ndarray:
+        """
+        given a dataframe or {name: array} holding the input columns
+        return a rows x features float64 matrix (Fortran order, so every
+        feature is one contiguous column); pass out to reuse a buffer
+        """
+        columns = {name: _get_column(data, name) for name in self.inputs}
+        n_rows = len(next(iter(columns.values()))) if columns else 0
+        if out is None:
+            out = np.empty((n_rows, len(self.spec)), dtype=np.float64, order='F')
+        scratch = np.empty(min(n_rows, BLOCK_ROWS), dtype=np.float64)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for start in range(0, n_rows, BLOCK_ROWS):
+                stop = min(start + BLOCK_ROWS, n_rows)
+                block = {name: col[start:stop] for name, col in columns.items()}
+                for k, entry in enumerate(self.spec):
+                    self._eval_block(entry, block, out[start:stop, k], scratch[:stop - start])
+        return out
+
+def compile_feature_spec(spec: FeatureSpec) -> CompiledFeatureSpec:
+    """
+    given a feature spec
+    return it validated and compiled for evaluation
+    """
+    return CompiledFeatureSpec(spec)
+
+def iter_feature_blocks(data: ColumnData, spec: FeatureSpec, block_features: int = BLOCK_FEATURES) -> Iterator[Tuple[List[str], np.ndarray]]:
+    """
+    given input columns and a (possibly very wide) spec, e.g. get_pairwise_spec
+    yield (names, rows x block_features matrix) chunks of the spec in order
+    only one block of features is materialized at a time
+    """
+    for start in range(0, len(spec), block_features):
+        compiled = compile_feature_spec(spec[start:start + block_features])
+        yield compiled.names, compiled.evaluate(data)
@@ -1,21 +1,21 @@
 import pandas as pd
+from typing import Optional
 
-def apply_feature_engineering(df: pd.DataFrame) -> pd.DataFrame:
+from engineering.feature_spec import DEFAULT_FEATURE_SPEC, FeatureSpec, compile_feature_spec, resolve_spec
+
+def apply_feature_engineering(df: pd.DataFrame, spec: Optional[FeatureSpec] = None) -> pd.DataFrame:
     """
     given a dataframe of bio-signals
     return a dataframe with new interaction features
     based on standard medical indicators (e.g., height/weight ratio)
+    spec defaults to DEFAULT_FEATURE_SPEC (bmi_proxy, pulse_pressure, gtp_alt_ratio);
+    entries whose input columns are missing are skipped
+    the input frame is left untouched
     """
-    # 1. Body Mass Index (BMI) proxy
-    if 'height(cm)' in df.columns and 'weight(kg)' in df.columns:
-        df['bmi_proxy'] = df['weight(kg)'] / ((df['height(cm)'] / 100) ** 2)
+    spec = resolve_spec(DEFAULT_FEATURE_SPEC if spec is None else spec, df.columns)
+    if not spec:
+        return df.copy(deep=False)
 
-    # 2. Cardiovascular Risk Interaction
-    if 'systolic' in df.columns and 'relaxation' in df.columns:
-        df['pulse_pressure'] = df['systolic'] - df['relaxation']
-        
-    # 3. Liver/Metabolism Ratio
-    if 'GTP' in df.columns and 'ALT' in df.columns:
-        df['gtp_alt_ratio'] = df['GTP'] / (df['ALT'] + 1) # avoid div by zero
-        
-    return df
+    compiled = compile_feature_spec(spec)
+    features = pd.DataFrame(compiled.evaluate(df), columns=compiled.names, index=df.index, copy=False)
+    return pd.concat([df.drop(columns=[c for c in compiled.names if c in df.columns]), features], axis=1)
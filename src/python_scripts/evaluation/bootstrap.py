@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+# memory allowed for one chunk of resample weights (rows x resamples int64 work arrays)
+MAX_CHUNK_BYTES = 256 * 1024 * 1024
+
+def get_chunk_size(n_rows: int, max_chunk_bytes: int = MAX_CHUNK_BYTES) -> int:
+    """
+    given the row count
+    return how many resamples fit in one chunk of the memory budget
+    (about four rows x chunk int64 arrays are live at once)
+    """
+    return max(1, max_chunk_bytes // (max(n_rows, 1) * 8 * 4))
+
+def get_resample_weights(n_rows: int, n_resamples: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    given a row count, a resample count and a generator
+    return an n_resamples x n_rows int64 matrix of bootstrap multiplicities
+    built with one bincount over all draws instead of a loop per resample
+    """
+    draws = rng.integers(0, n_rows, size=(n_resamples, n_rows))
+    draws += np.arange(n_resamples)[:, None] * n_rows
+    return np.bincount(draws.ravel(), minlength=n_rows * n_resamples).reshape(n_resamples, n_rows)
+
+def _bootstrap_chunk(y_sorted: np.ndarray, correct_sorted: np.ndarray, group_starts: np.ndarray, n_resamples: int, seed: np.random.SeedSequence) -> Dict[str, np.ndarray]:
+    """
+    one chunk of resamples over rows already sorted by descending score
+    AUC comes from per-tie-group weighted positive/negative totals, so no re-sorting;
+    the weights are integer counts, so the sums are exact
+    """
+    n_rows = len(y_sorted)
+    # the weights are drawn in sorted order directly: resampling is order-free
+    weights = get_resample_weights(n_rows, n_resamples, np.random.default_rng(seed))
+
+    pos_w = weights * y_sorted
+    neg_w = weights - pos_w
+    if len(group_starts) < n_rows:
+        pos_w = np.add.reduceat(pos_w, group_starts, axis=1)
+        neg_w = np.add.reduceat(neg_w, group_starts, axis=1)
+    # positives ranked strictly above each tie group, doubled to keep integers
+    above2 = np.cumsum(pos_w, axis=1)
+    above2 -= pos_w
+    above2 *= 2
+    above2 += pos_w
+
+    numerator = np.einsum('ij,ij->i', neg_w, above2)
+    denominator = 2 * pos_w.sum(axis=1) * neg_w.sum(axis=1)
+    auc = np.divide(numerator, denominator, out=np.full(n_resamples, np.nan), where=denominator > 0)
+    accuracy = weights @ correct_sorted / n_rows
+    return {"auc": auc, "accuracy": accuracy}
+
+def bootstrap_metrics(y_true: np.ndarray, y_prob: np.ndarray, n_resamples: int = 1000, threshold: float = 0.5, seed: int = 42, n_workers: int = 1, max_chunk_bytes: int = MAX_CHUNK_BYTES) -> Dict[str, np.ndarray]:
+    """
+    given oof labels and probabilities
+    return {"auc": (n_resamples,), "accuracy": (n_resamples,)} bootstrap distributions
+    rows are sorted once; every resample is a weight vector applied to that order
+    chunks of resamples have their own seeds, so results are identical
+    for any n_workers (> 1 spreads the chunks over processes)
+    """
+    y_true = np.asarray(y_true, dtype=np.float64)
+    y_prob = np.asarray(y_prob, dtype=np.float64)
+    order = np.argsort(-y_prob, kind='stable')
+    p = y_prob[order]
+    y_sorted = (y_true[order] == 1).astype(np.int64)
+    correct_sorted = ((p >= threshold) == (y_sorted == 1)).astype(np.int64)
+    group_starts = np.r_[0, np.flatnonzero(p[1:] != p[:-1]) + 1]
+
+    chunk = get_chunk_size(len(p), max_chunk_bytes)
+    sizes = [min(chunk, n_resamples - start) for start in range(0, n_resamples, chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    if n_workers > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            parts = list(pool.map(_bootstrap_chunk, [y_sorted] * len(sizes), [correct_sorted] * len(sizes),
+                                  [group_starts] * len(sizes), sizes, seeds))
+    else:
+        parts = [_bootstrap_chunk(y_sorted, correct_sorted, group_starts, size, s) for size, s in zip(sizes, seeds)]
+
+    return {name: np.concatenate([part[name] for part in parts]) for name in ("auc", "accuracy")}
+
+def bootstrap_ci(y_true: np.ndarray, y_prob: np.ndarray, n_resamples: int = 1000, alpha: float = 0.05, **kwargs) -> Dict[str, float]:
+    """
+    given oof labels and probabilities
+    return percentile confidence intervals {auc_ci_low, auc_ci_high, accuracy_ci_low, accuracy_ci_high}
+    """
+    samples = bootstrap_metrics(y_true, y_prob, n_resamples, **kwargs)
+    intervals = {}
+    for name, values in samples.items():
+        low, high = np.nanquantile(values, [alpha / 2, 1 - alpha / 2])
+        intervals[f"{name}_ci_low"] = float(low)
+        intervals[f"{name}_ci_high"] = float(high)
+    return intervals
+
+def add_bootstrap_ci(leaderboard: pd.DataFrame, prediction_store, n_resamples: int = 1000, alpha: float = 0.05, n_workers: int = 1) -> pd.DataFrame:
+    """
+    given the leaderboard and the prediction store holding every model's oof vector
+    return the leaderboard with auc/accuracy confidence interval columns
+    (intervals are over the pooled oof predictions, the fold means stay as they are)
+    models without stored oof predictions get nan intervals
+    """
+    y = np.asarray(prediction_store.load_target())
+    stored = set(prediction_store.list_models("oof"))
+    rows: List[Dict[str, Optional[float]]] = []
+    for name in leaderboard["model"]:
+        if name in stored:
+            rows.append(bootstrap_ci(y, np.asarray(prediction_store.load("oof", name)), n_resamples, alpha, n_workers=n_workers))
+        else:
+            rows.append({})
+    intervals = pd.DataFrame(rows, index=leaderboard.index,
+                             columns=["auc_ci_low", "auc_ci_high", "accuracy_ci_low", "accuracy_ci_high"])
+    return pd.concat([leaderboard, intervals], axis=1)
@@ -1,12 +1,15 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+from typing import Any, Optional
 
-def get_feature_importance(model: Any, feature_names: list, model_name: str, output_dir: str):
+from visualization.render_queue import RenderQueue
+
+def get_feature_importance(model: Any, feature_names: list, model_name: str, output_dir: str, queue: Optional[RenderQueue] = None):
     """
     given a trained model and feature names
     extract importance or coefficients
     save a bar chart of the top 10 features
+    the chart is drawn by the render queue when one is given, inline otherwise
     """
     if hasattr(model, 'feature_importances_'):
         importance = model.feature_importances_
@@ -18,9 +21,14 @@ def get_feature_importance(model: Any, feature_names: list, model_name: str, out
     df = pd.DataFrame({'feature': feature_names, 'importance': importance})
     df = df.sort_values(by='importance', ascending=False).head(10)
 
-    plt.figure(figsize=(10, 6))
-    plt.barh(df['feature'], df['importance'], color='skyblue')
-    plt.gca().invert_yaxis()
-    plt.title(f'Top 10 Features: {model_name}')
-    plt.savefig(f"{output_dir}/{model_name}_importance.png")
-    plt.close()
+    payload = {
+        "features": df['feature'].astype(str).tolist(),
+        "importance": df['importance'].to_numpy(dtype=np.float64),
+        "title": f'Top 10 Features: {model_name}',
+    }
+    if queue is None:
+        queue = RenderQueue(n_workers=0)
+        queue.submit("importance", payload, f"{output_dir}/{model_name}_importance.png")
+        queue.wait()
+    else:
+        queue.submit("importance", payload, f"{output_dir}/{model_name}_importance.png")
@@ -1,17 +1,143 @@
-from sklearn.metrics import accuracy_score, roc_auc_score, f1_score, precision_score, recall_score
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 
+METRIC_NAMES = ("accuracy", "auc", "f1", "precision", "recall")
+
+def _safe_divide(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    # 0 where the denominator is 0 (sklearn's zero_division=0)
+    num, den = np.asarray(num, dtype=np.float64), np.asarray(den, dtype=np.float64)
+    return np.divide(num, den, out=np.zeros(np.broadcast(num, den).shape), where=den != 0)
+
+def _scores(tp: np.ndarray, fp: np.ndarray, pos: np.ndarray, neg: np.ndarray) -> Dict[str, np.ndarray]:
+    predicted = tp + fp
+    return {
+        "accuracy": _safe_divide(tp + neg - fp, pos + neg),
+        "precision": _safe_divide(tp, predicted),
+        "recall": _safe_divide(tp, pos),
+        "f1": _safe_divide(2 * tp, predicted + pos),
+    }
+
+def stack_folds(cv_results: List[Tuple[np.ndarray, np.ndarray]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    given per-fold (y_val, y_prob) pairs of possibly different lengths
+    return (y_true, y_prob, valid) rows x folds matrices padded to the longest fold
+    """
+    n_rows = max(len(y) for y, _ in cv_results)
+    shape = (n_rows, len(cv_results))
+    y_true, y_prob, valid = np.zeros(shape), np.full(shape, -np.inf), np.zeros(shape, dtype=bool)
+    for k, (y, prob) in enumerate(cv_results):
+        y_true[:len(y), k] = y
+        y_prob[:len(y), k] = prob
+        valid[:len(y), k] = True
+    return y_true, y_prob, valid
+
+def get_batched_metrics(y_true: np.ndarray, y_prob: np.ndarray, threshold: float = 0.5, valid: Optional[np.ndarray] = None, optimize: str = "f1") -> Dict[str, np.ndarray]:
+    """
+    given labels and probabilities as rows x columns matrices (one column per
+    fold and/or model; y_true may be a single shared column) and an optional
+    valid mask for padded rows
+    sort each column once and return per column:
+    auc (ties averaged, like roc_auc_score), accuracy/precision/recall/f1 at threshold,
+    and best_threshold / best_<optimize> from the sweep over every distinct score
+    1-d inputs give 0-d results
+    """
+    if optimize not in ("accuracy", "precision", "recall", "f1"):
+        raise ValueError(f"cannot optimize {optimize!r}")
+    y_prob = np.asarray(y_prob, dtype=np.float64)
+    squeeze = y_prob.ndim == 1
+    y_prob = y_prob.reshape(len(y_prob), -1)
+    y_true = np.broadcast_to(np.asarray(y_true, dtype=np.float64).reshape(len(y_prob), -1), y_prob.shape)
+    if valid is None:
+        valid = np.ones(y_prob.shape, dtype=bool)
+    else:
+        valid = np.broadcast_to(np.asarray(valid, dtype=bool).reshape(len(y_prob), -1), y_prob.shape)
+        y_prob = np.where(valid, y_prob, -np.inf)
+    n_rows = len(y_prob)
+    is_pos = np.where(valid, y_true, 0.0)
+    is_neg = valid - is_pos
+    pos, neg = is_pos.sum(axis=0), is_neg.sum(axis=0)
+
+    # the single sort: descending scores, stable so ties keep row order
+    order = np.argsort(-y_prob, axis=0, kind='stable')
+    p = np.take_along_axis(y_prob, order, axis=0)
+    t_pos = np.take_along_axis(is_pos, order, axis=0)
+    t_neg = np.take_along_axis(is_neg, order, axis=0)
+    tp = np.cumsum(t_pos, axis=0)
+    fp = np.cumsum(t_neg, axis=0)
+
+    # tie groups: predictions flip together, so only group ends are thresholds
+    group_end = np.ones(p.shape, dtype=bool)
+    group_end[:-1] = p[:-1] != p[1:]
+    group_start = np.ones(p.shape, dtype=bool)
+    group_start[1:] = group_end[:-1]
+    idx = np.arange(n_rows)[:, None]
+    start = np.maximum.accumulate(np.where(group_start, idx, 0), axis=0)
+    end = np.minimum.accumulate(np.where(group_end, idx, n_rows - 1)[::-1], axis=0)[::-1]
+
+    # AUC: every negative beats the positives above its tie group, and half of those tied with it
+    tp_before = np.take_along_axis(tp - t_pos, start, axis=0)
+    tp_group = np.take_along_axis(tp, end, axis=0) - tp_before
+    auc = _safe_divide((t_neg * (tp_before + 0.5 * tp_group)).sum(axis=0), pos * neg)
+    auc = np.where((pos > 0) & (neg > 0), auc, np.nan)
+
+    # metrics at the requested threshold
+    predicted_pos = valid & (y_prob >= threshold)
+    tp_at = (predicted_pos * is_pos).sum(axis=0)
+    fp_at = (predicted_pos * is_neg).sum(axis=0)
+    result = _scores(tp_at, fp_at, pos, neg)
+    result["auc"] = auc
+
+    # sweep: score every distinct threshold at once, keep the best group end
+    sweep = _scores(tp, fp, pos, neg)[optimize]
+    sweep = np.where(group_end & np.isfinite(p), sweep, -np.inf)
+    best = np.argmax(sweep, axis=0)
+    cols = np.arange(p.shape[1])
+    none_score = _scores(np.zeros_like(pos), np.zeros_like(neg), pos, neg)[optimize]
+    predict_none = none_score > sweep[best, cols]
+    result["best_threshold"] = np.where(predict_none, np.inf, p[best, cols])
+    result[f"best_{optimize}"] = np.where(predict_none, none_score, sweep[best, cols])
+
+    if squeeze:
+        result = {k: v[0] for k, v in result.items()}
+    return result
+
+def get_threshold_sweep(y_true: np.ndarray, y_prob: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    given labels and probabilities for one model
+    return the distinct thresholds (descending) with accuracy, precision,
+    recall and f1 of predicting prob >= threshold, from a single sort
+    """
+    y_true = np.asarray(y_true, dtype=np.float64)
+    y_prob = np.asarray(y_prob, dtype=np.float64)
+    order = np.argsort(-y_prob, kind='stable')
+    p = y_prob[order]
+    tp = np.cumsum(y_true[order])
+    fp = np.arange(1, len(p) + 1) - tp
+    ends = np.r_[np.flatnonzero(p[:-1] != p[1:]), len(p) - 1]
+    pos = tp[-1]
+    sweep = _scores(tp[ends], fp[ends], pos, len(p) - pos)
+    sweep["threshold"] = p[ends]
+    return sweep
+
+def get_cv_metrics(cv_results: List[Tuple[np.ndarray, np.ndarray]], threshold: float = 0.5) -> Dict[str, np.ndarray]:
+    """
+    given per-fold (y_val, y_prob) pairs
+    return per-fold metric arrays computed in one batched pass
+    """
+    y_true, y_prob, valid = stack_folds(cv_results)
+    return get_batched_metrics(y_true, y_prob, threshold, valid)
+
 def get_classification_metrics(y_true: np.ndarray, y_pred: np.ndarray, y_prob: np.ndarray) -> Dict[str, float]:
     """
     given true labels, binary predictions, and probabilities
     return a dictionary of performance metrics
     handles binary classification
     """
-    return {
-        "accuracy": float(accuracy_score(y_true, y_pred)),
-        "auc": float(roc_auc_score(y_true, y_prob)),
-        "f1": float(f1_score(y_true, y_pred)),
-        "precision": float(precision_score(y_true, y_pred, zero_division=0)),
-        "recall": float(recall_score(y_true, y_pred, zero_division=0))
-    }
+    y_true = np.asarray(y_true) == 1
+    y_pred = np.asarray(y_pred) == 1
+    tp = float(np.count_nonzero(y_true & y_pred))
+    fp = float(np.count_nonzero(~y_true & y_pred))
+    pos = float(np.count_nonzero(y_true))
+    metrics = {k: float(v) for k, v in _scores(tp, fp, pos, len(y_true) - pos).items()}
+    metrics["auc"] = float(get_batched_metrics(y_true, y_prob)["auc"])
+    return {name: metrics[name] for name in METRIC_NAMES}
@@ -0,0 +1,40 @@
+import pandas as pd
+import pyarrow.parquet as pq
+from typing import Iterator, List, Optional
+
+from file_io.header_parser import get_column_mapping
+
+def get_table_columns(file_path: str) -> List[str]:
+    """
+    given a path to a csv or parquet file
+    return the ordered list of column names
+    reads only the header / parquet footer
+    """
+    if file_path.endswith('.parquet'):
+        return pq.ParquetFile(file_path).schema_arrow.names
+    return list(get_column_mapping(file_path).values())
+
+def iter_row_batches(file_path: str, batch_size: int, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """
+    given a path to a csv or parquet file and a row batch size
+    yield dataframes of at most batch_size rows, in file order
+    only one batch is held in memory at a time
+    """
+    if file_path.endswith('.parquet'):
+        parquet_file = pq.ParquetFile(file_path)
+        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+            yield batch.to_pandas()
+        return
+
+    sep = '\t' if file_path.endswith('.tsv') else ','
+    for chunk in pd.read_csv(file_path, sep=sep, usecols=columns, chunksize=batch_size):
+        yield chunk
+
+def iter_numeric_batches(file_path: str, batch_size: int, columns: List[str]) -> Iterator[pd.DataFrame]:
+    """
+    given a path, a row batch size, and the numeric columns to read
+    yield float64 dataframes of at most batch_size rows
+    empty or invalid cells become nan so rows stay aligned
+    """
+    for batch in iter_row_batches(file_path, batch_size, columns):
+        yield batch[columns].apply(pd.to_numeric, errors='coerce').astype('float64')
@@ -0,0 +1,56 @@
+import csv
+import numpy as np
+import pyarrow as pa
+from typing import Dict, Iterable
+
+from file_io.fast_reader import detect_delimiter, read_numeric_table
+
+def read_numeric_columns(file_path: str, column_indices: Iterable[int], has_header: bool = True, row_aligned: bool = False, engine: str = "auto") -> Dict[int, np.ndarray]:
+    """
+    given a path to a csv file and the column indices to extract
+    return a columnar table mapping each index to a float64 array
+    parses the file once for every requested column
+    by default ignores empty strings and invalid text (same rules as get_numeric_column)
+    row_aligned keeps one entry per row instead, using nan for missing/invalid cells
+    engine "pyarrow" uses the multithreaded typed reader, "python" the csv module;
+    "auto" tries pyarrow and falls back to python on files arrow rejects
+    """
+    indices = list(column_indices)
+
+    if engine != "python":
+        try:
+            names, columns = read_numeric_table(file_path, indices, has_header=has_header)
+        except (pa.ArrowInvalid, IndexError):
+            if engine == "pyarrow":
+                raise
+        else:
+            table = {idx: columns[names[idx]] for idx in indices}
+            if not row_aligned:
+                table = {idx: values[~np.isnan(values)] for idx, values in table.items()}
+            return table
+
+    table = {idx: [] for idx in indices}
+    nan = float('nan')
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f, delimiter=detect_delimiter(file_path))
+        if has_header:
+            next(reader, None)
+
+        for row in reader:
+            row_len = len(row)
+            if row_aligned and row_len == 0:
+                continue
+            for idx in indices:
+                if row_len > idx:
+                    val = row[idx].strip()
+                    if val:
+                        try:
+                            table[idx].append(float(val))
+                            continue
+                        except ValueError:
+                            pass
+                if row_aligned:
+                    table[idx].append(nan)
+
+    return {idx: np.asarray(values, dtype=np.float64) for idx, values in table.items()}
@@ -1,13 +1,29 @@
 import csv
+import numpy as np
+import pyarrow as pa
 from typing import List
 
-def get_numeric_column(file_path: str, column_index: int, has_header: bool = True) -> List[float]:
+from file_io.fast_reader import read_numeric_table
+
+def get_numeric_column(file_path: str, column_index: int, has_header: bool = True, engine: str = "auto") -> List[float]:
     """
     given a path to a csv file and a column index
     return a list of floats for that specific column
     skips header if specified
     ignores empty strings and invalid text
+    engine "pyarrow" uses the multithreaded typed reader, "python" the csv module;
+    "auto" tries pyarrow and falls back to python on files arrow rejects
     """
+    if engine != "python":
+        try:
+            _, table = read_numeric_table(file_path, [column_index], has_header=has_header)
+        except (pa.ArrowInvalid, IndexError):
+            if engine == "pyarrow":
+                raise
+        else:
+            values = next(iter(table.values()))
+            return values[~np.isnan(values)].tolist()
+
     column_data = []
     with open(file_path, 'r', encoding='utf-8') as f:
         reader = csv.reader(f)
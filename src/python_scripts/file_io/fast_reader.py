@@ -0,0 +1,93 @@
+import csv
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+def detect_delimiter(file_path: str) -> str:
+    """
+    given a path to a csv/tsv file
+    return the field delimiter
+    trusts a .tsv/.tab extension, otherwise compares tabs vs commas in the first line
+    """
+    if file_path.endswith(('.tsv', '.tab')):
+        return '\t'
+    with open(file_path, 'r', encoding='utf-8') as f:
+        first_line = f.readline()
+    return '\t' if first_line.count('\t') > first_line.count(',') else ','
+
+def read_first_row(file_path: str) -> List[str]:
+    """
+    given a path to a csv/tsv file
+    return the stripped fields of its first row
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        row = next(csv.reader(f, delimiter=detect_delimiter(file_path)), [])
+    return [field.strip() for field in row]
+
+def detect_header(file_path: str) -> bool:
+    """
+    given a path to a csv/tsv file
+    return True when the first row looks like column names
+    (any non-empty field that does not parse as a number)
+    """
+    for field in read_first_row(file_path):
+        if not field:
+            continue
+        try:
+            float(field)
+        except ValueError:
+            return True
+    return False
+
+def _to_float64(column: pa.ChunkedArray) -> np.ndarray:
+    """
+    given one parsed arrow column
+    return a writable float64 array with missing and unparsable cells as nan
+    """
+    if pa.types.is_integer(column.type) or pa.types.is_floating(column.type):
+        values = column.cast(pa.float64()).to_numpy(zero_copy_only=False)
+        # zero-copy views of arrow buffers are read-only; callers scale in place
+        return values if values.flags.writeable else values.copy()
+    if pa.types.is_null(column.type):
+        return np.full(len(column), np.nan)
+    values = pd.Series(column.to_numpy(zero_copy_only=False), dtype=object).str.strip()
+    return pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64)
+
+def read_numeric_table(file_path: str, columns: Optional[Sequence[Union[int, str]]] = None, has_header: Optional[bool] = None, use_threads: bool = True, block_size: Optional[int] = None) -> Tuple[List[str], Dict[str, np.ndarray]]:
+    """
+    given a path to a csv/tsv file and optional column indices or names
+    return (all column names, {name: float64 array}) for the requested columns
+    parsed by pyarrow's multithreaded block reader straight into typed buffers
+    has_header=None auto-detects; without a header columns are named col_<i>
+    missing or invalid cells become nan, so every array has one entry per row
+    raises pyarrow.ArrowInvalid on ragged rows the arrow reader cannot parse
+    """
+    delimiter = detect_delimiter(file_path)
+    if has_header is None:
+        has_header = detect_header(file_path)
+
+    if has_header:
+        names = read_first_row(file_path)
+        read_options = pa_csv.ReadOptions(use_threads=use_threads, column_names=names, skip_rows=1)
+    else:
+        names = [f"col_{i}" for i in range(len(read_first_row(file_path)))]
+        read_options = pa_csv.ReadOptions(use_threads=use_threads, column_names=names)
+    if block_size:
+        read_options.block_size = block_size
+
+    if columns is None:
+        selected = list(names)
+    else:
+        selected = [names[c] if isinstance(c, int) else c for c in columns]
+
+    parse_options = pa_csv.ParseOptions(delimiter=delimiter)
+    # no boolean inference: true/false cells are invalid, as in the python engine.
+    # a bad cell in a later block does not need a re-read: the table reader
+    # widens the column's inferred type (to string) across blocks
+    convert_options = pa_csv.ConvertOptions(include_columns=selected, true_values=[], false_values=[])
+    table = pa_csv.read_csv(file_path, read_options=read_options, parse_options=parse_options,
+                            convert_options=convert_options)
+
+    return names, {name: _to_float64(table.column(name)) for name in selected}
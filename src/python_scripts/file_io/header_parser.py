@@ -1,11 +1,15 @@
-import csv
 from typing import Dict, List
 
+from file_io.fast_reader import read_first_row
+
 def get_column_mapping(file_path: str) -> Dict[int, str]:
-    with open(file_path, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        headers = next(reader, [])
-    return {i: name.strip() for i, name in enumerate(headers) if name.strip()}
+    """
+    given a path to a csv or tsv file
+    return {column index: header name} for every non-empty header
+    the delimiter is detected by the fast reader
+    """
+    headers = read_first_row(file_path)
+    return {i: name for i, name in enumerate(headers) if name}
 
 def detect_target_column(file_path: str) -> str:
     """
@@ -0,0 +1,24 @@
+import os
+import pandas as pd
+
+def write_leaderboard(results_df: pd.DataFrame, output_path: str) -> None:
+    """
+    given the leaderboard dataframe and a .json or .parquet path
+    write it as structured data (one record per model)
+    so downstream steps never have to scrape the html report
+    """
+    if output_path.endswith('.parquet'):
+        results_df.to_parquet(output_path, index=False)
+    else:
+        results_df.to_json(output_path, orient='records', indent=2)
+
+def read_leaderboard(results_path: str) -> pd.DataFrame:
+    """
+    given a path written by write_leaderboard
+    return the leaderboard dataframe
+    """
+    if not os.path.exists(results_path):
+        raise FileNotFoundError(results_path)
+    if results_path.endswith('.parquet'):
+        return pd.read_parquet(results_path)
+    return pd.read_json(results_path, orient='records')
@@ -1,4 +1,7 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from typing import List
 
 def write_kaggle_submission(test_ids: List[int], predictions: List[float], output_path: str) -> None:
@@ -12,3 +15,42 @@ def write_kaggle_submission(test_ids: List[int], predictions: List[float], outpu
         "smoking": predictions
     })
     df.to_csv(output_path, index=False)
+
+class SubmissionWriter:
+    """
+    incremental (id, smoking) writer for batched scoring
+    .parquet paths append one row group per batch, anything else appends csv rows
+    in the same format as write_kaggle_submission
+    use as a context manager; the header/schema is written even with no batches
+    """
+
+    def __init__(self, output_path: str):
+        self.output_path = output_path
+        self.is_parquet = output_path.endswith('.parquet')
+        self._handle = None
+        self.rows_written = 0
+
+    def __enter__(self) -> "SubmissionWriter":
+        if self.is_parquet:
+            schema = pa.schema([("id", pa.int64()), ("smoking", pa.float64())])
+            self._handle = pq.ParquetWriter(self.output_path, schema)
+        else:
+            self._handle = open(self.output_path, 'w', newline='')
+            self._handle.write("id,smoking\n")
+        return self
+
+    def write(self, ids: np.ndarray, predictions: np.ndarray) -> None:
+        """
+        given one batch of ids and probabilities
+        append them to the output
+        """
+        if self.is_parquet:
+            table = pa.table({"id": np.asarray(ids, dtype=np.int64),
+                              "smoking": np.asarray(predictions, dtype=np.float64)})
+            self._handle.write_table(table)
+        else:
+            pd.DataFrame({"id": ids, "smoking": predictions}).to_csv(self._handle, header=False, index=False)
+        self.rows_written += len(ids)
+
+    def __exit__(self, *exc_info) -> None:
+        self._handle.close()
@@ -1,23 +1,75 @@
+import numpy as np
 import pandas as pd
 import os
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from io.submission_writer import write_kaggle_submission
+from file_io.batch_reader import iter_row_batches
+from file_io.submission_writer import SubmissionWriter
+from scaling.preprocessing_artifact import load_preprocessing_artifact, apply_preprocessing
+from training.prediction_store import PredictionStore
 
-def create_submission(model, test_csv_path: str, output_path: str):
+def score_batch(model: Any, batch: pd.DataFrame, artifact: Optional[Dict[str, Any]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    given a model, one raw batch and an optional preprocessing artifact
+    return (ids, smoking probabilities) for the batch
+    """
+    if artifact is not None:
+        X = apply_preprocessing(batch, artifact).to_numpy()
+    else:
+        X = batch.drop(columns=['id']).to_numpy()
+    return batch['id'].to_numpy(), model.predict_proba(X)[:, 1]
+
+def iter_scored_batches(model: Any, test_path: str, batch_size: int, artifact: Optional[Dict[str, Any]] = None, n_threads: int = 1) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    given a model, a csv/parquet test file and a batch size
+    yield (ids, probabilities) per row batch, in file order
+    n_threads > 1 scores batches on a thread pool with at most
+    2 * n_threads batches in flight, so memory stays bounded
+    """
+    batches = iter_row_batches(test_path, batch_size)
+    if n_threads <= 1:
+        for batch in batches:
+            yield score_batch(model, batch, artifact)
+        return
+
+    with ThreadPoolExecutor(max_workers=n_threads) as pool:
+        pending = deque()
+        for batch in batches:
+            pending.append(pool.submit(score_batch, model, batch, artifact))
+            if len(pending) >= 2 * n_threads:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def create_submission(model, test_csv_path: str, output_path: str, artifact_path: str = None, prediction_store: PredictionStore = None, model_name: str = None, batch_size: int = 100_000, n_threads: int = 1):
     """
     given a trained model and test csv
     predict probabilities for 'smoking'
     save as kaggle-ready csv
+    artifact_path applies the train-time scaling/imputation/features
+    so test rows match what the model saw
+    prediction_store + model_name also cache the test probabilities for blending
+    the test file (csv or parquet) is scored in batches of batch_size rows,
+    optionally on n_threads threads, and appended to output_path (.csv or .parquet)
     """
-    test_df = pd.read_csv(test_csv_path)
-    test_ids = test_df['id'].tolist()
-    
-    # Ensure features match what the model saw
-    X_test = test_df.drop(columns=['id']).values
-    
-    probs = model.predict_proba(X_test)[:, 1]
-    
-    write_kaggle_submission(test_ids, probs, output_path)
+    artifact = load_preprocessing_artifact(artifact_path) if artifact_path else None
+    keep = prediction_store is not None
+    all_ids, all_probs = [], []
+
+    with SubmissionWriter(output_path) as writer:
+        for ids, probs in iter_scored_batches(model, test_csv_path, batch_size, artifact, n_threads):
+            writer.write(ids, probs)
+            if keep:
+                all_ids.append(ids)
+                all_probs.append(probs)
+
+    if keep:
+        # the store needs the whole vector; ids + probs are 16 bytes per row
+        prediction_store.save_test(model_name or type(model).__name__,
+                                   np.concatenate(all_probs) if all_probs else np.empty(0),
+                                   row_ids=np.concatenate(all_ids) if all_ids else np.empty(0, dtype=np.int64))
     print(f"Submission saved to {output_path}")
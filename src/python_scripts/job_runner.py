@@ -0,0 +1,64 @@
+import os
+import json
+from typing import Any, Dict, List, Optional
+from threadpoolctl import threadpool_limits
+
+from pipeline_api import run_pipeline
+from training.model_registry import get_model_spec, list_models
+
+# model ids sent by the web UI (index.html) -> registry names
+UI_MODEL_ALIASES = {
+    "logreg": "logistic_model", "svm": "svm_model", "rf": "rf_model",
+    "gbm": "gbm_model", "xgb": "xgboost_model", "ridge": "linear_model",
+    "nb": "nb_model", "mlp": "deep_learning_model", "tabnet": "tabnet_model",
+    "ftt": "transformer_model",
+}
+
+def resolve_models(mode: str, models: str) -> List[str]:
+    """
+    given the run mode ("auto" | "manual") and the submitted model list
+    (json array or comma separated, UI ids or registry names)
+    return registry model names; auto mode skips the heavy models
+    raises ValueError on names that are not registered
+    """
+    if mode == "auto":
+        return [name for name in list_models() if get_model_spec(name).cost != "heavy"]
+
+    try:
+        requested = json.loads(models)
+    except json.JSONDecodeError:
+        requested = models.split(',')
+    if isinstance(requested, str):
+        requested = [requested]
+    names = [UI_MODEL_ALIASES.get(m.strip(), m.strip()) for m in requested if m.strip()]
+
+    unknown = [n for n in names if n not in list_models()]
+    if unknown or not names:
+        raise ValueError(f"unknown models: {', '.join(unknown) or '(none selected)'}")
+    return names
+
+def find_input_files(paths: List[str]) -> Dict[str, Optional[str]]:
+    """
+    given uploaded file paths
+    return {"train": path, "test": path or None} matched by file name
+    """
+    train = next((p for p in paths if "train" in os.path.basename(p).lower()), None)
+    test = next((p for p in paths if "test" in os.path.basename(p).lower()), None)
+    if train is None:
+        raise ValueError("no training file uploaded (file name must contain 'train')")
+    return {"train": train, "test": test}
+
+def run_job(job_dir: str, input_paths: List[str], model_modules: List[str], n_threads: Optional[int] = None) -> Dict[str, Any]:
+    """
+    given a job directory, its uploaded files and the model modules to run
+    run the in-process pipeline (pipeline_api.run_pipeline) with job_dir as its workspace
+    return the leaderboard records and the paths of the written results
+    runs in a job worker process, never on the api event loop
+    n_threads caps the job's cores: blas/openmp pools via threadpoolctl (the
+    libraries are already loaded, so env vars would come too late) and every
+    model's n_jobs-style params
+    """
+    inputs = find_input_files(input_paths)
+    with threadpool_limits(limits=n_threads):
+        return run_pipeline(job_dir, inputs["train"], inputs["test"], model_modules,
+                            num_threads=n_threads or 1, model_threads=n_threads)
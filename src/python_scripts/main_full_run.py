@@ -1,31 +1,72 @@
 import sys, os; sys.path.append(os.path.join(os.getcwd(), 'src/cpp_engine'))
 import os
 import sys
-import pandas as pd
-import importlib
-from visualization.dashboard import generate_html_report
-from training.blender import blend_smart_weighted
-from training.compare_models import compare_all_models
+import argparse
+from typing import List, Optional
+from training.model_registry import get_model_spec, list_models
+
+# pandas/sklearn and the pipeline modules are imported inside run_all_and_report,
+# so --help and argument errors don't pay for them
+
+def run_all_and_report(n_workers: int = 1, models: Optional[List[str]] = None, n_resamples: int = 1000, ci_alpha: float = 0.05, early_stopping_rounds: Optional[int] = 50):
+    import pandas as pd
+    from visualization.dashboard import generate_html_report
+    from visualization.plotting_engine import save_model_visuals
+    from visualization.render_queue import RenderQueue
+    from evaluation.bootstrap import add_bootstrap_ci
+    from file_io.results_store import write_leaderboard
+    from training.blender import blend_smart_weighted
+    from training.compare_models import compare_all_models
+    from training.prediction_store import PredictionStore
+    from training.results_cache import ResultsCache
 
-def run_all_and_report():
     print("🚀 Starting BioBeat ML Pipeline...")
-    parquet_path = "data/processed/train.parquet"
+    parquet_path = "data/processed/train_standardized_cpp.parquet"
     output_subs = "data/processed/submissions"
     report_path = "data/processed/model_report.html"
+    results_path = "data/processed/model_results.json"
+    figures_dir = "data/processed/figures"
+    store = PredictionStore("data/processed/predictions")
+    cache = ResultsCache("data/processed/results_cache")
 
     df = pd.read_parquet(parquet_path)
     X = df.drop(columns=['smoking']).values
     y = df['smoking'].values
 
     # 1. Generate metrics and comparison
-    comparison_df = compare_all_models(X, y)
-    
-    # 2. Save the HTML report first (The Blender will read this)
-    generate_html_report(comparison_df, report_path)
+    model_modules = [get_model_spec(name).module for name in models] if models else None
+    comparison_df = compare_all_models(X, y, n_workers=n_workers, model_modules=model_modules,
+                                       prediction_store=store, cache=cache,
+                                       early_stopping_rounds=early_stopping_rounds)
     
-    # 3. Finalize and run Smart Blender
-    blend_smart_weighted(output_subs, report_path, f"{output_subs}/blended_final_submission.csv")
+    if n_resamples > 0:
+        comparison_df = add_bootstrap_ci(comparison_df, store, n_resamples, ci_alpha, n_workers=n_workers)
+
+    # 2. Save the structured results (the Blender reads these) and the HTML report
+    write_leaderboard(comparison_df, results_path)
+    generate_html_report(comparison_df, report_path, ci_alpha)
+
+    # 3. Queue the per-model figures; they render in the background while blending runs
+    os.makedirs(figures_dir, exist_ok=True)
+    queue = RenderQueue(n_workers=1)
+    y_oof = store.load_target()
+    stored = set(store.list_models("oof"))
+    for name in comparison_df['model']:
+        if name in stored:
+            save_model_visuals(y_oof, store.load("oof", name), name, figures_dir, queue=queue)
+
+    # 4. Finalize and run Smart Blender
+    blend_smart_weighted(output_subs, results_path, f"{output_subs}/blended_final_submission.csv",
+                         prediction_store=store)
+    queue.wait()
     print("✅ Full Pipeline Run Successful.")
 
 if __name__ == "__main__":
-    run_all_and_report()
+    parser = argparse.ArgumentParser(description="Run the model gauntlet, report and blend")
+    parser.add_argument("--models", nargs="+", choices=list_models(), help="subset of registered models to run")
+    parser.add_argument("--workers", type=int, default=1, help="process-pool workers for (model, fold) jobs")
+    parser.add_argument("--bootstrap", type=int, default=1000, help="bootstrap resamples per model for the CI columns (0 = off)")
+    parser.add_argument("--early-stopping", type=int, default=50, help="patience for models that support early stopping (0 = train every round)")
+    args = parser.parse_args()
+    run_all_and_report(n_workers=args.workers, models=args.models, n_resamples=args.bootstrap,
+                       early_stopping_rounds=args.early_stopping or None)
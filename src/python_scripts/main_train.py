@@ -1,34 +1,38 @@
 import pandas as pd
 import os
-from io.csv_to_parquet import convert_to_parquet
-from training.compare_models import compare_all_models
+from training.compare_models import compare_all_models, get_module_map
 from generate_submission import create_submission
-import importlib
+from scaling.preprocessing_artifact import get_artifact_path
+from training.prediction_store import PredictionStore
+from training.model_registry import build_model
+from training.early_stopping import refit_with_best_iterations
 
 def main():
-    # 1. Convert to Parquet for speed
-    convert_to_parquet("data/processed/train_standardized_cpp.csv", "data/processed/train.parquet")
-    
-    # 2. Load and Prepare
-    df = pd.read_parquet("data/processed/train.parquet")
+    # 1. Load the parquet written directly by run_preprocessing (no csv round trip)
+    df = pd.read_parquet("data/processed/train_standardized_cpp.parquet")
     y = df['smoking'].values # Assuming 'smoking' is the target
     X = df.drop(columns=['smoking']).values
     
-    # 3. Compare Models
-    comparison_df = compare_all_models(X, y)
+    # 2. Compare Models
+    store = PredictionStore("data/processed/predictions")
+    best_iterations = {}
+    comparison_df = compare_all_models(X, y, prediction_store=store, early_stopping_rounds=50,
+                                       best_iterations=best_iterations)
     print("\n--- Model Comparison Table ---")
     print(comparison_df)
     
-    # 4. Train best model on 100% data
+    # 3. Train best model on 100% data
     best_model_name = comparison_df.iloc[0]['model']
     print(f"\nWinner: {best_model_name}. Training final model...")
     
-    best_mod = importlib.import_module(f"models.{best_model_name}")
-    final_model = best_mod.get_model() if hasattr(best_mod, 'get_model') else best_mod.get_xgboost_classifier()
-    final_model.fit(X, y)
+    final_model = build_model(get_module_map()[best_model_name])
+    # boosted winners train for the median rounds their folds kept
+    refit_with_best_iterations(final_model, X, y, best_iterations.get(best_model_name, []))
     
-    # 5. Generate Submission
-    create_submission(final_model, "data/raw/test.csv", "data/processed/submission.csv")
+    # 4. Generate Submission
+    artifact_path = get_artifact_path("data/processed/train_standardized_cpp.csv")
+    create_submission(final_model, "data/raw/test.csv", "data/processed/submission.csv", artifact_path,
+                      prediction_store=store, model_name=best_model_name)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,143 @@
+import os
+import sys
+import json
+import hashlib
+import importlib
+import subprocess
+import pandas as pd
+from typing import Any, Dict, List, Optional
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+CPP_ENGINE_DIR = os.path.join(os.path.dirname(SCRIPTS_DIR), "cpp_engine")
+EXTENSION_MODULES = ("biobeat_scaling", "biobeat_cleaning")
+PROCESSED_NAME = "train_standardized_cpp.csv"
+
+if CPP_ENGINE_DIR not in sys.path:
+    sys.path.append(CPP_ENGINE_DIR)
+
+# the pipeline modules import the compiled extensions at import time,
+# so they are imported inside the functions below, after ensure_extensions_built()
+
+def ensure_extensions_built() -> bool:
+    """
+    make sure the compiled c++ extensions are importable
+    compiles them (setup.py build_ext --inplace) only when an import fails
+    return True if a build was needed
+    """
+    try:
+        for name in EXTENSION_MODULES:
+            importlib.import_module(name)
+        return False
+    except ImportError:
+        subprocess.run([sys.executable, "setup.py", "build_ext", "--inplace"], cwd=CPP_ENGINE_DIR, check=True)
+        importlib.invalidate_caches()
+        for name in EXTENSION_MODULES:
+            importlib.import_module(name)
+        return True
+
+def get_file_digest(path: str) -> str:
+    """
+    given a file path
+    return the sha1 hex digest of its bytes
+    """
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def preprocess(train_path: str, processed_dir: str, num_threads: int = 1) -> str:
+    """
+    given a raw training file and an output dir
+    run the preprocessing pipeline unless processed_dir already holds the
+    parquet + artifact fitted on a byte-identical file
+    return the processed parquet path
+    """
+    from run_preprocessing import run_full_pipeline
+    from scaling.preprocessing_artifact import get_artifact_path
+
+    ensure_extensions_built()
+    final_csv = os.path.join(processed_dir, PROCESSED_NAME)
+    parquet_path = os.path.splitext(final_csv)[0] + ".parquet"
+    source_path = os.path.splitext(final_csv)[0] + "_source.json"
+    digest = get_file_digest(train_path)
+
+    if os.path.exists(parquet_path) and os.path.exists(get_artifact_path(final_csv)) and os.path.exists(source_path):
+        with open(source_path) as f:
+            if json.load(f).get("sha1") == digest:
+                return parquet_path
+
+    run_full_pipeline(train_path, processed_dir, PROCESSED_NAME, num_threads=num_threads)
+    with open(source_path, 'w') as f:
+        json.dump({"source": os.path.abspath(train_path), "sha1": digest}, f)
+    return parquet_path
+
+def run_pipeline(workspace: str, train_path: str, test_path: Optional[str] = None, model_modules: Optional[List[str]] = None, n_workers: int = 1, num_threads: int = 1, model_threads: Optional[int] = None, n_resamples: int = 1000, ci_alpha: float = 0.05, early_stopping_rounds: Optional[int] = 50) -> Dict[str, Any]:
+    """
+    given a workspace dir, the raw train (and optional test) file and the models to run
+    preprocess, run the gauntlet, write the leaderboard (json + html)
+    and score the test file with the winning model, all under workspace/processed
+    fitted preprocessing and per-(model, fold) results are cached in the workspace,
+    so re-running on unchanged data only trains new or changed models
+    model_threads caps each model's own thread params (n_jobs etc.; default: the model's)
+    n_resamples bootstrap resamples per model for the leaderboard intervals (0 skips them)
+    early_stopping_rounds lets models registered with supports_early_stopping stop on
+    each fold, and the winner is refit for the median kept rounds (None trains in full)
+    return the leaderboard records and the paths of everything written
+    """
+    from generate_submission import create_submission
+    from evaluation.bootstrap import add_bootstrap_ci
+    from file_io.results_store import write_leaderboard
+    from scaling.preprocessing_artifact import get_artifact_path
+    from training.compare_models import compare_all_models, get_module_map
+    from training.early_stopping import refit_with_best_iterations
+    from training.model_registry import build_model
+    from training.prediction_store import PredictionStore
+    from training.results_cache import ResultsCache
+    from training.scheduler import limit_model_threads
+    from visualization.dashboard import generate_html_report
+
+    ensure_extensions_built()
+    processed_dir = os.path.join(workspace, "processed")
+    parquet_path = preprocess(train_path, processed_dir, num_threads)
+
+    df = pd.read_parquet(parquet_path)
+    y = df['smoking'].values
+    X = df.drop(columns=['smoking']).values
+
+    store = PredictionStore(os.path.join(processed_dir, "predictions"))
+    cache = ResultsCache(os.path.join(workspace, "results_cache"))
+    best_iterations = {}
+    leaderboard = compare_all_models(X, y, n_workers=n_workers, threads_per_model=model_threads,
+                                     model_modules=model_modules, prediction_store=store, cache=cache,
+                                     early_stopping_rounds=early_stopping_rounds, best_iterations=best_iterations)
+    if leaderboard.empty:
+        raise RuntimeError("no model finished cross-validation")
+
+    if n_resamples > 0:
+        leaderboard = add_bootstrap_ci(leaderboard, store, n_resamples, ci_alpha, n_workers=n_workers)
+
+    results_path = os.path.join(processed_dir, "model_results.json")
+    report_path = os.path.join(processed_dir, "model_report.html")
+    write_leaderboard(leaderboard, results_path)
+    generate_html_report(leaderboard, report_path, ci_alpha)
+
+    submission_path = None
+    if test_path:
+        best_model_name = leaderboard.iloc[0]['model']
+        # leaderboard names are module tails; rebuild from the full module path
+        final_model = build_model(get_module_map(model_modules)[best_model_name])
+        if model_threads:
+            limit_model_threads(final_model, model_threads)
+        refit_with_best_iterations(final_model, X, y, best_iterations.get(best_model_name, []))
+        submission_path = os.path.join(processed_dir, "submission.csv")
+        create_submission(final_model, test_path, submission_path,
+                          get_artifact_path(os.path.join(processed_dir, PROCESSED_NAME)),
+                          prediction_store=store, model_name=best_model_name)
+
+    return {
+        "leaderboard": leaderboard.to_dict(orient="records"),
+        "results": results_path,
+        "report": report_path,
+        "submission": submission_path,
+    }
@@ -1,21 +1,114 @@
 import sys
 import os
+import pandas as pd
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 # Add the script's parent directory to path to allow absolute-style imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from file_io.csv_reader import get_numeric_column
+from file_io.columnar_reader import read_numeric_columns
 from file_io.csv_writer import write_single_column
-from cleaning.impute_strategy import get_clean_median
-from scaling.standardize import get_scaling_parameters, scale_column
+from file_io.batch_reader import iter_numeric_batches, iter_row_batches
+from cleaning.impute_strategy import get_clean_median, fill_invalid_inplace, impute_median_inplace
+from scaling.standardize import get_matrix_scaling_parameters, get_scaling_parameters, scale_column
+from scaling.streaming_scaler import StreamingScaler
+from engineering.feature_spec import FeatureSpec
+from engineering.interactions import apply_feature_engineering
 
-def process_single_feature(input_csv: str, output_csv: str, col_index: int, header: str) -> None:
+def process_single_feature(input_csv: str, output_csv: str, col_index: int, header: str) -> Dict[str, float]:
     """
     given input, output, index, and header
     process column via C++ scaling engine
+    return the column's mean/std/median
     """
     raw_data = get_numeric_column(input_csv, col_index)
     mean, std = get_scaling_parameters(raw_data)
     scaled_data = scale_column(raw_data, mean, std)
     write_single_column(output_csv, scaled_data, header)
+    return {"mean": mean, "std": std, "median": get_clean_median(raw_data)}
+
+def get_label_array(values: np.ndarray) -> np.ndarray:
+    """
+    given a parsed float64 label column
+    return it as int64 when every cell is a whole number (as pandas would read it)
+    """
+    if np.isfinite(values).all() and np.array_equal(values, np.round(values)):
+        return values.astype(np.int64)
+    return values
+
+def process_feature_table(input_csv: str, col_mapping: Dict[int, str], num_threads: int = 1, target_index: Optional[int] = None) -> Tuple[Dict[str, np.ndarray], Dict[str, Dict[str, float]], Optional[np.ndarray]]:
+    """
+    given input path and an index -> header mapping
+    parse the raw csv once into one contiguous (rows x features) matrix (nan placeholders)
+    mean/std of every column come from one fused c++ sweep over the valid cells
+    (same values as the per-column path up to summation order)
+    invalid cells are imputed in place with the column median, then scaled
+    target_index reads the label column in the same parse (unscaled)
+    return the scaled columns (header -> float64 column view, in mapping order),
+    per-column mean/std/median/n_imputed, and the target (None if not requested)
+    num_threads is passed through to the c++ kernels
+    """
+    read_indices = list(col_mapping) + ([target_index] if target_index is not None else [])
+    table = read_numeric_columns(input_csv, read_indices, row_aligned=True)
+    target = get_label_array(table.pop(target_index)) if target_index is not None else None
+    headers = list(col_mapping.values())
+    n_rows = len(next(iter(table.values()))) if table else 0
+
+    matrix = np.empty((n_rows, len(headers)), dtype=np.float64)
+    for k, col_index in enumerate(col_mapping):
+        matrix[:, k] = table.pop(col_index)
+
+    means, stds = get_matrix_scaling_parameters(matrix, num_threads)
+    # one c++ call finds each column's median and fills its invalid cells
+    n_imputed, medians = impute_median_inplace(matrix, num_threads)
+    matrix -= means
+    matrix /= stds
+
+    scaled_columns = {header: matrix[:, k] for k, header in enumerate(headers)}
+    column_stats = {
+        header: {"mean": float(means[k]), "std": float(stds[k]), "median": float(medians[k]), "n_imputed": int(n_imputed[k])}
+        for k, header in enumerate(headers)
+    }
+    return scaled_columns, column_stats, target
+
+def process_in_batches(input_path: str, output_parquet: str, feature_columns: List[str], target_col: str = None, batch_size: int = 100_000, num_threads: int = 1, feature_spec: FeatureSpec = None) -> StreamingScaler:
+    """
+    given a csv/parquet input, output parquet path, and feature column names
+    pass 1 fits a streaming scaler over bounded row batches
+    pass 2 scales, engineers, and appends each batch to the parquet file
+    memory stays at one batch regardless of file size
+    invalid cells are imputed with the running mean (rows are never dropped)
+    feature_spec selects the engineered features (default: DEFAULT_FEATURE_SPEC)
+    return the fitted scaler
+    """
+    scaler = StreamingScaler(num_threads=num_threads)
+    for batch in iter_numeric_batches(input_path, batch_size, feature_columns):
+        scaler.partial_fit(batch.to_numpy())
+
+    read_columns = feature_columns + ([target_col] if target_col else [])
+    writer = None
+    try:
+        for batch in iter_row_batches(input_path, batch_size, read_columns):
+            numeric = batch[feature_columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+            scaled = scaler.transform(numeric)
+            # z-score of the column mean is 0, so imputing after scaling is a zero fill
+            fill_invalid_inplace(scaled, np.zeros(len(feature_columns)), num_threads)
+            df = pd.DataFrame(scaled, columns=feature_columns)
+            df = apply_feature_engineering(df, feature_spec)
+            if target_col:
+                df[target_col] = batch[target_col].to_numpy()
+
+            if writer is None:
+                schema = pa.Schema.from_pandas(df, preserve_index=False)
+                writer = pq.ParquetWriter(output_parquet, schema)
+            writer.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False))
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return scaler
@@ -7,35 +7,100 @@ from pathlib import Path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from file_io.header_parser import get_column_mapping
 from file_io.column_combiner import combine_columns_to_csv
-from process_dataset import process_single_feature
+from file_io.csv_writer import write_single_column
+from file_io.batch_reader import get_table_columns
+from file_io.columnar_reader import read_numeric_columns
+from process_dataset import get_label_array, process_single_feature, process_feature_table, process_in_batches
+from engineering.feature_spec import DEFAULT_FEATURE_SPEC, FeatureSpec, resolve_spec
 from engineering.interactions import apply_feature_engineering
+from scaling.preprocessing_artifact import get_artifact_path, save_preprocessing_artifact
 
-def run_full_pipeline(raw_csv_path: str, output_dir: str, final_csv_name: str) -> None:
+NON_FEATURE_COLUMNS = ["id", "smoking", "diagnosed_diabetes"]
+
+def run_full_pipeline(raw_csv_path: str, output_dir: str, final_csv_name: str, single_pass: bool = True, num_threads: int = 1, batch_size: int = None, write_intermediates: bool = False, feature_spec: FeatureSpec = None) -> None:
+    """
+    given a raw csv, an output dir, and the combined csv name
+    scale every feature column, engineer interactions, save parquet
+    single_pass parses the raw csv once into a row-aligned columnar table,
+    median-imputes invalid cells, and goes straight to parquet in memory
+    (write_intermediates also dumps the temp_<header>.csv files and the
+    combined csv for debugging); otherwise each column re-reads the raw csv,
+    drops invalid cells, and round-trips through text files (legacy path,
+    same output on clean data)
+    batch_size streams csv/parquet input in bounded row batches instead
+    (constant memory, parquet output only, invalid cells mean-imputed)
+    num_threads is used by the c++ kernels
+    feature_spec declares the engineered features (default: DEFAULT_FEATURE_SPEC)
+    the fitted per-column mean/std/median, engineered feature names and spec
+    are saved next to the parquet for reuse at inference time
+    """
     Path(output_dir).mkdir(parents=True, exist_ok=True)
-    col_mapping = get_column_mapping(raw_csv_path)
-    
-    processed_files = []
-    for col_index, header in col_mapping.items():
-        if header.lower() in ["id", "smoking", "diagnosed_diabetes"]:
-            continue
-        temp_out = os.path.join(output_dir, f"temp_{header}.csv")
-        process_single_feature(raw_csv_path, temp_out, col_index, header)
-        processed_files.append(temp_out)
-            
     final_out_path = os.path.join(output_dir, final_csv_name)
-    combine_columns_to_csv(processed_files, final_out_path)
-    
-    # Load combined data and apply feature engineering
-    df = pd.read_csv(final_out_path)
-    df = apply_feature_engineering(df)
+
+    if batch_size:
+        columns = get_table_columns(raw_csv_path)
+        feature_columns = [c for c in columns if c.lower() not in NON_FEATURE_COLUMNS]
+        target_col = 'smoking' if 'smoking' in columns else None
+        parquet_path = os.path.splitext(final_out_path)[0] + '.parquet'
+        spec = resolve_spec(DEFAULT_FEATURE_SPEC if feature_spec is None else feature_spec, feature_columns)
+        scaler = process_in_batches(raw_csv_path, parquet_path, feature_columns, target_col, batch_size, num_threads, spec)
+        # an exact median is not streamable, so batched mode imputes with the mean
+        stds = scaler.std
+        column_stats = {
+            c: {"mean": scaler.mean[i], "std": stds[i], "median": scaler.mean[i]}
+            for i, c in enumerate(feature_columns)
+        }
+        engineered = [entry["name"] for entry in spec]
+        save_preprocessing_artifact(get_artifact_path(final_out_path), column_stats, engineered, spec)
+        print("✅ Preprocessing & Engineering Complete.")
+        return
+
+    col_mapping = get_column_mapping(raw_csv_path)
+    feature_mapping = {
+        col_index: header for col_index, header in col_mapping.items()
+        if header.lower() not in NON_FEATURE_COLUMNS
+    }
+
+    target_index = next((i for i, header in col_mapping.items() if header == 'smoking'), None)
+    target = None
+
+    if single_pass:
+        # in-memory: raw csv -> scaled columns (+ target, same parse) -> engineered frame -> parquet
+        scaled_columns, column_stats, target = process_feature_table(raw_csv_path, feature_mapping, num_threads, target_index)
+        if write_intermediates:
+            processed_files = []
+            for header, column in scaled_columns.items():
+                temp_out = os.path.join(output_dir, f"temp_{header}.csv")
+                write_single_column(temp_out, column.tolist(), header)
+                processed_files.append(temp_out)
+            combine_columns_to_csv(processed_files, final_out_path)
+        df = pd.DataFrame(scaled_columns)
+        del scaled_columns
+    else:
+        processed_files = []
+        column_stats = {}
+        for col_index, header in feature_mapping.items():
+            temp_out = os.path.join(output_dir, f"temp_{header}.csv")
+            column_stats[header] = process_single_feature(raw_csv_path, temp_out, col_index, header)
+            processed_files.append(temp_out)
+
+        combine_columns_to_csv(processed_files, final_out_path)
+        # round_trip parsing so the text detour doesn't perturb the last bit
+        df = pd.read_csv(final_out_path, float_precision='round_trip')
+
+    spec = resolve_spec(DEFAULT_FEATURE_SPEC if feature_spec is None else feature_spec, df.columns)
+    df = apply_feature_engineering(df, spec)
     
     # Add back the labels/IDs (Assuming they are needed for training)
     # This is a critical step for your specific Kaggle dataset
-    raw_df = pd.read_csv(raw_csv_path)
-    if 'smoking' in raw_df.columns:
-        df['smoking'] = raw_df['smoking']
+    if target_index is not None:
+        if target is None:
+            target = get_label_array(read_numeric_columns(raw_csv_path, [target_index], row_aligned=True)[target_index])
+        df['smoking'] = target
     
     df.to_parquet(final_out_path.replace('.csv', '.parquet'), index=False)
+    engineered = [entry["name"] for entry in spec]
+    save_preprocessing_artifact(get_artifact_path(final_out_path), column_stats, engineered, spec)
     print("✅ Preprocessing & Engineering Complete.")
 
 if __name__ == "__main__":
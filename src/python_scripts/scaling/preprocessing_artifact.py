@@ -0,0 +1,72 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional
+
+from engineering.feature_spec import DEFAULT_FEATURE_SPEC, FeatureSpec
+from engineering.interactions import apply_feature_engineering
+from cleaning.impute_strategy import fill_invalid_inplace
+
+def get_artifact_path(output_path: str) -> str:
+    """
+    given the path of a processed train file (csv or parquet)
+    return the path of its fitted preprocessing artifact
+    """
+    return os.path.splitext(output_path)[0] + "_preprocessing.npz"
+
+def save_preprocessing_artifact(path: str, column_stats: Dict[str, Dict[str, float]], engineered_features: List[str], feature_spec: Optional[FeatureSpec] = None) -> None:
+    """
+    given an output path, per-column {mean, std, median}, and engineered feature names
+    write a compact binary (.npz) artifact with the train-time parameters
+    column order is preserved so inference rebuilds the same matrix layout
+    feature_spec is the engineering spec that produced the features,
+    stored so inference evaluates exactly the same features
+    """
+    columns = list(column_stats.keys())
+    np.savez(
+        path,
+        columns=np.array(columns, dtype=str),
+        mean=np.array([column_stats[c]["mean"] for c in columns], dtype=np.float64),
+        std=np.array([column_stats[c]["std"] for c in columns], dtype=np.float64),
+        median=np.array([column_stats[c]["median"] for c in columns], dtype=np.float64),
+        features=np.array(json.dumps(engineered_features)),
+        feature_spec=np.array(json.dumps(feature_spec)),
+    )
+
+def load_preprocessing_artifact(path: str) -> Dict[str, Any]:
+    """
+    given a path written by save_preprocessing_artifact
+    return a dict of columns, mean, std, median arrays, feature names and feature spec
+    """
+    with np.load(path) as data:
+        features = json.loads(str(data["features"]))
+        # artifacts written before the spec was stored used the default features
+        spec = json.loads(str(data["feature_spec"])) if "feature_spec" in data.files else None
+        if spec is None:
+            spec = [entry for entry in DEFAULT_FEATURE_SPEC if entry["name"] in features]
+        return {
+            "columns": data["columns"].tolist(),
+            "mean": data["mean"],
+            "std": data["std"],
+            "median": data["median"],
+            "features": features,
+            "feature_spec": spec,
+        }
+
+def apply_preprocessing(df: pd.DataFrame, artifact: Dict[str, Any]) -> pd.DataFrame:
+    """
+    given a raw dataframe (e.g. the test set) and a loaded artifact
+    return the model-ready frame using the train-time parameters
+    invalid or missing cells are imputed with the train median,
+    then every column is scaled in one vectorized pass
+    """
+    columns = artifact["columns"]
+    X = np.ascontiguousarray(df[columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64))
+
+    fill_invalid_inplace(X, artifact["median"])
+    X -= artifact["mean"]
+    X /= artifact["std"]
+
+    out = apply_feature_engineering(pd.DataFrame(X, columns=columns, index=df.index), artifact["feature_spec"])
+    return out[columns + artifact["features"]]
@@ -1,26 +1,68 @@
 import biobeat_scaling
-from typing import List, Tuple
+import numpy as np
+from typing import Dict, List, Tuple, Union
 
-def get_scaling_parameters(column_data: List[float]) -> Tuple[float, float]:
+Column = Union[List[float], np.ndarray]
+
+def get_scaling_parameters(column_data: Column, num_threads: int = 1) -> Tuple[float, float]:
     """
-    given a list of numeric floats representing training data
+    given a list or float64 array representing training data
     return a tuple of (mean, standard_deviation)
-    calculated via c++ engine
+    calculated via c++ engine (arrays are read in place, not copied)
+    num_threads > 1 (or 0 for all cores) splits the sums across row chunks
     """
-    if not column_data:
+    if len(column_data) == 0:
         return (0.0, 1.0)
-        
-    mean = biobeat_scaling.calculate_mean(column_data)
-    std = biobeat_scaling.calculate_std(column_data, mean)
+
+    if isinstance(column_data, np.ndarray):
+        column_data = np.ascontiguousarray(column_data, dtype=np.float64)
+
+    mean = biobeat_scaling.calculate_mean(column_data, num_threads=num_threads)
+    std = biobeat_scaling.calculate_std(column_data, mean, num_threads=num_threads)
     return (mean, std)
 
-def scale_column(column_data: List[float], mean: float, std: float) -> List[float]:
+def scale_column(column_data: Column, mean: float, std: float, num_threads: int = 1) -> Column:
     """
-    given a list of numeric floats, mean, and std
-    return a new list of scaled values
+    given a list or float64 array, mean, and std
+    return new scaled values of the same container type
     applied via c++ engine
     """
-    if not column_data:
-        return []
-        
-    return biobeat_scaling.apply_standardization(column_data, mean, std)
+    if len(column_data) == 0:
+        return column_data[:0] if isinstance(column_data, np.ndarray) else []
+
+    if isinstance(column_data, np.ndarray):
+        column_data = np.ascontiguousarray(column_data, dtype=np.float64)
+
+    return biobeat_scaling.apply_standardization(column_data, mean, std, num_threads=num_threads)
+
+def scale_column_inplace(column_data: np.ndarray, mean: float, std: float, num_threads: int = 1) -> np.ndarray:
+    """
+    given a writable c-contiguous float64 array, mean, and std
+    overwrite it with the scaled values and return it
+    avoids allocating a second full-length buffer
+    """
+    if len(column_data) > 0:
+        biobeat_scaling.apply_standardization_inplace(column_data, mean, std, num_threads=num_threads)
+    return column_data
+
+def get_column_statistics(matrix: np.ndarray, with_median: bool = False, num_threads: int = 1) -> Dict[str, np.ndarray]:
+    """
+    given a 2-D (rows x features) numeric matrix
+    return per-column count, invalid_count, mean, variance, min, max
+    (plus median when requested) from one fused c++ sweep
+    nan/inf cells are counted as invalid and excluded
+    num_threads splits the columns into blocks across threads
+    """
+    matrix = np.ascontiguousarray(matrix, dtype=np.float64)
+    return biobeat_scaling.calculate_column_stats(matrix, with_median, num_threads)
+
+def get_matrix_scaling_parameters(matrix: np.ndarray, num_threads: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    given a 2-D (rows x features) numeric matrix
+    return (means, stds) arrays for every column in one c++ call
+    std falls back to 1.0 for empty or zero-variance columns
+    """
+    stats = get_column_statistics(matrix, num_threads=num_threads)
+    stds = np.sqrt(stats["variance"])
+    stds[(stats["count"] <= 1) | (stds == 0.0)] = 1.0
+    return stats["mean"], stds
@@ -0,0 +1,88 @@
+import numpy as np
+from typing import Iterable, Iterator, Optional
+
+from scaling.standardize import get_column_statistics
+
+class StreamingScaler:
+    """
+    out-of-core per-column standard scaler
+    partial_fit folds row chunks into running (count, mean, m2) moments
+    using the fused c++ stats kernel plus chan's parallel merge,
+    so memory stays constant and scalers fitted on separate shards merge exactly
+    nan/inf cells are skipped while fitting and stay nan when transformed
+    """
+
+    def __init__(self, num_threads: int = 1):
+        self.num_threads = num_threads
+        self.count: Optional[np.ndarray] = None
+        self.mean: Optional[np.ndarray] = None
+        self.m2: Optional[np.ndarray] = None
+
+    def partial_fit(self, chunk: np.ndarray) -> "StreamingScaler":
+        """
+        given a 2-D (rows x features) chunk
+        merge its column moments into the running statistics
+        """
+        chunk = np.asarray(chunk, dtype=np.float64)
+        if chunk.ndim == 1:
+            chunk = chunk.reshape(-1, 1)
+
+        stats = get_column_statistics(chunk, num_threads=self.num_threads)
+        count = stats["count"].astype(np.float64)
+        m2 = stats["variance"] * np.maximum(count - 1.0, 0.0)
+        self._merge_moments(count, stats["mean"], m2)
+        return self
+
+    def merge(self, other: "StreamingScaler") -> "StreamingScaler":
+        """
+        given a scaler fitted on another shard of the same columns
+        fold its moments into this one (order independent up to rounding)
+        """
+        if other.count is not None:
+            self._merge_moments(other.count, other.mean, other.m2)
+        return self
+
+    def _merge_moments(self, count: np.ndarray, mean: np.ndarray, m2: np.ndarray) -> None:
+        if self.count is None:
+            self.count, self.mean, self.m2 = count.copy(), mean.copy(), m2.copy()
+            return
+        if count.shape != self.count.shape:
+            raise ValueError(f"Expected {self.count.shape[0]} columns, got {count.shape[0]}.")
+
+        total = self.count + count
+        safe_total = np.where(total > 0, total, 1.0)
+        delta = mean - self.mean
+        self.mean = self.mean + delta * (count / safe_total)
+        self.m2 = self.m2 + m2 + delta * delta * (self.count * count / safe_total)
+        self.count = total
+
+    @property
+    def std(self) -> np.ndarray:
+        """
+        sample standard deviation per column
+        falls back to 1.0 for empty or zero-variance columns (same as the c++ engine)
+        """
+        if self.count is None:
+            raise ValueError("StreamingScaler has not been fitted.")
+        std = np.sqrt(self.m2 / np.maximum(self.count - 1.0, 1.0))
+        std[(self.count <= 1) | (std == 0.0)] = 1.0
+        return std
+
+    def transform(self, chunk: np.ndarray) -> np.ndarray:
+        """
+        given a 2-D (rows x features) chunk
+        return a new float64 array of z-scores
+        """
+        std = self.std
+        scaled = np.array(chunk, dtype=np.float64, order='C')
+        scaled -= self.mean
+        scaled /= std
+        return scaled
+
+    def transform_batches(self, chunks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """
+        given an iterable of row chunks
+        yield each chunk scaled, one at a time
+        """
+        for chunk in chunks:
+            yield self.transform(chunk)
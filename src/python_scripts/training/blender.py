@@ -1,50 +1,136 @@
 import pandas as pd
+import numpy as np
 import os
-from typing import Dict
+from scipy.optimize import nnls
+from scipy.stats import rankdata
+from typing import Dict, List, Optional, Tuple
 
-def blend_smart_weighted(submission_dir: str, report_path: str, output_path: str):
+from file_io.results_store import read_leaderboard
+from training.prediction_store import PredictionStore
+
+BLEND_METHODS = ("smart", "rank", "optimized")
+
+def get_smart_weights(scores: Dict[str, float], model_names: List[str]) -> np.ndarray:
+    """
+    given {model: auc} and the column order of the prediction matrix
+    return weights proportional to (AUC - 0.5)^2
+    models missing from the scores get weight 0
+    """
+    auc = np.array([scores.get(name, 0.5) for name in model_names], dtype=np.float64)
+    return (auc - 0.5) ** 2
+
+def fit_blend_weights(oof_matrix: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    given a rows x models out-of-fold matrix and the target
+    return non-negative weights fitted by least squares (nnls)
+    """
+    weights, _ = nnls(np.asarray(oof_matrix, dtype=np.float64), np.asarray(y, dtype=np.float64))
+    return weights
+
+def rank_transform(matrix: np.ndarray) -> np.ndarray:
+    """
+    given a rows x models prediction matrix
+    return per-column ranks scaled to (0, 1], ties averaged
+    """
+    return rankdata(matrix, axis=0) / matrix.shape[0]
+
+def blend_predictions(matrix: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    given a rows x models matrix and one weight per model
+    return the convex blend in a single matrix-vector product
+    falls back to equal weights when every weight is zero
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    total = weights.sum()
+    if total <= 0:
+        weights, total = np.ones_like(weights), float(len(weights))
+    return matrix @ (weights / total)
+
+def load_submission_matrix(submission_dir: str) -> Tuple[List[str], np.ndarray, np.ndarray]:
     """
-    reads the model_report.html to find AUC scores
-    calculates weights proportional to (AUC - baseline)
-    generates the ultimate weighted final submission
+    given a directory of <model>_submission.csv files
+    return (model names, ids, rows x models probability matrix)
     """
-    if not os.path.exists(report_path):
-        print("Model report not found. Defaulting to equal weights.")
+    sub_files = sorted(f for f in os.listdir(submission_dir) if f.endswith('.csv') and 'blended' not in f)
+    names = [f.replace('_submission.csv', '') for f in sub_files]
+    frames = [pd.read_csv(os.path.join(submission_dir, f)) for f in sub_files]
+    if not frames:
+        return [], np.empty(0), np.empty((0, 0))
+    matrix = np.column_stack([df['smoking'].to_numpy(dtype=np.float64) for df in frames])
+    return names, frames[0]['id'].to_numpy(), matrix
+
+def load_blend_matrix(submission_dir: str, prediction_store: Optional[PredictionStore] = None) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    given the submission csv dir and an optional prediction store
+    return (model names, ids, rows x models matrix) over every model found in either:
+    stored test predictions first, then models that only have a submission csv,
+    aligned to the store's row ids
+    raises ValueError when a csv does not cover the store's ids
+    """
+    if os.path.isdir(submission_dir):
+        names, ids, matrix = load_submission_matrix(submission_dir)
+    else:
+        names, ids, matrix = [], np.empty(0), np.empty((0, 0))
+    if prediction_store is None or not prediction_store.list_models("test"):
+        return names, ids, matrix
+
+    store_names, store_matrix = prediction_store.load_matrix("test")
+    store_ids = np.asarray(prediction_store.load_row_ids("test"))
+    csv_only = [k for k, name in enumerate(names) if name not in store_names]
+    if csv_only:
+        aligned = pd.DataFrame(matrix[:, csv_only], index=ids).reindex(store_ids)
+        if aligned.isna().to_numpy().any():
+            raise ValueError("submission csvs do not cover the prediction store's test ids")
+        store_matrix = np.column_stack([store_matrix, aligned.to_numpy()])
+        store_names = list(store_names) + [names[k] for k in csv_only]
+    return store_names, store_ids, store_matrix
+
+def blend_smart_weighted(submission_dir: str, results_path: str, output_path: str, method: str = "smart", prediction_store: Optional[PredictionStore] = None):
+    """
+    reads model AUCs from the structured leaderboard (json/parquet)
+    stacks every model's test predictions into one matrix
+    (stored predictions plus any model that only has a submission csv)
+    and writes the blended submission from one matrix-vector product
+    method: "smart" weights by (AUC - baseline)^2, "rank" averages the
+    rank-transformed predictions with the same weights, "optimized" fits
+    non-negative weights on the stored out-of-fold predictions
+    """
+    if method not in BLEND_METHODS:
+        raise ValueError(f"method must be one of {BLEND_METHODS}, got {method!r}")
+    if not os.path.exists(results_path):
+        print("Model results not found. Defaulting to equal weights.")
         return
-        
-    # Extract results from the HTML report (assuming it was generated by our dashboard.py)
-    # We use pandas read_html to scrape our own generated table
-    tables = pd.read_html(report_path)
-    report_df = tables[0]
-    
-    # Calculate weights based on AUC performance above a 0.5 baseline
-    # Higher AUC = Exponentially higher weight
-    report_df['weight'] = (report_df['auc'] - 0.5) ** 2
-    weights = dict(zip(report_df['model'], report_df['weight']))
-    
-    sub_files = [f for f in os.listdir(submission_dir) if f.endswith('.csv') and 'blended' not in f]
-    blended_df = None
-    total_weight = 0.0
-
-    for file in sub_files:
-        model_name = file.replace('_submission.csv', '')
-        weight = weights.get(model_name, 0.0) # 0 weight if model didn't make the report
-        
-        df = pd.read_csv(os.path.join(submission_dir, file))
-        if blended_df is None:
-            blended_df = df.copy()
-            blended_df['smoking'] = df['smoking'] * weight
-        else:
-            blended_df['smoking'] += df['smoking'] * weight
-        total_weight += weight
-
-    blended_df['smoking'] /= total_weight
-    blended_df.to_csv(output_path, index=False)
+
+    report_df = read_leaderboard(results_path)
+    scores = dict(zip(report_df['model'], report_df['auc']))
+
+    names, ids, matrix = load_blend_matrix(submission_dir, prediction_store)
+    if not names:
+        print("No model predictions found to blend.")
+        return
+
+    if method == "optimized":
+        if prediction_store is None:
+            raise ValueError("optimized blending needs a prediction_store with oof predictions")
+        missing = sorted(set(names) - set(prediction_store.list_models("oof")))
+        if missing:
+            raise ValueError(f"optimized blending needs oof predictions for {', '.join(missing)}")
+        _, oof_matrix = prediction_store.load_matrix("oof", names)
+        weights = fit_blend_weights(oof_matrix, prediction_store.load_target())
+    else:
+        weights = get_smart_weights(scores, names)
+
+    if method == "rank":
+        matrix = rank_transform(matrix)
+
+    blended = blend_predictions(matrix, weights)
+    pd.DataFrame({"id": ids, "smoking": blended}).to_csv(output_path, index=False)
     print(f"🏆 Smart Blended Submission saved: {output_path}")
 
 if __name__ == "__main__":
     blend_smart_weighted(
         "data/processed/submissions", 
-        "data/processed/model_report.html", 
-        "data/processed/submissions/blended_final_submission.csv"
+        "data/processed/model_results.json", 
+        "data/processed/submissions/blended_final_submission.csv",
+        prediction_store=PredictionStore("data/processed/predictions")
     )
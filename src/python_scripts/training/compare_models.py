@@ -1,39 +1,156 @@
 import pandas as pd
 import numpy as np
-import importlib
+from typing import Dict, List, Optional, Tuple, Union
 from training.cross_validation import run_5_fold_cv
-from evaluation.metrics import get_classification_metrics
+from training.early_stopping import get_model_rounds
+from training.fold_cache import FoldViews, get_fold_indices
+from training.prediction_store import PredictionStore
+from training.model_registry import COST_CLASSES, build_model, get_model_spec, list_models
+from training.results_cache import ResultsCache, get_dataset_key, get_model_key
+from training.scheduler import limit_model_threads, run_gauntlet_parallel
+from evaluation.metrics import get_cv_metrics
 
-def compare_all_models(X: np.ndarray, y: np.ndarray) -> pd.DataFrame:
+MODEL_MODULES = [get_model_spec(name).module for name in list_models()]
+
+def get_module_map(model_modules: Optional[List[str]] = None) -> Dict[str, str]:
+    """
+    given the model modules passed to compare_all_models (default: all registered)
+    return {leaderboard model name: module path} to rebuild a ranked model
+    """
+    return {m.split('.')[-1]: m for m in (model_modules or MODEL_MODULES)}
+
+def summarize_folds(module_name: str, cv_results: List[Tuple[np.ndarray, np.ndarray]]) -> Dict[str, float]:
+    """
+    given a model module name and its per-fold (y_val, y_prob) pairs
+    return the fold-mean metrics row for the leaderboard
+    """
+    # one batched sort over all folds; also sweeps thresholds for the best f1
+    fold_metrics = get_cv_metrics(cv_results)
+    mean_metrics = {name: float(np.mean(values)) for name, values in fold_metrics.items()}
+    mean_metrics["model"] = module_name.split('.')[-1]
+    return mean_metrics
+
+def assemble_oof(y: np.ndarray, cv_results: List[Tuple[np.ndarray, np.ndarray]]) -> np.ndarray:
+    """
+    given the target and per-fold (y_val, y_prob) pairs in fold order
+    return one out-of-fold probability per training row
+    """
+    oof = np.empty(len(y), dtype=np.float64)
+    for (_, val_index), (_, y_prob) in zip(get_fold_indices(y), cv_results):
+        oof[val_index] = y_prob
+    return oof
+
+def rank_results(results: List[Dict[str, float]]) -> pd.DataFrame:
+    """
+    given leaderboard rows
+    return them as a dataframe ranked by AUC (empty when every model failed)
+    """
+    df = pd.DataFrame(results)
+    return df.sort_values(by="auc", ascending=False) if not df.empty else df
+
+def load_cached_folds(cache: ResultsCache, dataset_key: str, model_key: Optional[str], n_splits: int = 5, fold_iterations: Optional[Dict[int, int]] = None) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+    """
+    given a results cache and the dataset/model keys
+    return {fold: (y_val, y_prob)} for every fold already in the cache
+    (nothing for models without a stable key)
+    the rounds early-stopped folds kept are written to fold_iterations when it is given
+    """
+    cached = {}
+    if model_key is None:
+        return cached
+    for fold in range(n_splits):
+        hit = cache.load(dataset_key, model_key, fold)
+        if hit is not None:
+            cached[fold] = hit
+            best = cache.load_best_iteration(dataset_key, model_key, fold) if fold_iterations is not None else None
+            if best is not None:
+                fold_iterations[fold] = best
+    return cached
+
+def compare_all_models(X: np.ndarray, y: np.ndarray, n_workers: int = 1, threads_per_model: Optional[Union[int, Dict[str, int]]] = None, model_modules: Optional[List[str]] = None, prediction_store: Optional[PredictionStore] = None, cache: Optional[ResultsCache] = None, early_stopping_rounds: Optional[int] = None, best_iterations: Optional[Dict[str, List[int]]] = None) -> pd.DataFrame:
     """
     compares 7 supervised models + 4 advanced models (DL, Pattern, TabNet, Transformer)
     returns a ranked table by AUC and accuracy
+    n_workers > 1 runs every (model, fold) pair on a process pool;
+    threads_per_model (int, or per-module dict) caps each model's native threads
+    prediction_store keeps every model's out-of-fold probabilities on disk
+    cache reuses (model, fold) results keyed by the data, folds and model
+    config, so only new or changed models are retrained
+    early_stopping_rounds stops models registered with supports_early_stopping on
+    each fold's validation split; best_iterations, when given, receives
+    {leaderboard model name: rounds kept per fold} for the final refit
     """
-    model_modules = [
-        "models.xgboost_model", "models.logistic_model", "models.rf_model",
-        "models.nb_model", "models.svm_model", "models.gbm_model", "models.linear_model",
-        "models.deep_learning_model", "models.pattern_recognition_model",
-        "models.tabnet_model", "models.transformer_model"
-    ]
-    
+    model_modules = model_modules or MODEL_MODULES
+    dataset_key = get_dataset_key(X, y) if cache is not None else None
+
+    def get_cached(module_name: str, fold_iterations: Dict[int, int]) -> Tuple[Optional[str], Dict[int, Tuple[np.ndarray, np.ndarray]]]:
+        model_key = get_model_key(module_name, build_model(module_name), get_model_rounds(module_name, early_stopping_rounds))
+        return model_key, load_cached_folds(cache, dataset_key, model_key, fold_iterations=fold_iterations)
+
+    def store_new(module_name: str, model_key: Optional[str], cached: Dict[int, Tuple[np.ndarray, np.ndarray]], cv_results: List[Tuple[np.ndarray, np.ndarray]], fold_iterations: Dict[int, int]) -> None:
+        if model_key is None:
+            return
+        for fold, (y_val, y_prob) in enumerate(cv_results):
+            if fold not in cached:
+                cache.save(dataset_key, model_key, fold, y_val, y_prob, fold_iterations.get(fold))
+
+    def record(module_name: str, cv_results: List[Tuple[np.ndarray, np.ndarray]], fold_iterations: Dict[int, int]) -> None:
+        results.append(summarize_folds(module_name, cv_results))
+        if prediction_store is not None:
+            prediction_store.save_oof(module_name.split('.')[-1], assemble_oof(y, cv_results), y=y)
+        if best_iterations is not None and fold_iterations:
+            best_iterations[module_name.split('.')[-1]] = [best for _, best in sorted(fold_iterations.items())]
+
     results = []
+    if n_workers > 1:
+        cached_by_module, model_keys, iterations_by_module = {}, {}, {}
+        if cache is not None:
+            for module_name in model_modules:
+                try:
+                    model_keys[module_name], cached_by_module[module_name] = get_cached(module_name, iterations_by_module.setdefault(module_name, {}))
+                except Exception as e:
+                    print(f"Failed to run {module_name}: {e}")
+            model_modules = [m for m in model_modules if m in model_keys]
+        # submit the expensive models first so they don't straggle at the end
+        model_modules = sorted(model_modules, key=lambda m: -COST_CLASSES.index(get_model_spec(m).cost))
+        print(f"Running 5-Fold CV for {len(model_modules)} models on {n_workers} workers...")
+        gauntlet = run_gauntlet_parallel(model_modules, X, y, n_workers, threads_per_model, precomputed=cached_by_module,
+                                         early_stopping_rounds=early_stopping_rounds, best_iterations=iterations_by_module)
+        for module_name, cv_results in gauntlet.items():
+            fold_iterations = iterations_by_module.get(module_name, {})
+            if cache is not None:
+                store_new(module_name, model_keys[module_name], cached_by_module[module_name], cv_results, fold_iterations)
+            record(module_name, cv_results, fold_iterations)
+        return rank_results(results)
+
+    # fold indices and fold buffers are built once and shared by every model
+    folds = FoldViews(X, y)
     for module_name in model_modules:
         try:
             print(f"Running 5-Fold CV: {module_name}...")
-            module = importlib.import_module(module_name)
-            model = module.get_model()
-            
-            cv_results = run_5_fold_cv(model, X, y)
-            
-            fold_metrics = []
-            for y_val, y_prob in cv_results:
-                y_pred = (y_prob >= 0.5).astype(int)
-                fold_metrics.append(get_classification_metrics(y_val, y_pred, y_prob))
-            
-            mean_metrics = pd.DataFrame(fold_metrics).mean().to_dict()
-            mean_metrics["model"] = module_name.split('.')[-1]
-            results.append(mean_metrics)
+            model = build_model(module_name)
+            rounds = get_model_rounds(module_name, early_stopping_rounds)
+            # the key is taken from the unlimited config, so thread caps never miss the cache
+            model_key = get_model_key(module_name, model, rounds) if cache is not None else None
+            limit = threads_per_model.get(module_name) if isinstance(threads_per_model, dict) else threads_per_model
+            if limit:
+                limit_model_threads(model, limit)
+
+            fold_iterations, kept = {}, []
+            if model_key is None:
+                cv_results = run_5_fold_cv(model, X, y, folds, early_stopping_rounds=rounds, best_iterations=kept)
+                fold_iterations.update(enumerate(kept))
+            else:
+                cached = load_cached_folds(cache, dataset_key, model_key, len(folds), fold_iterations)
+                missing = [f for f in range(len(folds)) if f not in cached]
+                if not missing:
+                    print(f"  all folds cached for {module_name}")
+                fresh = dict(zip(missing, run_5_fold_cv(model, X, y, folds, missing, rounds, kept))) if missing else {}
+                fold_iterations.update(zip(missing, kept))
+                cv_results = [cached[f] if f in cached else fresh[f] for f in range(len(folds))]
+                store_new(module_name, model_key, cached, cv_results, fold_iterations)
+            record(module_name, cv_results, fold_iterations)
         except Exception as e:
             print(f"Failed to run {module_name}: {e}")
             
-    return pd.DataFrame(results).sort_values(by="auc", ascending=False)
+    return rank_results(results)
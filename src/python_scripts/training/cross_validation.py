@@ -1,23 +1,35 @@
-from sklearn.model_selection import StratifiedKFold
-from typing import Any, Tuple, List
+from typing import Any, Tuple, List, Optional
 import numpy as np
+from training.fold_cache import FoldViews
+from training.early_stopping import fit_with_early_stopping
 
-def run_5_fold_cv(model: Any, X: np.ndarray, y: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray]]:
+def run_5_fold_cv(model: Any, X: np.ndarray, y: np.ndarray, folds: Optional[FoldViews] = None, fold_numbers: Optional[List[int]] = None, early_stopping_rounds: Optional[int] = None, best_iterations: Optional[List[int]] = None) -> List[Tuple[np.ndarray, np.ndarray]]:
     """
     given a model, feature matrix, and target array
     return a list of out-of-fold predictions and true labels
     executes 5-fold stratified cross-validation
+    pass a FoldViews built once per dataset to reuse cached fold indices
+    and preallocated fold buffers across models
+    fold_numbers restricts the run to those folds (results in that order)
+    early_stopping_rounds stops boosted models on each fold's validation split;
+    the kept round counts are appended to best_iterations when it is given
     """
-    skf = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
+    if folds is None:
+        folds = FoldViews(X, y)
     oof_results = []
     
-    for train_index, val_index in skf.split(X, y):
-        X_train, X_val = X[train_index], X[val_index]
-        y_train, y_val = y[train_index], y[val_index]
+    for fold in (range(len(folds)) if fold_numbers is None else fold_numbers):
+        X_train, X_val, y_train, y_val = folds.split(fold)
         
-        model.fit(X_train, y_train)
+        if early_stopping_rounds is None:
+            model.fit(X_train, y_train)
+        else:
+            best = fit_with_early_stopping(model, X_train, y_train, X_val, y_val, early_stopping_rounds)
+            if best is not None and best_iterations is not None:
+                best_iterations.append(best)
         y_prob = model.predict_proba(X_val)[:, 1]
         
-        oof_results.append((y_val, y_prob))
+        # y_val lives in a reused buffer, so keep a copy with the predictions
+        oof_results.append((y_val.copy(), y_prob))
         
     return oof_results
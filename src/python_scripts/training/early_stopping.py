@@ -0,0 +1,89 @@
+import numpy as np
+from typing import Any, List, Optional
+from sklearn.ensemble import GradientBoostingClassifier, GradientBoostingRegressor, HistGradientBoostingClassifier, HistGradientBoostingRegressor
+from sklearn.linear_model import SGDClassifier, SGDRegressor
+from sklearn.neural_network import MLPClassifier, MLPRegressor
+from training.model_registry import get_model_spec
+
+# how an estimator stops early, decided from its type:
+ROUNDS = "rounds"          # xgboost: early_stopping_rounds watches eval_set, keeps best_iteration
+STAGES = "stages"          # sklearn GradientBoosting: n_iter_no_change on an internal holdout, keeps n_estimators_
+ITERATIONS = "iterations"  # sklearn HistGradientBoosting / MLP / SGD: early_stopping + n_iter_no_change, keeps n_iter_
+
+STAGE_ESTIMATORS = (GradientBoostingClassifier, GradientBoostingRegressor)
+ITERATION_ESTIMATORS = (HistGradientBoostingClassifier, HistGradientBoostingRegressor, MLPClassifier, MLPRegressor, SGDClassifier, SGDRegressor)
+
+# the param that sets the model's size when refitting on all rows
+SIZE_PARAMS = {ROUNDS: "n_estimators", STAGES: "n_estimators", ITERATIONS: "max_iter"}
+
+def get_early_stopping_kind(model: Any) -> Optional[str]:
+    """
+    given an estimator
+    return ROUNDS, STAGES or ITERATIONS for the estimator types that can stop early,
+    or None (the model is fitted as usual)
+    """
+    # matched by module so xgboost is never imported just to check
+    if type(model).__module__.split('.')[0] == "xgboost":
+        return ROUNDS
+    if isinstance(model, STAGE_ESTIMATORS):
+        return STAGES
+    if isinstance(model, ITERATION_ESTIMATORS):
+        return ITERATIONS
+    return None
+
+def get_model_rounds(module_name: str, early_stopping_rounds: Optional[int]) -> Optional[int]:
+    """
+    given a model module and the gauntlet's patience
+    return the patience for models registered with supports_early_stopping, else None
+    """
+    if early_stopping_rounds and get_model_spec(module_name).supports_early_stopping:
+        return early_stopping_rounds
+    return None
+
+def fit_with_early_stopping(model: Any, X_train: np.ndarray, y_train: np.ndarray, X_val: np.ndarray, y_val: np.ndarray, rounds: int) -> Optional[int]:
+    """
+    given an estimator, a fold's train/validation split and a patience
+    fit with early stopping (xgboost watches the fold's validation split,
+    sklearn estimators their own internal holdout)
+    return the number of rounds / stages / iterations kept, or None when unsupported
+    the estimator's own early-stopping settings are restored after fitting
+    """
+    kind = get_early_stopping_kind(model)
+    if kind is None:
+        model.fit(X_train, y_train)
+        return None
+
+    if kind == ROUNDS:
+        stop_params = {"early_stopping_rounds": rounds}
+    elif kind == STAGES:
+        stop_params = {"n_iter_no_change": rounds}
+    else:
+        stop_params = {"early_stopping": True, "n_iter_no_change": rounds}
+
+    params = model.get_params()
+    original = {p: params[p] for p in stop_params}
+    model.set_params(**stop_params)
+    try:
+        if kind == ROUNDS:
+            model.fit(X_train, y_train, eval_set=[(X_val, y_val)], verbose=False)
+            return int(model.best_iteration) + 1
+        model.fit(X_train, y_train)
+        return int(model.n_estimators_ if kind == STAGES else model.n_iter_)
+    finally:
+        model.set_params(**original)
+
+def refit_with_best_iterations(model: Any, X: np.ndarray, y: np.ndarray, best_iterations: List[int]) -> Any:
+    """
+    given an estimator, the full training data and the per-fold best rounds
+    refit on all rows with n_estimators (or max_iter) set to the median best round
+    (no early stopping: there is no held-out split left to watch)
+    return the fitted estimator
+    """
+    kind = get_early_stopping_kind(model)
+    if best_iterations and kind is not None:
+        size = {SIZE_PARAMS[kind]: max(1, int(round(np.median(best_iterations))))}
+        if kind == ITERATIONS:
+            size["early_stopping"] = False
+        model.set_params(**size)
+    model.fit(X, y)
+    return model
@@ -0,0 +1,98 @@
+import hashlib
+import numpy as np
+from collections import OrderedDict
+from sklearn.model_selection import StratifiedKFold
+from typing import List, Tuple
+
+MAX_CACHED_SPLITS = 8
+
+_fold_id_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+def get_data_fingerprint(y: np.ndarray, n_splits: int = 5, seed: int = 42) -> str:
+    """
+    given a target array and split settings
+    return a hex digest identifying the fold assignment
+    StratifiedKFold only looks at y (and the row count), so X is not hashed
+    """
+    y = np.ascontiguousarray(y)
+    digest = hashlib.sha1()
+    digest.update(f"{y.shape}|{y.dtype}|{n_splits}|{seed}".encode())
+    digest.update(y.view(np.uint8))
+    return digest.hexdigest()
+
+def get_fold_ids(y: np.ndarray, n_splits: int = 5, seed: int = 42) -> np.ndarray:
+    """
+    given a target array
+    return a read-only int8 array holding each row's validation fold
+    same split as StratifiedKFold(shuffle=True, random_state=seed)
+    computed once per dataset and cached (LRU) by get_data_fingerprint
+    """
+    key = get_data_fingerprint(y, n_splits, seed)
+    if key in _fold_id_cache:
+        _fold_id_cache.move_to_end(key)
+        return _fold_id_cache[key]
+
+    fold_ids = np.empty(len(y), dtype=np.int8)
+    skf = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=seed)
+    for fold, (_, val_index) in enumerate(skf.split(np.zeros(len(y)), y)):
+        fold_ids[val_index] = fold
+    fold_ids.flags.writeable = False
+
+    _fold_id_cache[key] = fold_ids
+    if len(_fold_id_cache) > MAX_CACHED_SPLITS:
+        _fold_id_cache.popitem(last=False)
+    return fold_ids
+
+def get_fold_indices(y: np.ndarray, n_splits: int = 5, seed: int = 42) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    given a target array
+    return [(train_index, val_index)] per fold, both sorted ascending
+    identical to StratifiedKFold.split, but built from the cached fold ids
+    """
+    fold_ids = get_fold_ids(y, n_splits, seed)
+    return [(np.flatnonzero(fold_ids != f), np.flatnonzero(fold_ids == f)) for f in range(n_splits)]
+
+class FoldViews:
+    """
+    fold slicer that materializes each fold into buffers allocated once
+    X_train/X_val/y_train/y_val for fold f are gathered with np.take into
+    preallocated arrays sized for the largest fold, so running many models
+    over the same data costs no new full-matrix allocations per fold
+    the arrays returned by split() are overwritten by the next split() call
+    """
+
+    def __init__(self, X: np.ndarray, y: np.ndarray, n_splits: int = 5, seed: int = 42):
+        self.X = np.asarray(X)
+        self.y = np.asarray(y)
+        self.n_splits = n_splits
+        self.indices = get_fold_indices(self.y, n_splits, seed)
+
+        max_train = max(len(train) for train, _ in self.indices)
+        max_val = max(len(val) for _, val in self.indices)
+        row_shape = self.X.shape[1:]
+        self._X_train = np.empty((max_train,) + row_shape, dtype=self.X.dtype)
+        self._X_val = np.empty((max_val,) + row_shape, dtype=self.X.dtype)
+        self._y_train = np.empty(max_train, dtype=self.y.dtype)
+        self._y_val = np.empty(max_val, dtype=self.y.dtype)
+
+    def __len__(self) -> int:
+        return self.n_splits
+
+    def split(self, fold: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        given a fold number
+        return (X_train, X_val, y_train, y_val) views into the shared buffers
+        """
+        train_index, val_index = self.indices[fold]
+        n_train, n_val = len(train_index), len(val_index)
+
+        X_train = self._X_train[:n_train]
+        X_val = self._X_val[:n_val]
+        y_train = self._y_train[:n_train]
+        y_val = self._y_val[:n_val]
+        # mode='clip' lets np.take write straight into out (no temp buffer)
+        np.take(self.X, train_index, axis=0, out=X_train, mode='clip')
+        np.take(self.X, val_index, axis=0, out=X_val, mode='clip')
+        np.take(self.y, train_index, axis=0, out=y_train, mode='clip')
+        np.take(self.y, val_index, axis=0, out=y_val, mode='clip')
+        return X_train, X_val, y_train, y_val
@@ -0,0 +1,107 @@
+import importlib
+from importlib.metadata import entry_points
+from typing import Any, Dict, List, Optional, Tuple
+
+# third-party packages can add models by declaring an entry point in this group
+# whose value is "package.module:factory"
+ENTRY_POINT_GROUP = "biobeat.models"
+
+COST_CLASSES = ("cheap", "medium", "heavy")
+
+class ModelSpec:
+    """
+    metadata for one model, importable without touching the model's framework
+    module/factory are plain strings; the module is only imported by build()
+    cost: "cheap" | "medium" | "heavy" (rough training time class)
+    supports_early_stopping: cv fits may stop early on each fold's validation split
+    n_jobs: native threads the model can use (-1 = all cores); the parallel
+    scheduler gives multi-threaded models a share of the cores instead of one
+    requires: frameworks that importing the module pulls in
+    """
+
+    def __init__(self, name: str, module: str, factory: str = "get_model", cost: str = "medium", supports_early_stopping: bool = False, n_jobs: int = 1, requires: Tuple[str, ...] = ()):
+        if cost not in COST_CLASSES:
+            raise ValueError(f"cost must be one of {COST_CLASSES}, got {cost!r}")
+        self.name = name
+        self.module = module
+        self.factory = factory
+        self.cost = cost
+        self.supports_early_stopping = supports_early_stopping
+        self.n_jobs = n_jobs
+        self.requires = requires
+
+    def __repr__(self) -> str:
+        return f"ModelSpec({self.name!r}, module={self.module!r}, cost={self.cost!r})"
+
+    def build(self) -> Any:
+        """
+        import the model module and return a fresh estimator from its factory
+        """
+        module = importlib.import_module(self.module)
+        return getattr(module, self.factory)()
+
+_registry: Dict[str, ModelSpec] = {}
+_entry_points_loaded = False
+
+def register_model(name: str, module: str, **metadata: Any) -> ModelSpec:
+    """
+    given a model name, its module path and ModelSpec metadata
+    add it to the registry (replacing any spec with the same name)
+    return the registered spec
+    """
+    spec = ModelSpec(name, module, **metadata)
+    _registry[name] = spec
+    return spec
+
+def _load_entry_points() -> None:
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        module, _, factory = ep.value.partition(':')
+        if ep.name not in _registry:
+            register_model(ep.name, module.strip(), factory=factory.strip() or "get_model")
+
+def get_model_spec(name: str) -> ModelSpec:
+    """
+    given a registered name ("xgboost_model") or a module path ("models.xgboost_model")
+    return its ModelSpec; unregistered module paths get a default spec
+    so any module exposing get_model() still runs
+    """
+    _load_entry_points()
+    short_name = name.split('.')[-1]
+    spec = _registry.get(name) or _registry.get(short_name)
+    if spec is not None and (spec.name == name or spec.module == name):
+        return spec
+    # registered under a name that differs from its module (e.g. entry points)
+    spec = next((spec for spec in _registry.values() if spec.module == name), None)
+    return spec or ModelSpec(short_name, name)
+
+def list_models(cost: Optional[str] = None) -> List[str]:
+    """
+    given an optional cost class filter
+    return registered model names in registration order
+    """
+    _load_entry_points()
+    return [name for name, spec in _registry.items() if cost is None or spec.cost == cost]
+
+def build_model(name: str) -> Any:
+    """
+    given a registered name or module path
+    return a fresh estimator (this is where the model's framework gets imported)
+    """
+    return get_model_spec(name).build()
+
+# the xgboost module predates the get_model() convention
+register_model("xgboost_model", "models.xgboost_model", factory="get_xgboost_classifier", cost="medium", supports_early_stopping=True, n_jobs=-1, requires=("xgboost",))
+register_model("logistic_model", "models.logistic_model", cost="cheap", requires=("sklearn",))
+register_model("rf_model", "models.rf_model", cost="medium", n_jobs=-1, requires=("sklearn",))
+register_model("nb_model", "models.nb_model", cost="cheap", requires=("sklearn",))
+register_model("svm_model", "models.svm_model", cost="heavy", requires=("sklearn",))
+register_model("gbm_model", "models.gbm_model", cost="medium", supports_early_stopping=True, requires=("sklearn",))
+register_model("linear_model", "models.linear_model", cost="cheap", requires=("sklearn",))
+register_model("deep_learning_model", "models.deep_learning_model", cost="heavy", n_jobs=-1, requires=("torch",))
+register_model("pattern_recognition_model", "models.pattern_recognition_model", cost="medium", requires=("sklearn",))
+register_model("tabnet_model", "models.tabnet_model", cost="heavy", n_jobs=-1, requires=("torch", "pytorch_tabnet"))
+register_model("transformer_model", "models.transformer_model", cost="heavy", n_jobs=-1, requires=("torch",))
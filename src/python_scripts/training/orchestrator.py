@@ -8,14 +8,17 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.xgboost_model import get_xgboost_classifier
 from training.cross_validation import run_5_fold_cv
-from evaluation.metrics import get_classification_metrics
+from training.early_stopping import refit_with_best_iterations
+from evaluation.metrics import get_cv_metrics
 
-def train_and_evaluate(train_parquet_path: str, target_col: str):
+def train_and_evaluate(train_parquet_path: str, target_col: str, early_stopping_rounds: int = 50):
     """
     given parquet path and target column name
     run 5-fold stratified cv
     output aggregated metrics
     return fully trained model on entire dataset
+    each fold early-stops on its validation split and the refit
+    trains for the median best round count
     """
     df = pd.read_parquet(train_parquet_path)
     X = df.drop(columns=[target_col]).values
@@ -24,21 +27,21 @@ def train_and_evaluate(train_parquet_path: str, target_col: str):
     model = get_xgboost_classifier()
     print(f"Starting 5-fold Cross-Validation...")
     
-    cv_results = run_5_fold_cv(model, X, y)
+    best_iterations = []
+    cv_results = run_5_fold_cv(model, X, y, early_stopping_rounds=early_stopping_rounds,
+                               best_iterations=best_iterations)
     
-    all_metrics = []
-    for y_val, y_prob in cv_results:
-        y_pred = (y_prob >= 0.5).astype(int)
-        metrics = get_classification_metrics(y_val, y_pred, y_prob)
-        all_metrics.append(metrics)
+    fold_metrics = get_cv_metrics(cv_results)
 
     # Average metrics
-    avg_auc = np.mean([m['auc'] for m in all_metrics])
-    avg_acc = np.mean([m['accuracy'] for m in all_metrics])
+    avg_auc = np.mean(fold_metrics['auc'])
+    avg_acc = np.mean(fold_metrics['accuracy'])
     
     print(f"CV Results -> Avg AUC: {avg_auc:.4f}, Avg Accuracy: {avg_acc:.4f}")
+    print(f"Best F1 threshold (fold mean): {np.mean(fold_metrics['best_threshold']):.3f}")
 
     # Refit on 100% of data for the final submission
+    if best_iterations:
+        print(f"Best rounds per fold: {best_iterations}")
     print("Refitting on full training set...")
-    model.fit(X, y)
-    return model
+    return refit_with_best_iterations(model, X, y, best_iterations)
@@ -0,0 +1,119 @@
+import os
+import numpy as np
+from typing import List, Optional, Tuple
+
+KINDS = ("oof", "test")
+
+class PredictionStore:
+    """
+    on-disk store of per-model out-of-fold and test probabilities
+    layout under root:
+        oof/<model>.npy, test/<model>.npy   one float64 vector per model
+        oof_row_ids.npy, test_row_ids.npy   row id for each position
+        target.npy                          y aligned with the oof rows
+    vectors are loaded memory-mapped, so blending/stacking/threshold tuning
+    can run from cached predictions without retraining the gauntlet
+    saving vectors for different rows (row ids, or the oof target) clears
+    every vector of that kind, so a reused store never mixes datasets
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        for kind in KINDS:
+            os.makedirs(os.path.join(root, kind), exist_ok=True)
+
+    def _save_array(self, path: str, values: np.ndarray) -> None:
+        # write then rename so a crashed run never leaves a torn file
+        tmp_path = path + ".tmp.npy"
+        np.save(tmp_path, values)
+        os.replace(tmp_path, path)
+
+    def _check_kind(self, kind: str) -> None:
+        if kind not in KINDS:
+            raise ValueError(f"kind must be one of {KINDS}, got {kind!r}")
+
+    def _clear(self, kind: str) -> None:
+        # vectors saved for other rows can no longer be stacked with new ones
+        directory = os.path.join(self.root, kind)
+        for f in os.listdir(directory):
+            os.remove(os.path.join(directory, f))
+        stale = [f"{kind}_row_ids.npy"] + (["target.npy"] if kind == "oof" else [])
+        for name in stale:
+            if os.path.exists(os.path.join(self.root, name)):
+                os.remove(os.path.join(self.root, name))
+
+    def _save_row_ids(self, kind: str, n_rows: int, row_ids: Optional[np.ndarray]) -> None:
+        path = os.path.join(self.root, f"{kind}_row_ids.npy")
+        if row_ids is not None and len(row_ids) != n_rows:
+            raise ValueError(f"{kind} row_ids and predictions differ in length")
+        if os.path.exists(path):
+            stored = np.load(path, mmap_mode='r')
+            if row_ids is None and len(stored) == n_rows:
+                return
+            if row_ids is not None and np.array_equal(stored, row_ids):
+                return
+            self._clear(kind)
+        self._save_array(path, np.arange(n_rows) if row_ids is None else np.asarray(row_ids))
+
+    def save(self, kind: str, model_name: str, predictions: np.ndarray, row_ids: Optional[np.ndarray] = None) -> None:
+        """
+        given 'oof' or 'test', a model name, and one probability per row
+        persist the vector (and the row ids, default 0..n-1)
+        """
+        self._check_kind(kind)
+        predictions = np.asarray(predictions, dtype=np.float64)
+        self._save_row_ids(kind, len(predictions), row_ids)
+        self._save_array(os.path.join(self.root, kind, f"{model_name}.npy"), predictions)
+
+    def save_oof(self, model_name: str, predictions: np.ndarray, y: Optional[np.ndarray] = None, row_ids: Optional[np.ndarray] = None) -> None:
+        """
+        given a model name, its out-of-fold probabilities, and optionally the target
+        persist them for later blending
+        a different target means a different dataset, so the old oof vectors are dropped
+        """
+        target_path = os.path.join(self.root, "target.npy")
+        if y is not None and os.path.exists(target_path) and not np.array_equal(np.load(target_path, mmap_mode='r'), y):
+            self._clear("oof")
+        self.save("oof", model_name, predictions, row_ids)
+        if y is not None:
+            self._save_array(target_path, np.asarray(y))
+
+    def save_test(self, model_name: str, predictions: np.ndarray, row_ids: Optional[np.ndarray] = None) -> None:
+        """
+        given a model name and its test-set probabilities
+        persist them for later blending
+        """
+        self.save("test", model_name, predictions, row_ids)
+
+    def list_models(self, kind: str = "oof") -> List[str]:
+        """
+        return the sorted model names that have predictions of this kind
+        """
+        self._check_kind(kind)
+        directory = os.path.join(self.root, kind)
+        return sorted(f[:-4] for f in os.listdir(directory) if f.endswith(".npy") and not f.endswith(".tmp.npy"))
+
+    def load(self, kind: str, model_name: str) -> np.ndarray:
+        """
+        return one model's prediction vector, memory-mapped read-only
+        """
+        self._check_kind(kind)
+        return np.load(os.path.join(self.root, kind, f"{model_name}.npy"), mmap_mode='r')
+
+    def load_matrix(self, kind: str = "oof", model_names: Optional[List[str]] = None) -> Tuple[List[str], np.ndarray]:
+        """
+        given a kind and optional model subset
+        return (model names, rows x models float64 matrix)
+        """
+        names = model_names if model_names is not None else self.list_models(kind)
+        if not names:
+            return [], np.empty((0, 0))
+        matrix = np.column_stack([self.load(kind, name) for name in names])
+        return names, matrix
+
+    def load_row_ids(self, kind: str = "oof") -> np.ndarray:
+        self._check_kind(kind)
+        return np.load(os.path.join(self.root, f"{kind}_row_ids.npy"), mmap_mode='r')
+
+    def load_target(self) -> np.ndarray:
+        return np.load(os.path.join(self.root, "target.npy"), mmap_mode='r')
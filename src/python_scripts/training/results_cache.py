@@ -0,0 +1,152 @@
+import os
+import sys
+import json
+import hashlib
+import numpy as np
+from typing import Any, Optional, Tuple
+
+from training.fold_cache import get_data_fingerprint
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+def get_dataset_key(X: np.ndarray, y: np.ndarray, n_splits: int = 5, seed: int = 42) -> str:
+    """
+    given the training matrix, target and split settings
+    return a hex digest that changes whenever the data or the folds change
+    """
+    X = np.ascontiguousarray(X)
+    digest = hashlib.sha1()
+    digest.update(get_data_fingerprint(y, n_splits, seed).encode())
+    digest.update(f"{X.shape}|{X.dtype}".encode())
+    digest.update(X.view(np.uint8))
+    return digest.hexdigest()
+
+def _type_name(value: Any) -> str:
+    return f"{value.__module__}.{value.__qualname__}"
+
+def get_canonical_params(value: Any) -> Any:
+    """
+    given an estimator param value
+    return a json-serializable form that is the same on every run
+    (no memory addresses): estimators become their type name plus their own
+    params, recursively; arrays and RandomState become content digests;
+    functions and classes become their qualified name
+    raises TypeError for values with no stable form
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return [get_canonical_params(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): get_canonical_params(v) for k, v in value.items()}
+    if isinstance(value, np.ndarray):
+        return {"ndarray": str(value.dtype), "shape": list(value.shape),
+                "sha1": hashlib.sha1(np.ascontiguousarray(value).tobytes()).hexdigest()}
+    if isinstance(value, np.random.RandomState):
+        _, keys, pos, has_gauss, cached_gaussian = value.get_state()
+        return {"RandomState": get_canonical_params(keys), "pos": pos, "gauss": [has_gauss, cached_gaussian]}
+    if hasattr(value, 'get_params'):
+        return {"type": _type_name(type(value)), "params": get_canonical_params(value.get_params(deep=False))}
+    if isinstance(value, type) or (callable(value) and hasattr(value, '__qualname__')):
+        return {"callable": _type_name(value)}
+    raise TypeError(f"no stable cache key for a {type(value).__name__} param")
+
+def get_model_key(module_name: str, model: Any, early_stopping_rounds: Optional[int] = None) -> Optional[str]:
+    """
+    given a model module name, the estimator it built and its cv patience
+    return a hex digest of the module source, estimator class and params
+    so editing a model's config invalidates only that model's results
+    (early-stopped folds are keyed apart from fully trained ones)
+    return None when a param has no stable form (the model is not cached)
+    """
+    digest = hashlib.sha1(module_name.encode())
+    if early_stopping_rounds:
+        digest.update(f"|early_stopping_rounds={early_stopping_rounds}".encode())
+    module_file = getattr(sys.modules.get(module_name), '__file__', None)
+    if module_file and os.path.exists(module_file):
+        with open(module_file, 'rb') as f:
+            digest.update(f.read())
+    digest.update(_type_name(type(model)).encode())
+    if hasattr(model, 'get_params'):
+        try:
+            params = get_canonical_params(model.get_params(deep=False))
+        except TypeError:
+            return None
+        digest.update(json.dumps(params, sort_keys=True).encode())
+    return digest.hexdigest()
+
+class ResultsCache:
+    """
+    on-disk cache of per-(model, fold) cross-validation results
+    one <dataset_key>_<model_key>_<fold>.npz per pair holding y_val and y_prob
+    (and best_iteration for folds that stopped early)
+    reads refresh the file mtime, and saves evict the least recently used
+    entries once the cache grows past max_bytes
+    """
+
+    def __init__(self, root: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, dataset_key: str, model_key: str, fold: int) -> str:
+        return os.path.join(self.root, f"{dataset_key[:20]}_{model_key[:20]}_{fold}.npz")
+
+    def load(self, dataset_key: str, model_key: str, fold: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        given the dataset key, model key and fold
+        return the cached (y_val, y_prob), or None on a miss
+        """
+        path = self._path(dataset_key, model_key, fold)
+        try:
+            with np.load(path) as data:
+                result = (data["y_val"], data["y_prob"])
+        except (FileNotFoundError, OSError, KeyError, ValueError):
+            return None
+        os.utime(path)
+        return result
+
+    def load_best_iteration(self, dataset_key: str, model_key: str, fold: int) -> Optional[int]:
+        """
+        given the dataset key, model key and fold
+        return the rounds the cached fold kept when it stopped early, else None
+        """
+        try:
+            with np.load(self._path(dataset_key, model_key, fold)) as data:
+                return int(data["best_iteration"]) if "best_iteration" in data.files else None
+        except (FileNotFoundError, OSError, ValueError):
+            return None
+
+    def save(self, dataset_key: str, model_key: str, fold: int, y_val: np.ndarray, y_prob: np.ndarray, best_iteration: Optional[int] = None) -> None:
+        """
+        given the keys, fold, its (y_val, y_prob) and the rounds it kept (if it stopped early)
+        write the entry atomically, then enforce the size bound
+        """
+        path = self._path(dataset_key, model_key, fold)
+        tmp_path = path + ".tmp.npz"
+        arrays = {"y_val": np.asarray(y_val), "y_prob": np.asarray(y_prob)}
+        if best_iteration is not None:
+            arrays["best_iteration"] = np.asarray(best_iteration)
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        delete the least recently used entries until the cache fits in max_bytes
+        """
+        entries = []
+        for name in os.listdir(self.root):
+            if not name.endswith(".npz") or name.endswith(".tmp.npz"):
+                continue
+            stat = os.stat(os.path.join(self.root, name))
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(os.path.join(self.root, name))
+            total -= size
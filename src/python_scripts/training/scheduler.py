@@ -0,0 +1,115 @@
+import os
+import shutil
+import tempfile
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple, Union
+from threadpoolctl import threadpool_limits
+from training.fold_cache import get_fold_ids
+from training.early_stopping import fit_with_early_stopping, get_model_rounds
+from training.model_registry import build_model, get_model_spec
+
+# estimator params that control native thread pools (sklearn, xgboost, catboost)
+THREAD_PARAMS = ("n_jobs", "nthread", "thread_count")
+
+_shared: Dict[str, np.ndarray] = {}
+
+def limit_model_threads(model: Any, n_threads: int) -> Any:
+    """
+    given an estimator and a thread budget
+    set whichever thread-count params it exposes so workers don't oversubscribe
+    """
+    if hasattr(model, 'get_params'):
+        params = model.get_params()
+        limits = {p: n_threads for p in THREAD_PARAMS if p in params}
+        if limits:
+            model.set_params(**limits)
+    return model
+
+def _init_worker(shared_dir: str) -> None:
+    for name in ("X", "y", "fold_ids"):
+        _shared[name] = np.load(os.path.join(shared_dir, f"{name}.npy"), mmap_mode='r')
+
+def _run_fold_job(module_name: str, fold: int, n_threads: int, early_stopping_rounds: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, Optional[int]]:
+    """
+    worker side of one (model, fold) job
+    slices the memory-mapped X/y by fold, fits, and returns (y_val, y_prob, kept rounds)
+    early_stopping_rounds stops the fit on the fold's validation split (kept rounds
+    is None when the model was trained in full)
+    n_threads caps the model's thread params and, through threadpoolctl, the
+    blas/openmp pools the worker already loaded (env vars would come too late)
+    """
+    X, y, fold_ids = _shared["X"], _shared["y"], _shared["fold_ids"]
+    train_index = np.flatnonzero(fold_ids != fold)
+    val_index = np.flatnonzero(fold_ids == fold)
+    X_val, y_val = X[val_index], np.asarray(y[val_index])
+
+    model = build_model(module_name)
+    limit_model_threads(model, n_threads)
+    best = None
+    with threadpool_limits(limits=n_threads):
+        if early_stopping_rounds is None:
+            model.fit(X[train_index], y[train_index])
+        else:
+            best = fit_with_early_stopping(model, X[train_index], y[train_index], X_val, y_val, early_stopping_rounds)
+        y_prob = model.predict_proba(X_val)[:, 1]
+    return y_val, y_prob, best
+
+def run_gauntlet_parallel(model_modules: List[str], X: np.ndarray, y: np.ndarray, n_workers: int, threads_per_model: Optional[Union[int, Dict[str, int]]] = None, n_splits: int = 5, precomputed: Optional[Dict[str, Dict[int, Tuple[np.ndarray, np.ndarray]]]] = None, early_stopping_rounds: Optional[int] = None, best_iterations: Optional[Dict[str, Dict[int, int]]] = None) -> Dict[str, List[Tuple[np.ndarray, np.ndarray]]]:
+    """
+    given model module names, features, target, and a worker count
+    run every (model, fold) pair as a separate job on a process pool
+    X, y, and the cached fold assignment are shared as memory-mapped .npy files
+    instead of being pickled per task
+    threads_per_model caps native threads per job (int, or per-module dict); by default
+    models registered with n_jobs != 1 get cores // n_workers threads, the rest 1
+    precomputed {module: {fold: (y_val, y_prob)}} pairs are not resubmitted
+    early_stopping_rounds stops models registered with supports_early_stopping on
+    each fold's validation split; the rounds every new fold kept are written to
+    best_iterations {module: {fold: rounds}} when it is given
+    return {module: [(y_val, y_prob) per fold, in fold order]} for models that succeeded
+    """
+    core_share = max(1, (os.cpu_count() or 1) // n_workers)
+    thread_limits = {m: core_share if get_model_spec(m).n_jobs != 1 else 1 for m in model_modules}
+    if isinstance(threads_per_model, dict):
+        thread_limits.update({m: threads_per_model[m] for m in model_modules if m in threads_per_model})
+    elif threads_per_model:
+        thread_limits = {m: threads_per_model for m in model_modules}
+
+    shared_dir = tempfile.mkdtemp(prefix="biobeat_gauntlet_")
+    try:
+        np.save(os.path.join(shared_dir, "X.npy"), np.ascontiguousarray(X))
+        np.save(os.path.join(shared_dir, "y.npy"), np.ascontiguousarray(y))
+        np.save(os.path.join(shared_dir, "fold_ids.npy"), get_fold_ids(y, n_splits))
+
+        precomputed = precomputed or {}
+        results: Dict[str, Dict[int, Tuple[np.ndarray, np.ndarray]]] = {m: dict(precomputed.get(m, {})) for m in model_modules}
+        failed = set()
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                 initargs=(shared_dir,)) as pool:
+            futures = {
+                pool.submit(_run_fold_job, module_name, fold, thread_limits[module_name],
+                            get_model_rounds(module_name, early_stopping_rounds)): (module_name, fold)
+                for module_name in model_modules
+                for fold in range(n_splits)
+                if fold not in results[module_name]
+            }
+            for future in as_completed(futures):
+                module_name, fold = futures[future]
+                try:
+                    y_val, y_prob, best = future.result()
+                except Exception as e:
+                    if module_name not in failed:
+                        print(f"Failed to run {module_name}: {e}")
+                    failed.add(module_name)
+                    continue
+                results[module_name][fold] = (y_val, y_prob)
+                if best is not None and best_iterations is not None:
+                    best_iterations.setdefault(module_name, {})[fold] = best
+
+        return {
+            m: [folds[f] for f in range(n_splits)]
+            for m, folds in results.items() if m not in failed
+        }
+    finally:
+        shutil.rmtree(shared_dir, ignore_errors=True)
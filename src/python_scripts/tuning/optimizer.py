@@ -1,29 +1,170 @@
+import os
+import shutil
+import tempfile
 import optuna
 import numpy as np
-from sklearn.model_selection import cross_val_score
-from typing import Any, Dict
+from concurrent.futures import ProcessPoolExecutor
+from sklearn.metrics import roc_auc_score
+from sklearn.model_selection import StratifiedKFold
+from typing import Any, Callable, Dict, Optional
 
-def tune_hyperparameters(model_class: Any, X: np.ndarray, y: np.ndarray, n_trials: int = 20) -> Dict[str, Any]:
+SearchSpace = Callable[[optuna.Trial], Dict[str, Any]]
+
+def _tree_space(trial: optuna.Trial) -> Dict[str, Any]:
+    return {
+        'n_estimators': trial.suggest_int('n_estimators', 50, 300),
+        'max_depth': trial.suggest_int('max_depth', 3, 10),
+        'learning_rate': trial.suggest_float('learning_rate', 0.01, 0.3, log=True)
+    }
+
+def _xgboost_space(trial: optuna.Trial) -> Dict[str, Any]:
+    return {
+        **_tree_space(trial),
+        'subsample': trial.suggest_float('subsample', 0.5, 1.0),
+        'colsample_bytree': trial.suggest_float('colsample_bytree', 0.5, 1.0),
+        'min_child_weight': trial.suggest_float('min_child_weight', 1.0, 20.0, log=True)
+    }
+
+def _gbm_space(trial: optuna.Trial) -> Dict[str, Any]:
+    return {**_tree_space(trial), 'subsample': trial.suggest_float('subsample', 0.5, 1.0)}
+
+def _forest_space(trial: optuna.Trial) -> Dict[str, Any]:
+    return {
+        'n_estimators': trial.suggest_int('n_estimators', 50, 300),
+        'max_depth': trial.suggest_int('max_depth', 3, 20),
+        'min_samples_leaf': trial.suggest_int('min_samples_leaf', 1, 50, log=True),
+        'max_features': trial.suggest_float('max_features', 0.2, 1.0)
+    }
+
+def _logistic_space(trial: optuna.Trial) -> Dict[str, Any]:
+    return {'C': trial.suggest_float('C', 1e-3, 1e2, log=True)}
+
+def _svm_space(trial: optuna.Trial) -> Dict[str, Any]:
+    return {
+        'C': trial.suggest_float('C', 1e-2, 1e2, log=True),
+        'gamma': trial.suggest_float('gamma', 1e-4, 1e0, log=True)
+    }
+
+def _nb_space(trial: optuna.Trial) -> Dict[str, Any]:
+    return {'var_smoothing': trial.suggest_float('var_smoothing', 1e-12, 1e-6, log=True)}
+
+# search space per estimator class name; anything else gets the tree space
+SEARCH_SPACES: Dict[str, SearchSpace] = {
+    'XGBClassifier': _xgboost_space,
+    'GradientBoostingClassifier': _gbm_space,
+    'RandomForestClassifier': _forest_space,
+    'ExtraTreesClassifier': _forest_space,
+    'LogisticRegression': _logistic_space,
+    'SVC': _svm_space,
+    'GaussianNB': _nb_space,
+}
+
+def get_search_space(model_class: Any) -> SearchSpace:
+    """
+    given a model class
+    return the trial -> params function registered for it
+    """
+    return SEARCH_SPACES.get(model_class.__name__, _tree_space)
+
+def get_pruner(pruner: Optional[str]) -> optuna.pruners.BasePruner:
+    """
+    given "median", "halving" or None
+    return the matching optuna pruner
+    """
+    if pruner == "median":
+        return optuna.pruners.MedianPruner(n_startup_trials=5, n_warmup_steps=0)
+    if pruner == "halving":
+        return optuna.pruners.SuccessiveHalvingPruner()
+    if pruner is None:
+        return optuna.pruners.NopPruner()
+    raise ValueError(f"unknown pruner {pruner!r}")
+
+def get_journal_storage(path: str) -> optuna.storages.BaseStorage:
+    """
+    given a journal file path
+    return an optuna storage that several processes can share
+    """
+    journal = getattr(optuna.storages, 'journal', None)
+    if journal is not None and hasattr(journal, 'JournalFileBackend'):
+        return optuna.storages.JournalStorage(journal.JournalFileBackend(path))
+    # optuna < 4.0
+    return optuna.storages.JournalStorage(optuna.storages.JournalFileStorage(path))
+
+def _score_fold(model: Any, X_val: np.ndarray, y_val: np.ndarray) -> float:
+    if hasattr(model, 'predict_proba'):
+        return roc_auc_score(y_val, model.predict_proba(X_val)[:, 1])
+    return roc_auc_score(y_val, model.decision_function(X_val))
+
+def make_objective(model_class: Any, X: np.ndarray, y: np.ndarray, search_space: SearchSpace, n_splits: int = 3) -> Callable[[optuna.Trial], float]:
+    """
+    given a model class, data and a search space
+    return an objective that reports the running fold-mean AUC after every fold
+    so the pruner can stop a bad trial after its first fold
+    """
+    folds = list(StratifiedKFold(n_splits=n_splits).split(X, y))
+
+    def objective(trial: optuna.Trial) -> float:
+        model = model_class(**search_space(trial))
+        scores = []
+        for step, (train_index, val_index) in enumerate(folds):
+            model.fit(X[train_index], y[train_index])
+            scores.append(_score_fold(model, X[val_index], y[val_index]))
+            trial.report(float(np.mean(scores)), step)
+            if trial.should_prune():
+                raise optuna.TrialPruned()
+        return float(np.mean(scores))
+
+    return objective
+
+def _run_study_worker(storage_path: str, study_name: str, data_dir: str, model_class: Any, n_trials: int, pruner: Optional[str], n_splits: int) -> None:
+    """
+    worker side of a parallel search
+    memory-maps X/y and runs its share of trials against the shared journal
+    """
+    X = np.load(os.path.join(data_dir, "X.npy"), mmap_mode='r')
+    y = np.load(os.path.join(data_dir, "y.npy"), mmap_mode='r')
+    study = optuna.load_study(study_name=study_name, storage=get_journal_storage(storage_path),
+                              pruner=get_pruner(pruner))
+    study.optimize(make_objective(model_class, X, y, get_search_space(model_class), n_splits), n_trials=n_trials)
+
+def tune_hyperparameters(model_class: Any, X: np.ndarray, y: np.ndarray, n_trials: int = 20, n_workers: int = 1, pruner: Optional[str] = "median", storage_path: Optional[str] = None, n_splits: int = 3) -> Dict[str, Any]:
     """
     given a model class and data
     run bayesian optimization via optuna
     return the best parameter dictionary found
+    params come from the model's entry in SEARCH_SPACES; every fold reports
+    the running AUC so the median / successive-halving pruner can cut bad trials
+    n_workers > 1 splits the trials across processes sharing a journal file
+    (storage_path, or a temporary one) with X/y passed as memory-mapped .npy files
     """
-    def objective(trial):
-        # Example for tree-based models; can be expanded per model type
-        params = {
-            'n_estimators': trial.suggest_int('n_estimators', 50, 300),
-            'max_depth': trial.suggest_int('max_depth', 3, 10),
-            'learning_rate': trial.suggest_float('learning_rate', 0.01, 0.3, log=True)
-        }
-        
-        model = model_class(**params)
-        # Using a simple 3-fold CV inside the tuner for speed
-        score = cross_val_score(model, X, y, cv=3, scoring='roc_auc').mean()
-        return score
-
-    study = optuna.create_study(direction='maximize')
-    study.optimize(objective, n_trials=n_trials)
-    
-    print(f"Optimization finished. Best AUC: {study.best_value:.4f}")
-    return study.best_params
+    search_space = get_search_space(model_class)
+
+    if n_workers <= 1:
+        storage = get_journal_storage(storage_path) if storage_path else None
+        study = optuna.create_study(direction='maximize', pruner=get_pruner(pruner), storage=storage)
+        study.optimize(make_objective(model_class, X, y, search_space, n_splits), n_trials=n_trials)
+        best_value, best_params = study.best_value, study.best_params
+    else:
+        work_dir = tempfile.mkdtemp(prefix="biobeat_tuning_")
+        try:
+            journal_path = storage_path or os.path.join(work_dir, "study.journal")
+            np.save(os.path.join(work_dir, "X.npy"), np.ascontiguousarray(X))
+            np.save(os.path.join(work_dir, "y.npy"), np.ascontiguousarray(y))
+            study = optuna.create_study(direction='maximize', storage=get_journal_storage(journal_path))
+
+            shares = [n_trials // n_workers + (i < n_trials % n_workers) for i in range(n_workers)]
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                futures = [
+                    pool.submit(_run_study_worker, journal_path, study.study_name, work_dir,
+                                model_class, share, pruner, n_splits)
+                    for share in shares if share > 0
+                ]
+                for future in futures:
+                    future.result()
+            study = optuna.load_study(study_name=study.study_name, storage=get_journal_storage(journal_path))
+            best_value, best_params = study.best_value, study.best_params
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(f"Optimization finished. Best AUC: {best_value:.4f}")
+    return best_params
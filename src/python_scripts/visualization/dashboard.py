@@ -1,10 +1,28 @@
 import pandas as pd
 
-def generate_html_report(results_df: pd.DataFrame, output_path: str):
+def format_intervals(results_df: pd.DataFrame, alpha: float = 0.05) -> pd.DataFrame:
+    """
+    given a leaderboard that may carry <metric>_ci_low/_ci_high columns
+    and the alpha they were computed with
+    return it with each pair folded into one "<metric> <1 - alpha>% CI" text column
+    """
+    df = results_df.copy()
+    label = f"{100 * (1 - alpha):g}% CI"
+    for metric in ("auc", "accuracy"):
+        low, high = f"{metric}_ci_low", f"{metric}_ci_high"
+        if low in df.columns and high in df.columns:
+            text = [f"[{lo:.4f}, {hi:.4f}]" if pd.notna(lo) else "" for lo, hi in zip(df[low], df[high])]
+            df = df.drop(columns=[low, high])
+            df.insert(df.columns.get_loc(metric) + 1, f"{metric} {label}", text)
+    return df
+
+def generate_html_report(results_df: pd.DataFrame, output_path: str, ci_alpha: float = 0.05):
     """
     given a dataframe of results
     generates a clean HTML report with embedded styles
+    bootstrap interval columns (computed with ci_alpha) are shown next to their metric
     """
+    results_df = format_intervals(results_df, ci_alpha)
     html_content = f"""
     <html>
     <head>
@@ -1,35 +1,41 @@
-import matplotlib.pyplot as plt
-import seaborn as sns
-from sklearn.metrics import roc_curve, confusion_matrix
-import pandas as pd
+from sklearn.metrics import roc_curve, precision_recall_curve, confusion_matrix
 import numpy as np
+from typing import Optional
 
-def save_model_visuals(y_true: np.ndarray, y_prob: np.ndarray, model_name: str, output_dir: str):
+from visualization.render_queue import RenderQueue, downsample_curve
+
+def save_model_visuals(y_true: np.ndarray, y_prob: np.ndarray, model_name: str, output_dir: str, queue: Optional[RenderQueue] = None):
     """
     given true labels, probabilities, and model name
-    generates and saves ROC curve and Confusion Matrix
+    generates and saves ROC curve, Precision-Recall curve and Confusion Matrix
+    the figure data is computed here (curves downsampled, AUC from the full
+    curve) and drawn by the render queue; without a queue they render inline
     """
-    plt.style.use('ggplot')
-    
+    render_now = queue is None
+    queue = RenderQueue(n_workers=0) if render_now else queue
+
     # 1. ROC Curve
     fpr, tpr, _ = roc_curve(y_true, y_prob)
-    plt.figure(figsize=(8, 6))
-    plt.plot(fpr, tpr, label=f'ROC (Area = {np.trapz(tpr, fpr):.2f})')
-    plt.plot([0, 1], [0, 1], 'k--')
-    plt.title(f'ROC Curve: {model_name}')
-    plt.xlabel('False Positive Rate')
-    plt.ylabel('True Positive Rate')
-    plt.legend(loc='lower right')
-    plt.savefig(f"{output_dir}/{model_name}_roc.png")
-    plt.close()
+    auc = np.trapezoid(tpr, fpr)
+    fpr, tpr = downsample_curve(fpr, tpr)
+    queue.submit("curve", {
+        "x": fpr, "y": tpr, "label": f'ROC (Area = {auc:.2f})', "diagonal": True,
+        "title": f'ROC Curve: {model_name}', "xlabel": 'False Positive Rate', "ylabel": 'True Positive Rate',
+    }, f"{output_dir}/{model_name}_roc.png")
 
-    # 2. Confusion Matrix
+    # 2. Precision-Recall Curve
+    precision, recall, _ = precision_recall_curve(y_true, y_prob)
+    recall, precision = downsample_curve(recall, precision)
+    queue.submit("curve", {
+        "x": recall, "y": precision, "label": model_name, "legend_loc": 'lower left',
+        "title": f'Precision-Recall Curve: {model_name}', "xlabel": 'Recall', "ylabel": 'Precision',
+    }, f"{output_dir}/{model_name}_pr.png")
+
+    # 3. Confusion Matrix
     y_pred = (y_prob >= 0.5).astype(int)
     cm = confusion_matrix(y_true, y_pred)
-    plt.figure(figsize=(6, 5))
-    sns.heatmap(cm, annot=True, fmt='d', cmap='Blues')
-    plt.title(f'Confusion Matrix: {model_name}')
-    plt.ylabel('Actual')
-    plt.xlabel('Predicted')
-    plt.savefig(f"{output_dir}/{model_name}_cm.png")
-    plt.close()
+    queue.submit("confusion", {"matrix": cm, "title": f'Confusion Matrix: {model_name}'},
+                 f"{output_dir}/{model_name}_cm.png")
+
+    if render_now:
+        queue.wait()
@@ -0,0 +1,173 @@
+import os
+import json
+import hashlib
+import numpy as np
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# curves are drawn with at most this many points; spacing along the curve is then
+# <= 2 / CURVE_MAX_POINTS in unit axes (~0.5 px on an 8x6in figure at 100 dpi)
+CURVE_MAX_POINTS = 2000
+# bump when a renderer's output changes so cached figures are redrawn
+RENDERER_VERSION = 1
+
+def downsample_curve(x: np.ndarray, y: np.ndarray, max_points: int = CURVE_MAX_POINTS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    given a monotone curve (e.g. roc_curve / precision_recall_curve output)
+    return at most max_points of its points, spaced evenly along the
+    curve length so steep and flat parts keep the same resolution
+    the first and last points are always kept
+    """
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    if len(x) <= max_points:
+        return x, y
+    length = np.r_[0.0, np.cumsum(np.abs(np.diff(x)) + np.abs(np.diff(y)))]
+    idx = np.searchsorted(length, np.linspace(0.0, length[-1], max_points))
+    idx = np.unique(np.r_[0, np.minimum(idx, len(x) - 1), len(x) - 1])
+    return x[idx], y[idx]
+
+def _pyplot():
+    # imported in the worker, so the pipeline never pays for matplotlib
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    plt.style.use('ggplot')
+    return plt
+
+def render_curve(payload: Dict[str, Any], output_path: str) -> None:
+    """
+    line plot of payload x/y with title, axis labels and legend label
+    """
+    plt = _pyplot()
+    plt.figure(figsize=(8, 6))
+    plt.plot(payload["x"], payload["y"], label=payload["label"])
+    if payload.get("diagonal"):
+        plt.plot([0, 1], [0, 1], 'k--')
+    plt.title(payload["title"])
+    plt.xlabel(payload["xlabel"])
+    plt.ylabel(payload["ylabel"])
+    plt.legend(loc=payload.get("legend_loc", 'lower right'))
+    plt.savefig(output_path)
+    plt.close()
+
+def render_confusion(payload: Dict[str, Any], output_path: str) -> None:
+    """
+    annotated heatmap of a confusion matrix
+    """
+    import seaborn as sns
+    plt = _pyplot()
+    plt.figure(figsize=(6, 5))
+    sns.heatmap(np.asarray(payload["matrix"]), annot=True, fmt='d', cmap='Blues')
+    plt.title(payload["title"])
+    plt.ylabel('Actual')
+    plt.xlabel('Predicted')
+    plt.savefig(output_path)
+    plt.close()
+
+def render_importance(payload: Dict[str, Any], output_path: str) -> None:
+    """
+    horizontal bar chart of feature importances, largest on top
+    """
+    plt = _pyplot()
+    plt.figure(figsize=(10, 6))
+    plt.barh(payload["features"], payload["importance"], color='skyblue')
+    plt.gca().invert_yaxis()
+    plt.title(payload["title"])
+    plt.savefig(output_path)
+    plt.close()
+
+RENDERERS: Dict[str, Callable[[Dict[str, Any], str], None]] = {
+    "curve": render_curve,
+    "confusion": render_confusion,
+    "importance": render_importance,
+}
+
+def _render_job(kind: str, payload: Dict[str, Any], output_path: str) -> str:
+    RENDERERS[kind](payload, output_path)
+    return output_path
+
+def get_payload_hash(kind: str, payload: Dict[str, Any]) -> str:
+    """
+    given a figure kind and its payload
+    return a hex digest of everything that determines the rendered image
+    """
+    digest = hashlib.sha1(f"{kind}|{RENDERER_VERSION}".encode())
+    for key in sorted(payload):
+        value = payload[key]
+        digest.update(key.encode())
+        if isinstance(value, np.ndarray):
+            digest.update(str(value.dtype).encode())
+            digest.update(np.ascontiguousarray(value).tobytes())
+        else:
+            digest.update(json.dumps(value, default=lambda v: np.asarray(v).tolist()).encode())
+    return digest.hexdigest()
+
+class RenderQueue:
+    """
+    background figure renderer
+    submit() hashes the figure's payload and skips it when the image on disk
+    was rendered from the same content; otherwise the job goes to a process
+    pool right away, so training keeps running while figures are drawn
+    wait() blocks until every submitted figure is written
+    n_workers=0 renders inline (no pool)
+    """
+
+    def __init__(self, n_workers: int = 1):
+        self.n_workers = n_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pending: List[Tuple[Future, str, str]] = []
+        self.skipped: List[str] = []
+
+    def _hash_path(self, output_path: str) -> str:
+        return output_path + ".sha1"
+
+    def _is_current(self, output_path: str, content_hash: str) -> bool:
+        hash_path = self._hash_path(output_path)
+        if not (os.path.exists(output_path) and os.path.exists(hash_path)):
+            return False
+        with open(hash_path) as f:
+            return f.read().strip() == content_hash
+
+    def submit(self, kind: str, payload: Dict[str, Any], output_path: str) -> bool:
+        """
+        given a renderer kind, its payload and the output image path
+        queue the figure unless an identical one is already on disk
+        return True if a render was queued
+        """
+        if kind not in RENDERERS:
+            raise ValueError(f"unknown figure kind {kind!r}")
+        content_hash = get_payload_hash(kind, payload)
+        if self._is_current(output_path, content_hash):
+            self.skipped.append(output_path)
+            return False
+
+        if self.n_workers <= 0:
+            future: Future = Future()
+            future.set_result(_render_job(kind, payload, output_path))
+        else:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.n_workers)
+            future = self._pool.submit(_render_job, kind, payload, output_path)
+        self._pending.append((future, output_path, content_hash))
+        return True
+
+    def wait(self) -> List[str]:
+        """
+        block until every queued figure is rendered
+        return the written paths (failures are reported, not raised)
+        """
+        written = []
+        for future, output_path, content_hash in self._pending:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Failed to render {output_path}: {e}")
+                continue
+            with open(self._hash_path(output_path), 'w') as f:
+                f.write(content_hash)
+            written.append(output_path)
+        self._pending = []
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        return written
@@ -0,0 +1,59 @@
+import sys
+import pandas as pd
+import pytest
+
+TOY_MODEL_SOURCE = (
+    "from sklearn.linear_model import LogisticRegression\n"
+    "def get_model():\n"
+    "    return LogisticRegression(max_iter=200)\n"
+)
+
+@pytest.fixture
+def write_model_module(tmp_path, monkeypatch):
+    """
+    returns write(module_name, source=TOY_MODEL_SOURCE) which writes a tiny
+    models-style module (dotted names become packages) on sys.path
+    the modules are forgotten after the test, so names can be reused
+    """
+    root = tmp_path / "toy_modules"
+    root.mkdir()
+    monkeypatch.syspath_prepend(str(root))
+    written = []
+
+    def write(module_name: str, source: str = TOY_MODEL_SOURCE) -> str:
+        path = root.joinpath(*module_name.split('.')).with_suffix('.py')
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source)
+        written.append(module_name)
+        return module_name
+
+    yield write
+    for module_name in written:
+        parts = module_name.split('.')
+        for k in range(len(parts), 0, -1):
+            sys.modules.pop('.'.join(parts[:k]), None)
+
+@pytest.fixture
+def toy_model_module(write_model_module):
+    """
+    a LogisticRegression module exposing get_model()
+    """
+    return write_model_module("toy_logistic_model")
+
+@pytest.fixture
+def toy_train_test(tmp_path):
+    """
+    writes a 60-row train.csv (id, height(cm), weight(kg), smoking)
+    and the matching test.csv (ids 1000..1059)
+    return [train path, test path]
+    """
+    n = 60
+    train = pd.DataFrame({
+        "id": range(n),
+        "height(cm)": [150.0 + (i * 7) % 40 for i in range(n)],
+        "weight(kg)": [50.0 + (i * 11) % 45 for i in range(n)],
+        "smoking": [i % 2 for i in range(n)],
+    })
+    train.to_csv(tmp_path / "train.csv", index=False)
+    train.drop(columns=["smoking"]).assign(id=lambda d: d["id"] + 1000).to_csv(tmp_path / "test.csv", index=False)
+    return [str(tmp_path / "train.csv"), str(tmp_path / "test.csv")]
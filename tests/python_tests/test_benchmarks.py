@@ -0,0 +1,38 @@
+import json
+import pandas as pd
+from benchmarks.run_benchmarks import compare_runs, get_speedups, run_benchmarks
+from benchmarks.synthetic_data import generate_biosignal_frame, get_column_names, write_synthetic_csv
+
+def test_synthetic_data_is_reproducible(tmp_path):
+    """
+    verifies the generator is seeded, sized as asked, carries the columns
+    the feature spec needs and writes the same rows to csv
+    """
+    df = generate_biosignal_frame(1_000, 20, seed=3, invalid_fraction=0.05)
+    assert df.shape == (1_000, 22)
+    assert {"height(cm)", "weight(kg)", "GTP", "ALT", "signal_3"} <= set(df.columns)
+    assert set(df['smoking'].unique()) == {0, 1}
+    assert 0 < df[get_column_names(20)].isna().to_numpy().mean() < 0.1
+    assert df.equals(generate_biosignal_frame(1_000, 20, seed=3, invalid_fraction=0.05))
+
+    path = write_synthetic_csv(str(tmp_path / "raw.csv"), 1_000, 20, seed=3, invalid_fraction=0.05)
+    assert pd.read_csv(path).shape == df.shape
+
+def test_results_json_and_regression_check(tmp_path):
+    """
+    verifies a run writes every kernel with both implementations to json
+    and that comparing against a faster baseline flags the regression
+    """
+    output = str(tmp_path / "results.json")
+    report = run_benchmarks(output, sizes=[(2_000, 5)], suites=("kernels", "blend"), workdir=str(tmp_path / "work"), repeats=1)
+    with open(output) as f:
+        assert json.load(f)["results"] == report["results"]
+    assert {r["suite"] for r in report["results"]} == {"kernels", "blend"}
+    assert len(get_speedups(report)) == 9
+
+    for r in report["results"]:
+        r["min_s"] /= 10
+    with open(tmp_path / "baseline.json", 'w') as f:
+        json.dump(report, f)
+    comparison = compare_runs(str(tmp_path / "baseline.json"), output)
+    assert len(comparison) == len(report["results"]) and comparison["regressed"].all()
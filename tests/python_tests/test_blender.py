@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+from file_io.results_store import write_leaderboard
+from training.blender import blend_smart_weighted, blend_predictions, fit_blend_weights, get_smart_weights, load_blend_matrix
+from training.prediction_store import PredictionStore
+
+def test_smart_blend_matches_legacy_formula(tmp_path):
+    """
+    verifies the matrix blend reproduces the per-file (AUC - 0.5)^2
+    weighted average and reads scores from the json leaderboard
+    """
+    subs = tmp_path / "subs"
+    subs.mkdir()
+    preds = {"a": np.array([0.1, 0.9, 0.4]), "b": np.array([0.3, 0.6, 0.8])}
+    for name, p in preds.items():
+        pd.DataFrame({"id": [5, 6, 7], "smoking": p}).to_csv(subs / f"{name}_submission.csv", index=False)
+    results = tmp_path / "results.json"
+    write_leaderboard(pd.DataFrame({"model": ["a", "b"], "auc": [0.8, 0.7]}), str(results))
+
+    out = tmp_path / "blend.csv"
+    blend_smart_weighted(str(subs), str(results), str(out))
+
+    w = {"a": 0.3 ** 2, "b": 0.2 ** 2}
+    expected = (preds["a"] * w["a"] + preds["b"] * w["b"]) / (w["a"] + w["b"])
+    df = pd.read_csv(out)
+    assert df["id"].tolist() == [5, 6, 7]
+    assert np.allclose(df["smoking"], expected)
+
+def test_optimized_and_rank_blend_from_store(tmp_path):
+    """
+    verifies nnls weights favour the informative model and that
+    rank blending works off the stored test predictions
+    """
+    rng = np.random.default_rng(0)
+    y = rng.integers(0, 2, 500)
+    store = PredictionStore(str(tmp_path / "preds"))
+    store.save_oof("good", y * 0.8 + 0.1, y=y)
+    store.save_oof("noise", rng.random(500))
+    store.save_test("good", np.array([0.2, 0.9]), row_ids=np.array([1, 2]))
+    store.save_test("noise", np.array([0.5, 0.1]))
+
+    _, oof = store.load_matrix("oof", ["good", "noise"])
+    weights = fit_blend_weights(oof, y)
+    assert weights[0] > weights[1] >= 0
+
+    results = tmp_path / "results.json"
+    write_leaderboard(pd.DataFrame({"model": ["good", "noise"], "auc": [1.0, 0.5]}), str(results))
+    out = tmp_path / "blend.csv"
+    blend_smart_weighted(str(tmp_path), str(results), str(out), method="rank", prediction_store=store)
+    assert pd.read_csv(out)["smoking"].tolist() == [0.5, 1.0]
+    assert get_smart_weights({"x": 0.6}, ["x", "y"]).tolist() == [(0.6 - 0.5) ** 2, 0.0]
+    assert blend_predictions(np.ones((2, 2)), np.zeros(2)).tolist() == [1.0, 1.0]
+
+def test_store_and_csv_only_models_are_blended_together(tmp_path):
+    """
+    verifies models with only a submission csv are aligned by id and
+    blended with the stored ones instead of being dropped
+    """
+    store = PredictionStore(str(tmp_path / "preds"))
+    store.save_test("winner", np.array([0.2, 0.8]), row_ids=np.array([1, 2]))
+    subs = tmp_path / "subs"
+    subs.mkdir()
+    pd.DataFrame({"id": [2, 1], "smoking": [0.4, 0.6]}).to_csv(subs / "other_submission.csv", index=False)
+
+    names, ids, matrix = load_blend_matrix(str(subs), store)
+    assert names == ["winner", "other"] and ids.tolist() == [1, 2]
+    assert matrix.tolist() == [[0.2, 0.6], [0.8, 0.4]]
+
+    results = tmp_path / "results.json"
+    write_leaderboard(pd.DataFrame({"model": ["winner", "other"], "auc": [0.7, 0.7]}), str(results))
+    out = subs / "blended_final_submission.csv"
+    blend_smart_weighted(str(subs), str(results), str(out), prediction_store=store)
+    assert np.allclose(pd.read_csv(out)["smoking"], [0.4, 0.6])
+    with pytest.raises(ValueError, match="oof predictions for other, winner"):
+        blend_smart_weighted(str(subs), str(results), str(out), method="optimized", prediction_store=store)
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+from sklearn.metrics import accuracy_score, roc_auc_score
+from evaluation.bootstrap import add_bootstrap_ci, bootstrap_metrics, get_chunk_size, get_resample_weights
+from training.prediction_store import PredictionStore
+from visualization.dashboard import generate_html_report
+
+def test_weighted_resamples_match_sklearn_and_workers():
+    """
+    verifies each weight-vector resample equals sklearn's weighted AUC/accuracy
+    and that chunked multi-process runs reproduce the serial distribution
+    """
+    rng = np.random.default_rng(0)
+    y = rng.integers(0, 2, 300)
+    prob = np.round(np.clip(y * 0.2 + rng.random(300) * 0.8, 0, 1), 2)
+    budget = 300 * 8 * 4 * 7  # 7 resamples per chunk
+
+    serial = bootstrap_metrics(y, prob, n_resamples=20, max_chunk_bytes=budget)
+    parallel = bootstrap_metrics(y, prob, n_resamples=20, max_chunk_bytes=budget, n_workers=2)
+    assert np.array_equal(serial["auc"], parallel["auc"])
+
+    order = np.argsort(-prob, kind='stable')
+    seed = np.random.SeedSequence(42).spawn(3)[0]
+    weights = get_resample_weights(300, get_chunk_size(300, budget), np.random.default_rng(seed))
+    for b in range(3):
+        w = weights[b]
+        assert np.isclose(serial["auc"][b], roc_auc_score(y[order], prob[order], sample_weight=w))
+        assert np.isclose(serial["accuracy"][b], accuracy_score(y[order], prob[order] >= 0.5, sample_weight=w) * w.sum() / 300)
+
+def test_leaderboard_intervals_in_report(tmp_path):
+    """
+    verifies CI columns are attached per stored model and rendered in the report
+    """
+    rng = np.random.default_rng(1)
+    y = rng.integers(0, 2, 200)
+    store = PredictionStore(str(tmp_path / "preds"))
+    store.save_oof("good", np.clip(y * 0.3 + rng.random(200) * 0.7, 0, 1), y=y)
+    board = pd.DataFrame({"model": ["good", "missing"], "auc": [0.9, 0.5], "accuracy": [0.8, 0.5]})
+
+    board = add_bootstrap_ci(board, store, n_resamples=200)
+    assert board.loc[0, "auc_ci_low"] < roc_auc_score(y, store.load("oof", "good")) < board.loc[0, "auc_ci_high"]
+    assert np.isnan(board.loc[1, "auc_ci_low"])
+
+    report = tmp_path / "report.html"
+    generate_html_report(board, str(report))
+    assert "auc 95% CI" in report.read_text()
+    generate_html_report(board, str(report), ci_alpha=0.1)
+    assert "auc 90% CI" in report.read_text()
@@ -28,3 +28,85 @@ def test_scaling_math():
     std = biobeat_scaling.calculate_std(data, mean)
     assert mean == 20.0
     assert pytest.approx(std, 0.01) == 10.0
+
+def test_numpy_overloads_match_list_path():
+    """
+    verifies the numpy buffer overloads agree with the list bindings
+    and return arrays instead of lists
+    """
+    data = [10.0, float('nan'), 20.0, 30.0, float('inf')]
+    arr = np.array(data)
+
+    clean = biobeat_cleaning.remove_invalids(arr)
+    assert isinstance(clean, np.ndarray)
+    assert clean.tolist() == biobeat_cleaning.remove_invalids(data)
+    assert biobeat_cleaning.calculate_median(clean) == 20.0
+
+    mean = biobeat_scaling.calculate_mean(clean)
+    std = biobeat_scaling.calculate_std(clean, mean)
+    scaled = biobeat_scaling.apply_standardization(clean, mean, std)
+    assert isinstance(scaled, np.ndarray)
+    assert scaled.tolist() == biobeat_scaling.apply_standardization(clean.tolist(), mean, std)
+
+def test_inplace_standardization():
+    """
+    verifies in-place scaling writes into the caller's buffer
+    """
+    arr = np.array([10.0, 20.0, 30.0])
+    biobeat_scaling.apply_standardization_inplace(arr, 20.0, 10.0)
+    assert arr.tolist() == [-1.0, 0.0, 1.0]
+
+def test_fused_column_stats():
+    """
+    verifies the single-sweep matrix kernel matches numpy
+    and skips nan/inf cells per column
+    """
+    matrix = np.array([
+        [1.0, 10.0, 5.0],
+        [2.0, float('nan'), 5.0],
+        [4.0, 30.0, 5.0],
+        [7.0, float('inf'), 5.0],
+    ])
+    stats = biobeat_scaling.calculate_column_stats(matrix, True)
+
+    assert stats["count"].tolist() == [4, 2, 4]
+    assert stats["invalid_count"].tolist() == [0, 2, 0]
+    assert np.allclose(stats["mean"], [3.5, 20.0, 5.0])
+    assert np.allclose(stats["variance"], [np.var([1, 2, 4, 7], ddof=1), 200.0, 0.0])
+    assert stats["min"].tolist() == [1.0, 10.0, 5.0]
+    assert stats["max"].tolist() == [7.0, 30.0, 5.0]
+    assert stats["median"].tolist() == [3.0, 20.0, 5.0]
+
+def test_thread_count_does_not_change_results():
+    """
+    verifies the chunked reductions give bit-identical results
+    for serial and multi-threaded runs
+    """
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=200_003)
+    matrix = rng.normal(size=(5_000, 40))
+
+    means = {biobeat_scaling.calculate_mean(data, num_threads=t) for t in (1, 2, 4)}
+    stds = {biobeat_scaling.calculate_std(data, 0.0, num_threads=t) for t in (1, 2, 4)}
+    assert len(means) == 1 and len(stds) == 1
+
+    serial = biobeat_scaling.calculate_column_stats(matrix, True, 1)
+    threaded = biobeat_scaling.calculate_column_stats(matrix, True, 4)
+    for key in serial:
+        assert np.array_equal(serial[key], threaded[key])
+
+def test_impute_median_keeps_rows():
+    """
+    verifies nan/inf cells are replaced in place by the column median
+    with per-column imputation counts
+    """
+    matrix = np.array([
+        [1.0, float('nan')],
+        [float('inf'), 4.0],
+        [3.0, 6.0],
+        [5.0, float('nan')],
+    ])
+    counts, medians = biobeat_cleaning.impute_median(matrix)
+    assert counts.tolist() == [1, 2]
+    assert medians.tolist() == [3.0, 5.0]
+    assert matrix.tolist() == [[1.0, 5.0], [3.0, 4.0], [3.0, 6.0], [5.0, 5.0]]
@@ -0,0 +1,103 @@
+import numpy as np
+from sklearn.ensemble import GradientBoostingClassifier, HistGradientBoostingClassifier
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.neural_network import MLPClassifier
+from xgboost import XGBClassifier
+import training.model_registry as model_registry
+from training.compare_models import compare_all_models
+from training.cross_validation import run_5_fold_cv
+from training.early_stopping import refit_with_best_iterations
+from training.results_cache import ResultsCache
+
+def _toy_data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 4))
+    y = (X[:, 0] + rng.normal(scale=0.8, size=300) > 0).astype(int)
+    return X, y
+
+def test_boosted_cv_records_best_rounds_and_refits_on_median():
+    """
+    verifies xgboost stops early on every fold and the refit
+    trains for the median kept round count
+    """
+    X, y = _toy_data()
+    model = XGBClassifier(n_estimators=500, learning_rate=0.3, max_depth=3)
+    best_iterations = []
+    cv_results = run_5_fold_cv(model, X, y, early_stopping_rounds=10, best_iterations=best_iterations)
+
+    assert len(cv_results) == 5 and len(best_iterations) == 5
+    assert max(best_iterations) < 500
+    assert model.get_params()["early_stopping_rounds"] is None
+
+    refit_with_best_iterations(model, X, y, best_iterations)
+    assert model.get_booster().num_boosted_rounds() == int(round(np.median(best_iterations)))
+
+def test_early_stopping_falls_back_for_other_models():
+    """
+    verifies sklearn boosting reports its kept stages and
+    models without early stopping train as before
+    """
+    X, y = _toy_data()
+    best_iterations = []
+    run_5_fold_cv(GradientBoostingClassifier(n_estimators=300), X, y, early_stopping_rounds=5, best_iterations=best_iterations)
+    assert len(best_iterations) == 5 and max(best_iterations) <= 300
+
+    plain = []
+    with_es = run_5_fold_cv(LogisticRegression(), X, y, early_stopping_rounds=5, best_iterations=plain)
+    without = run_5_fold_cv(LogisticRegression(), X, y)
+    assert plain == []
+    assert all(np.array_equal(a[1], b[1]) for a, b in zip(with_es, without))
+
+def test_iteration_based_estimators_stop_on_n_iter():
+    """
+    verifies hist gradient boosting, MLP and SGD report n_iter_ per fold
+    (they have n_iter_no_change but no n_estimators_) and refit with max_iter
+    """
+    X, y = _toy_data()
+    for model in (HistGradientBoostingClassifier(max_iter=300, early_stopping=False),
+                  MLPClassifier(hidden_layer_sizes=(8,), max_iter=300, random_state=0),
+                  SGDClassifier(loss="log_loss", max_iter=300, random_state=0)):
+        best_iterations = []
+        run_5_fold_cv(model, X, y, early_stopping_rounds=3, best_iterations=best_iterations)
+        assert len(best_iterations) == 5 and max(best_iterations) < 300
+        assert model.get_params()["early_stopping"] is False
+
+    model = HistGradientBoostingClassifier(max_iter=300, early_stopping=False)
+    refit_with_best_iterations(model, X, y, [10, 12, 14])
+    assert model.n_iter_ == 12 and model.get_params()["max_iter"] == 12
+
+def test_gauntlet_early_stops_registered_models(tmp_path, write_model_module, monkeypatch):
+    """
+    verifies compare_all_models passes the patience only to models registered
+    with supports_early_stopping, on the serial and parallel paths, and
+    cached folds hand back the rounds they kept
+    """
+    gbm = write_model_module("toy_gbm_model",
+        "from sklearn.ensemble import GradientBoostingClassifier\n"
+        "def get_model():\n"
+        "    return GradientBoostingClassifier(n_estimators=300, random_state=0)\n"
+    )
+    plain = write_model_module("toy_plain_gbm_model",
+        "from toy_gbm_model import get_model\n"
+    )
+    monkeypatch.setattr(model_registry, "_registry", dict(model_registry._registry))
+    model_registry.register_model("toy_gbm_model", gbm, supports_early_stopping=True)
+    X, y = _toy_data()
+
+    serial = {}
+    compare_all_models(X, y, model_modules=[gbm, plain], early_stopping_rounds=5, best_iterations=serial)
+    assert list(serial) == [gbm] and len(serial[gbm]) == 5 and max(serial[gbm]) < 300
+
+    parallel = {}
+    compare_all_models(X, y, n_workers=2, threads_per_model=1, model_modules=[gbm, plain],
+                       early_stopping_rounds=5, best_iterations=parallel)
+    assert parallel == serial
+
+    cache = ResultsCache(str(tmp_path / "cache"))
+    first, cached = {}, {}
+    compare_all_models(X, y, model_modules=[gbm], cache=cache, early_stopping_rounds=5, best_iterations=first)
+    compare_all_models(X, y, model_modules=[gbm], cache=cache, early_stopping_rounds=5, best_iterations=cached)
+    assert cached == first == serial
+    full = {}
+    compare_all_models(X, y, model_modules=[gbm], cache=cache, best_iterations=full)
+    assert full == {}
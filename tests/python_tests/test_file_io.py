@@ -1,6 +1,9 @@
 import os
 import pandas as pd
 from file_io.csv_reader import get_numeric_column
+from file_io.columnar_reader import read_numeric_columns
+from file_io.fast_reader import read_numeric_table
+import numpy as np
 from file_io.csv_to_parquet import convert_to_parquet
 
 def test_csv_column_reader(tmp_path):
@@ -26,3 +29,54 @@ def test_parquet_conversion(tmp_path):
     
     convert_to_parquet(str(csv_path), str(pq_path))
     assert os.path.exists(pq_path)
+
+def test_columnar_reader_matches_column_reader(tmp_path):
+    """
+    verifies the single-pass columnar reader returns the same
+    values as re-reading each column, including invalid cells
+    """
+    csv_file = tmp_path / "raw.csv"
+    csv_file.write_text("id,a,b\n1,1.5,x\n2,,2.5\n3,3.5,4.5\n")
+
+    table = read_numeric_columns(str(csv_file), [1, 2])
+    assert table[1].tolist() == get_numeric_column(str(csv_file), 1)
+    assert table[2].tolist() == get_numeric_column(str(csv_file), 2)
+
+def test_fast_reader_matches_python_engine(tmp_path):
+    """
+    verifies the pyarrow engine gives the same values as the csv module,
+    including late invalid cells, tsv input, and headerless files
+    """
+    csv_file = tmp_path / "dirty.csv"
+    rows = [f"{i},{i * 0.5}" for i in range(2000)] + ["2000,oops", "2001,"]
+    csv_file.write_text("id,val\n" + "\n".join(rows) + "\n")
+
+    fast = get_numeric_column(str(csv_file), 1, engine="pyarrow")
+    assert fast == get_numeric_column(str(csv_file), 1, engine="python")
+
+    aligned = read_numeric_columns(str(csv_file), [1], row_aligned=True, engine="pyarrow")[1]
+    assert len(aligned) == 2002 and np.isnan(aligned[-2:]).all()
+
+    tsv_file = tmp_path / "data.tsv"
+    tsv_file.write_text("1\t2.5\n3\t4.5\n")
+    names, columns = read_numeric_table(str(tsv_file))
+    assert names == ["col_0", "col_1"]
+    assert columns["col_1"].tolist() == [2.5, 4.5]
+
+def test_fast_reader_blocks_and_booleans(tmp_path):
+    """
+    verifies an invalid cell in a later arrow block (the column was inferred
+    numeric from the first block) becomes nan without losing the earlier values,
+    and true/false cells are invalid in both engines
+    """
+    csv_file = tmp_path / "late.csv"
+    rows = [f"{i},{i * 0.25}" for i in range(5000)] + ["5000,bad"]
+    csv_file.write_text("id,val\n" + "\n".join(rows) + "\n")
+    names, columns = read_numeric_table(str(csv_file), ["val"], block_size=4096)
+    assert len(columns["val"]) == 5001 and np.isnan(columns["val"][-1])
+    assert columns["val"][:5000].tolist() == [i * 0.25 for i in range(5000)]
+
+    bool_file = tmp_path / "flags.csv"
+    bool_file.write_text("id,flag\n1,true\n2,false\n3,true\n")
+    assert get_numeric_column(str(bool_file), 1, engine="pyarrow") == []
+    assert get_numeric_column(str(bool_file), 1, engine="python") == []
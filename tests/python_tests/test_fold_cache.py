@@ -0,0 +1,35 @@
+import numpy as np
+from sklearn.model_selection import StratifiedKFold
+from training.fold_cache import FoldViews, get_fold_ids, get_fold_indices
+
+def test_cached_folds_match_stratified_kfold():
+    """
+    verifies cached fold indices equal StratifiedKFold.split
+    and repeated lookups reuse the cached assignment
+    """
+    rng = np.random.default_rng(3)
+    y = rng.integers(0, 2, size=103)
+    skf = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
+
+    for (train, val), (ref_train, ref_val) in zip(get_fold_indices(y), skf.split(np.zeros(len(y)), y)):
+        assert np.array_equal(train, ref_train)
+        assert np.array_equal(val, ref_val)
+
+    assert get_fold_ids(y) is get_fold_ids(y.copy())
+
+def test_fold_views_reuse_buffers():
+    """
+    verifies fold views hold the same rows as fancy indexing
+    while reusing one preallocated buffer across folds
+    """
+    rng = np.random.default_rng(4)
+    X = rng.normal(size=(53, 3))
+    y = rng.integers(0, 2, size=53)
+    views = FoldViews(X, y)
+
+    first_buffer = views.split(0)[0].base
+    for fold, (train, val) in enumerate(get_fold_indices(y)):
+        X_train, X_val, y_train, y_val = views.split(fold)
+        assert np.array_equal(X_train, X[train]) and np.array_equal(X_val, X[val])
+        assert np.array_equal(y_train, y[train]) and np.array_equal(y_val, y[val])
+        assert X_train.base is first_buffer
@@ -0,0 +1,85 @@
+import os
+import time
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+from job_runner import resolve_models, run_job
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def test_run_job_end_to_end(tmp_path, toy_model_module, toy_train_test):
+    """
+    verifies one job preprocesses, ranks the models and scores the test file
+    entirely under its own job directory
+    """
+    result = run_job(str(tmp_path / "job"), toy_train_test, [toy_model_module], n_threads=1)
+    assert [row["model"] for row in result["leaderboard"]] == [toy_model_module]
+    assert pd.read_csv(result["submission"])["id"].tolist() == list(range(1000, 1060))
+    assert resolve_models("manual", '["xgb", "logreg"]') == ["xgboost_model", "logistic_model"]
+    with pytest.raises(ValueError):
+        resolve_models("manual", "not_a_model")
+
+def test_job_endpoints(tmp_path, monkeypatch, toy_model_module, toy_train_test):
+    """
+    verifies /api/run queues a job on the worker pool, status and result
+    endpoints track it to the leaderboard, and unknown models / jobs are rejected
+    """
+    monkeypatch.syspath_prepend(REPO_ROOT)
+    import app_api
+    from training import model_registry
+    monkeypatch.setattr(app_api, "RUNS_DIR", str(tmp_path / "runs"))
+    # registered in this process only; the worker receives the module path
+    monkeypatch.setattr(model_registry, "_registry", dict(model_registry._registry))
+    model_registry.register_model("toy_logistic", toy_model_module, cost="cheap")
+    paths = toy_train_test
+
+    with TestClient(app_api.app) as client:
+        files = [("files", (os.path.basename(p), open(p, "rb"), "text/csv")) for p in paths]
+        response = client.post("/api/run", data={"mode": "manual", "models": "toy_logistic"}, files=files)
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+
+        deadline = time.time() + 120
+        while client.get(f"/api/jobs/{job_id}").json()["status"] in ("queued", "running") and time.time() < deadline:
+            time.sleep(0.2)
+        status = client.get(f"/api/jobs/{job_id}").json()
+        assert status["status"] == "done", status.get("error")
+        result = client.get(f"/api/jobs/{job_id}/result")
+        assert result.status_code == 200
+        assert [row["model"] for row in result.json()["leaderboard"]] == [toy_model_module]
+        assert pd.read_csv(result.json()["submission"])["id"].tolist() == list(range(1000, 1060))
+
+        assert client.get("/api/jobs/missing").status_code == 404
+        bad = client.post("/api/run", data={"mode": "manual", "models": "nope"}, files=files[:1])
+        assert bad.status_code == 400
+
+def test_slots_reserved_during_upload_and_finished_jobs_evicted(tmp_path, monkeypatch, toy_train_test):
+    """
+    verifies a job still uploading holds its slot (429 for the next one)
+    and finished jobs are dropped by age and by count
+    """
+    monkeypatch.syspath_prepend(REPO_ROOT)
+    import app_api
+    monkeypatch.setattr(app_api, "RUNS_DIR", str(tmp_path / "runs"))
+    monkeypatch.setattr(app_api, "MAX_RUNNING_JOBS", 1)
+    monkeypatch.setattr(app_api, "MAX_PENDING_JOBS", 0)
+    monkeypatch.setattr(app_api, "jobs", {"uploading": {"status": "uploading", "_future": None}})
+    paths = toy_train_test
+
+    with TestClient(app_api.app) as client:
+        files = [("files", (os.path.basename(p), open(p, "rb"), "text/csv")) for p in paths]
+        response = client.post("/api/run", data={"mode": "manual", "models": "logreg"}, files=files)
+        assert response.status_code == 429
+
+    now = time.time()
+    monkeypatch.setattr(app_api, "MAX_RETAINED_JOBS", 2)
+    app_api.jobs.clear()
+    app_api.jobs.update({
+        "stale": {"finished_at": now - app_api.JOB_TTL_SECONDS - 1},
+        "old": {"finished_at": now - 30},
+        "mid": {"finished_at": now - 20},
+        "new": {"finished_at": now - 10},
+        "active": {"_future": None},
+    })
+    app_api.evict_finished_jobs(now)
+    assert sorted(app_api.jobs) == ["active", "mid", "new"]
@@ -0,0 +1,40 @@
+import numpy as np
+from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score, roc_auc_score
+from evaluation.metrics import get_batched_metrics, get_classification_metrics, get_cv_metrics, get_threshold_sweep
+
+def test_single_sort_metrics_match_sklearn():
+    """
+    verifies AUC (with ties), threshold metrics and the best-f1 sweep
+    against sklearn on rounded (heavily tied) scores
+    """
+    rng = np.random.default_rng(0)
+    y = rng.integers(0, 2, 500)
+    prob = np.round(np.clip(y * 0.3 + rng.random(500) * 0.7, 0, 1), 2)
+
+    metrics = get_batched_metrics(y, prob)
+    assert np.isclose(metrics["auc"], roc_auc_score(y, prob), rtol=0, atol=1e-12)
+    assert metrics["accuracy"] == accuracy_score(y, prob >= 0.5)
+    assert metrics["precision"] == precision_score(y, prob >= 0.5)
+    assert metrics["recall"] == recall_score(y, prob >= 0.5)
+    best_f1 = max(f1_score(y, prob >= t) for t in np.unique(prob))
+    assert np.isclose(metrics["best_f1"], best_f1)
+    assert np.isclose(f1_score(y, prob >= metrics["best_threshold"]), best_f1)
+
+    sweep = get_threshold_sweep(y, prob)
+    assert np.all(np.diff(sweep["threshold"]) < 0)
+    assert np.isclose(sweep["f1"].max(), best_f1)
+
+    legacy = get_classification_metrics(y, (prob >= 0.5).astype(int), prob)
+    assert legacy["f1"] == f1_score(y, prob >= 0.5)
+
+def test_batched_over_ragged_folds():
+    """
+    verifies one padded batch over folds of different sizes
+    matches scoring each fold on its own
+    """
+    rng = np.random.default_rng(1)
+    folds = [(rng.integers(0, 2, n), rng.random(n)) for n in (40, 37, 39)]
+    batched = get_cv_metrics(folds)
+    for k, (y, prob) in enumerate(folds):
+        assert np.isclose(batched["auc"][k], roc_auc_score(y, prob))
+        assert batched["f1"][k] == f1_score(y, prob >= 0.5)
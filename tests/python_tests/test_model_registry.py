@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+import pytest
+import training.model_registry as model_registry
+from training.model_registry import build_model, get_model_spec, list_models, register_model
+
+def test_registry_metadata_without_imports():
+    """
+    verifies the built-in specs expose metadata without importing
+    their model modules or frameworks
+    """
+    assert len(list_models()) == 11
+    spec = get_model_spec("models.tabnet_model")
+    assert spec is get_model_spec("tabnet_model")
+    assert spec.cost == "heavy" and "torch" in spec.requires
+    assert get_model_spec("xgboost_model").factory == "get_xgboost_classifier"
+    assert "cheap" not in [get_model_spec(n).cost for n in list_models("heavy")]
+    assert get_model_spec("gbm_model").supports_early_stopping
+    assert not get_model_spec("logistic_model").supports_early_stopping
+
+    # a fresh interpreter, since other tests import the frameworks here
+    scripts_dir = os.path.dirname(os.path.dirname(model_registry.__file__))
+    probe = (
+        "import sys\n"
+        "import training.model_registry, main_full_run\n"
+        "print(','.join(m for m in ('torch', 'sklearn', 'xgboost', 'pandas') if m in sys.modules))\n"
+    )
+    loaded = subprocess.run([sys.executable, "-c", probe], cwd=scripts_dir, capture_output=True, text=True, check=True)
+    assert loaded.stdout.strip() == ""
+
+def test_build_registered_and_adhoc_modules(write_model_module, monkeypatch):
+    """
+    verifies a registered model and an unregistered module path
+    exposing get_model() are both built on demand
+    """
+    write_model_module("toy_registry_model",
+        "from sklearn.naive_bayes import GaussianNB\n"
+        "def make():\n"
+        "    return GaussianNB()\n"
+        "def get_model():\n"
+        "    return GaussianNB(var_smoothing=1e-3)\n"
+    )
+    monkeypatch.setattr(model_registry, "_registry", dict(model_registry._registry))
+    assert build_model("toy_registry_model").var_smoothing == 1e-3
+
+    register_model("toy_nb", "toy_registry_model", factory="make", cost="cheap")
+    assert build_model("toy_nb").var_smoothing == 1e-9
+
+    register_model("toy_missing", "toy_registry_model", factory="not_there")
+    with pytest.raises(AttributeError, match="not_there"):
+        build_model("toy_missing")
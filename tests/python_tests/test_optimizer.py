@@ -0,0 +1,33 @@
+import optuna
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+from tuning.optimizer import get_journal_storage, get_search_space, make_objective, tune_hyperparameters
+
+def _toy_data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(120, 3))
+    y = (X[:, 0] + rng.normal(scale=0.5, size=120) > 0).astype(int)
+    return X, y
+
+def test_parallel_tuning_uses_model_search_space(tmp_path):
+    """
+    verifies the process workers share one journal study and
+    that LogisticRegression is tuned over its own space (C)
+    """
+    X, y = _toy_data()
+    journal = str(tmp_path / "study.journal")
+    best = tune_hyperparameters(LogisticRegression, X, y, n_trials=4, n_workers=2, storage_path=journal)
+    assert set(best) == {"C"}
+
+    storage = get_journal_storage(journal)
+    study = optuna.load_study(study_name=optuna.get_all_study_names(storage)[0], storage=storage)
+    assert len(study.trials) == 4
+
+def test_objective_reports_every_fold():
+    """
+    verifies the running AUC is reported after each fold for the pruner
+    """
+    X, y = _toy_data()
+    study = optuna.create_study(direction="maximize")
+    study.optimize(make_objective(LogisticRegression, X, y, get_search_space(LogisticRegression)), n_trials=1)
+    assert sorted(study.trials[0].intermediate_values) == [0, 1, 2]
@@ -0,0 +1,24 @@
+import os
+import pandas as pd
+from pipeline_api import ensure_extensions_built, preprocess, run_pipeline
+
+def test_run_pipeline_reuses_workspace_artifacts(tmp_path, write_model_module, toy_train_test):
+    """
+    verifies the in-process pipeline writes results under the workspace
+    and skips preprocessing when the raw file has not changed
+    """
+    # a dotted module path, so the winner must be rebuilt from the full path
+    module_name = write_model_module("toy_pkg.toy_pipeline_model")
+    raw, test = toy_train_test
+
+    assert ensure_extensions_built() is False
+    workspace = tmp_path / "ws"
+    result = run_pipeline(str(workspace), raw, test, model_modules=[module_name], n_resamples=0)
+    assert result["leaderboard"][0]["model"] == "toy_pipeline_model"
+    assert "auc_ci_low" not in result["leaderboard"][0]
+    assert os.path.exists(result["report"]) and len(pd.read_csv(result["submission"])) == 60
+
+    parquet_path = preprocess(raw, str(workspace / "processed"))
+    mtime = os.path.getmtime(parquet_path)
+    assert preprocess(raw, str(workspace / "processed")) == parquet_path
+    assert os.path.getmtime(parquet_path) == mtime
@@ -0,0 +1,64 @@
+import numpy as np
+from training.prediction_store import PredictionStore
+from training.compare_models import compare_all_models
+from training.cross_validation import run_5_fold_cv
+from sklearn.linear_model import LogisticRegression
+
+def test_store_round_trip(tmp_path):
+    """
+    verifies oof/test vectors come back memory-mapped and stacked
+    into a rows x models matrix with their row ids
+    """
+    store = PredictionStore(str(tmp_path / "preds"))
+    store.save_oof("a", np.array([0.1, 0.2, 0.3]), y=np.array([0, 1, 1]))
+    store.save_oof("b", np.array([0.4, 0.5, 0.6]))
+    store.save_test("a", np.array([0.7, 0.8]), row_ids=np.array([10, 11]))
+
+    names, matrix = store.load_matrix("oof")
+    assert names == ["a", "b"]
+    assert matrix.tolist() == [[0.1, 0.4], [0.2, 0.5], [0.3, 0.6]]
+    assert store.load_target().tolist() == [0, 1, 1]
+    assert store.load_row_ids("test").tolist() == [10, 11]
+    assert isinstance(store.load("oof", "a"), np.memmap)
+
+def test_gauntlet_persists_oof(tmp_path, toy_model_module):
+    """
+    verifies compare_all_models writes one oof probability per row
+    matching the per-fold cross-validation output
+    """
+    rng = np.random.default_rng(5)
+    X = rng.normal(size=(120, 3))
+    y = (X[:, 1] > 0).astype(int)
+    store = PredictionStore(str(tmp_path / "preds"))
+    compare_all_models(X, y, model_modules=[toy_model_module], prediction_store=store)
+
+    oof = store.load("oof", toy_model_module)
+    folds = run_5_fold_cv(LogisticRegression(max_iter=200), X, y)
+    assert len(oof) == len(y)
+    assert np.allclose(np.sort(oof), np.sort(np.concatenate([p for _, p in folds])))
+
+def test_store_drops_stale_vectors_when_rows_change(tmp_path, toy_model_module):
+    """
+    verifies a reused store clears vectors saved for other rows
+    instead of failing every save, and the gauntlet still ranks models
+    """
+    store = PredictionStore(str(tmp_path / "preds"))
+    store.save_oof("old", np.array([0.1, 0.2, 0.3]), y=np.array([0, 1, 1]))
+    store.save_test("old", np.array([0.7, 0.8]), row_ids=np.array([10, 11]))
+    store.save_test("kept", np.array([0.5, 0.6]))
+    assert store.load_row_ids("test").tolist() == [10, 11]
+
+    store.save_test("new", np.array([0.1, 0.2]), row_ids=np.array([20, 21]))
+    assert store.list_models("test") == ["new"]
+    assert store.load_row_ids("test").tolist() == [20, 21]
+
+    store.save_oof("same_rows", np.array([0.5, 0.5, 0.5]), y=np.array([1, 1, 0]))
+    assert store.list_models("oof") == ["same_rows"]
+
+    rng = np.random.default_rng(6)
+    X = rng.normal(size=(80, 3))
+    y = (X[:, 0] > 0).astype(int)
+    leaderboard = compare_all_models(X, y, model_modules=[toy_model_module], prediction_store=store)
+    assert leaderboard["model"].tolist() == [toy_model_module]
+    assert store.list_models("oof") == [toy_model_module]
+    assert store.load_target().tolist() == y.tolist()
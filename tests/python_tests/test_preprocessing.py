@@ -0,0 +1,166 @@
+import pandas as pd
+from run_preprocessing import run_full_pipeline
+from scaling.preprocessing_artifact import apply_preprocessing, get_artifact_path, load_preprocessing_artifact
+
+def _write_raw_csv(path):
+    df = pd.DataFrame({
+        "id": range(6),
+        "height(cm)": [170.0, 165.0, 180.0, 175.0, 160.0, 185.0],
+        "weight(kg)": [70.0, 60.0, 85.0, 75.0, 55.0, 90.0],
+        "systolic": [120.0, 110.0, 130.0, 125.0, 115.0, 140.0],
+        "relaxation": [80.0, 70.0, 85.0, 82.0, 75.0, 90.0],
+        "smoking": [0, 1, 0, 1, 0, 1],
+    })
+    df.to_csv(path, index=False)
+
+def test_single_pass_matches_per_column(tmp_path):
+    """
+    verifies the single-pass columnar mode writes the same
+    parquet as the legacy per-column re-read path (the fused stats
+    kernel sums in a different order, so up to the last bits)
+    """
+    raw = tmp_path / "train.csv"
+    _write_raw_csv(raw)
+
+    run_full_pipeline(str(raw), str(tmp_path / "legacy"), "out.csv", single_pass=False)
+    run_full_pipeline(str(raw), str(tmp_path / "fast"), "out.csv", single_pass=True)
+
+    legacy = pd.read_parquet(tmp_path / "legacy" / "out.parquet")
+    fast = pd.read_parquet(tmp_path / "fast" / "out.parquet")
+    pd.testing.assert_frame_equal(legacy, fast, check_exact=False, rtol=1e-12)
+
+def test_batched_mode_matches_in_memory(tmp_path):
+    """
+    verifies the streaming row-batch mode produces the same table
+    as the in-memory path (up to merge rounding)
+    """
+    raw = tmp_path / "train.csv"
+    _write_raw_csv(raw)
+
+    run_full_pipeline(str(raw), str(tmp_path / "memory"), "out.csv")
+    run_full_pipeline(str(raw), str(tmp_path / "stream"), "out.csv", batch_size=4)
+
+    memory = pd.read_parquet(tmp_path / "memory" / "out.parquet")
+    stream = pd.read_parquet(tmp_path / "stream" / "out.parquet")
+    pd.testing.assert_frame_equal(memory, stream, check_exact=False)
+
+    # an explicit empty spec means no engineered features in either mode
+    run_full_pipeline(str(raw), str(tmp_path / "plain"), "out.csv", feature_spec=[])
+    run_full_pipeline(str(raw), str(tmp_path / "plain_stream"), "out.csv", batch_size=4, feature_spec=[])
+    for out_dir in ("plain", "plain_stream"):
+        plain = pd.read_parquet(tmp_path / out_dir / "out.parquet")
+        assert "bmi_proxy" not in plain.columns and "bmi_proxy" in memory.columns
+
+def test_artifact_reproduces_training_transform(tmp_path):
+    """
+    verifies the saved preprocessing artifact applied to raw rows
+    rebuilds the training feature matrix, and imputes bad cells
+    """
+    raw = tmp_path / "train.csv"
+    _write_raw_csv(raw)
+    run_full_pipeline(str(raw), str(tmp_path / "out"), "out.csv")
+
+    artifact = load_preprocessing_artifact(get_artifact_path(str(tmp_path / "out" / "out.csv")))
+    train = pd.read_parquet(tmp_path / "out" / "out.parquet").drop(columns=["smoking"])
+
+    raw_df = pd.read_csv(raw)
+    applied = apply_preprocessing(raw_df, artifact)
+    pd.testing.assert_frame_equal(applied, train, check_exact=False)
+
+    raw_df.loc[0, "systolic"] = float("nan")
+    imputed = apply_preprocessing(raw_df, artifact)
+    median_z = (artifact["median"][2] - artifact["mean"][2]) / artifact["std"][2]
+    assert imputed.loc[0, "systolic"] == median_z
+
+def test_invalid_cells_are_imputed_not_dropped(tmp_path):
+    """
+    verifies dirty cells keep their row (median-imputed) so columns
+    stay aligned with each other and with the target
+    """
+    raw = tmp_path / "dirty.csv"
+    raw.write_text(
+        "id,systolic,relaxation,smoking\n"
+        "0,120,80,0\n"
+        "1,n/a,70,1\n"
+        "2,130,,0\n"
+        "3,110,90,1\n"
+    )
+    run_full_pipeline(str(raw), str(tmp_path / "out"), "out.csv")
+
+    df = pd.read_parquet(tmp_path / "out" / "out.parquet")
+    assert len(df) == 4
+    assert df["smoking"].tolist() == [0, 1, 0, 1]
+    # imputed systolic is the median (120); imputed relaxation is 80
+    assert df.loc[1, "systolic"] == df.loc[0, "systolic"]
+    assert df.loc[2, "relaxation"] == df.loc[0, "relaxation"]
+
+def test_in_memory_mode_writes_no_intermediates(tmp_path):
+    """
+    verifies the default mode writes only the parquet and artifact,
+    while write_intermediates keeps the debug csv files
+    """
+    raw = tmp_path / "train.csv"
+    _write_raw_csv(raw)
+
+    run_full_pipeline(str(raw), str(tmp_path / "clean"), "out.csv")
+    assert sorted(p.name for p in (tmp_path / "clean").iterdir()) == ["out.parquet", "out_preprocessing.npz"]
+
+    run_full_pipeline(str(raw), str(tmp_path / "debug"), "out.csv", write_intermediates=True)
+    names = {p.name for p in (tmp_path / "debug").iterdir()}
+    assert "out.csv" in names and "temp_systolic.csv" in names
+
+def test_feature_table_uses_one_fused_stats_call(tmp_path, monkeypatch):
+    """
+    verifies the single-pass table gets every column's mean/std from
+    one fused c++ sweep instead of per-column scans
+    """
+    import process_dataset
+    raw = tmp_path / "train.csv"
+    _write_raw_csv(raw)
+    calls = []
+    fused = process_dataset.get_matrix_scaling_parameters
+    monkeypatch.setattr(process_dataset, "get_matrix_scaling_parameters",
+                        lambda matrix, num_threads=1: calls.append(matrix.shape) or fused(matrix, num_threads))
+
+    scaled, stats, _ = process_dataset.process_feature_table(str(raw), {1: "height(cm)", 2: "weight(kg)", 3: "systolic"})
+    assert calls == [(6, 3)]
+    assert list(scaled) == ["height(cm)", "weight(kg)", "systolic"]
+    assert abs(stats["systolic"]["mean"] - 123.33333333333333) < 1e-9
+    assert abs(float(scaled["height(cm)"].mean())) < 1e-12
+
+def test_feature_table_imputes_with_the_median_kernel(tmp_path, monkeypatch):
+    """
+    verifies the single-pass table imputes through impute_median_inplace
+    and reports the medians and counts it returns
+    """
+    import process_dataset
+    raw = tmp_path / "dirty.csv"
+    raw.write_text("id,systolic,relaxation\n0,120,80\n1,n/a,70\n2,130,\n3,110,90\n")
+    calls = []
+    impute = process_dataset.impute_median_inplace
+    monkeypatch.setattr(process_dataset, "impute_median_inplace",
+                        lambda matrix, num_threads=1: calls.append(matrix.shape) or impute(matrix, num_threads))
+
+    _, stats, _ = process_dataset.process_feature_table(str(raw), {1: "systolic", 2: "relaxation"})
+    assert calls == [(4, 2)]
+    assert stats["systolic"]["median"] == 120.0 and stats["systolic"]["n_imputed"] == 1
+    assert stats["relaxation"]["median"] == 80.0 and stats["relaxation"]["n_imputed"] == 1
+
+def test_single_pass_reads_target_from_tsv(tmp_path, monkeypatch):
+    """
+    verifies the single-pass mode takes the target from the same
+    delimiter-aware parse (no second pandas read of the raw file)
+    """
+    import run_preprocessing
+    csv_raw = tmp_path / "train.csv"
+    _write_raw_csv(csv_raw)
+    tsv_raw = tmp_path / "train.tsv"
+    pd.read_csv(csv_raw).to_csv(tsv_raw, sep="\t", index=False)
+    monkeypatch.setattr(run_preprocessing.pd, "read_csv", None)
+
+    run_full_pipeline(str(csv_raw), str(tmp_path / "csv"), "out.csv")
+    run_full_pipeline(str(tsv_raw), str(tmp_path / "tsv"), "out.csv")
+    from_csv = pd.read_parquet(tmp_path / "csv" / "out.parquet")
+    from_tsv = pd.read_parquet(tmp_path / "tsv" / "out.parquet")
+    assert from_tsv["smoking"].dtype == "int64"
+    pd.testing.assert_frame_equal(from_csv, from_tsv, check_exact=True)
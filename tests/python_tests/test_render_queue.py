@@ -0,0 +1,50 @@
+import os
+import numpy as np
+from sklearn.metrics import roc_curve
+from evaluation.importance import get_feature_importance
+from visualization.plotting_engine import save_model_visuals
+from visualization.render_queue import RenderQueue, downsample_curve
+
+def test_downsampled_curve_stays_on_the_full_curve():
+    """
+    verifies the downsampled ROC curve is bounded, keeps both endpoints and
+    deviates from the full-resolution curve by less than a pixel's worth
+    """
+    rng = np.random.default_rng(0)
+    y = rng.integers(0, 2, 200_000)
+    prob = np.clip(y * 0.2 + rng.random(200_000) * 0.8, 0, 1)
+    fpr, tpr, _ = roc_curve(y, prob)
+    x_s, y_s = downsample_curve(fpr, tpr, max_points=500)
+
+    assert len(x_s) <= 502
+    assert (x_s[0], y_s[0], x_s[-1], y_s[-1]) == (fpr[0], tpr[0], fpr[-1], tpr[-1])
+    # the curve is monotone, so every dropped point lies in the box between two
+    # kept neighbours and is at most the box's short side away from the chord
+    kept = np.searchsorted(fpr + tpr, x_s + y_s)
+    dropped_gap = np.diff(kept) > 1
+    assert np.max(np.minimum(np.diff(x_s), np.diff(y_s))[dropped_gap]) < 0.01
+    assert abs(np.trapezoid(y_s, x_s) - np.trapezoid(tpr, fpr)) < 1e-3
+
+def test_unchanged_figures_are_skipped(tmp_path):
+    """
+    verifies figures render (inline and through the pool) and that
+    resubmitting identical content skips the render while changes redraw
+    """
+    rng = np.random.default_rng(1)
+    y = rng.integers(0, 2, 500)
+    prob = rng.random(500)
+
+    save_model_visuals(y, prob, "m", str(tmp_path))
+    for suffix in ("roc", "pr", "cm"):
+        assert os.path.getsize(tmp_path / f"m_{suffix}.png") > 0
+
+    queue = RenderQueue(n_workers=1)
+    save_model_visuals(y, prob, "m", str(tmp_path), queue=queue)
+    assert len(queue.skipped) == 3
+    save_model_visuals(y, 1 - prob, "m", str(tmp_path), queue=queue)
+    assert len(queue.wait()) == 3
+
+    class Model:
+        feature_importances_ = np.array([0.1, 0.5, 0.4])
+    get_feature_importance(Model(), ["a", "b", "c"], "m", str(tmp_path), queue=queue)
+    assert queue.wait() == [f"{tmp_path}/m_importance.png"]
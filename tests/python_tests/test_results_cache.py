@@ -0,0 +1,62 @@
+import os
+import numpy as np
+import training.compare_models as compare_models
+from training.compare_models import compare_all_models
+from training.results_cache import ResultsCache, get_model_key
+
+def test_cached_gauntlet_skips_training(tmp_path, monkeypatch, toy_model_module):
+    """
+    verifies a second run reuses every cached (model, fold) result,
+    serially and on the process pool, with an identical leaderboard
+    """
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(150, 3))
+    y = (X[:, 1] > 0).astype(int)
+    cache = ResultsCache(str(tmp_path / "cache"))
+
+    first = compare_all_models(X, y, model_modules=[toy_model_module], cache=cache)
+    assert len(os.listdir(tmp_path / "cache")) == 5
+
+    def no_training(*args, **kwargs):
+        raise AssertionError("model was retrained")
+    monkeypatch.setattr(compare_models, "run_5_fold_cv", no_training)
+    second = compare_all_models(X, y, model_modules=[toy_model_module], cache=cache)
+    parallel = compare_all_models(X, y, n_workers=2, model_modules=[toy_model_module], cache=cache)
+
+    assert np.allclose(first["auc"].values, second["auc"].values)
+    assert np.allclose(first["auc"].values, parallel["auc"].values)
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """
+    verifies the size bound drops the oldest entries first
+    and that reads count as use
+    """
+    cache = ResultsCache(str(tmp_path), max_bytes=10**9)
+    for fold in range(3):
+        cache.save("data", "model", fold, np.zeros(100), np.ones(100))
+        os.utime(cache._path("data", "model", fold), (fold, fold))
+    assert cache.load("data", "model", 0) is not None
+
+    entry_size = os.path.getsize(cache._path("data", "model", 0))
+    cache.max_bytes = 2 * entry_size
+    cache.evict()
+    assert cache.load("data", "model", 1) is None
+    assert cache.load("data", "model", 0) is not None
+    assert cache.load("data", "model", 2) is not None
+
+def test_model_key_is_stable_for_object_params():
+    """
+    verifies estimator, RandomState and callable params give the same key
+    on every build, changes in nested params change it, and values with
+    no stable form opt the model out of caching
+    """
+    from sklearn.ensemble import BaggingClassifier
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.preprocessing import FunctionTransformer
+
+    def build(C=1.0):
+        return BaggingClassifier(LogisticRegression(C=C), random_state=np.random.RandomState(0))
+    assert get_model_key("m", build()) == get_model_key("m", build())
+    assert get_model_key("m", build()) != get_model_key("m", build(C=2.0))
+    assert get_model_key("m", FunctionTransformer(np.log1p)) == get_model_key("m", FunctionTransformer(np.log1p))
+    assert get_model_key("m", FunctionTransformer(kw_args={"x": object()})) is None
@@ -0,0 +1,19 @@
+import numpy as np
+from training.compare_models import compare_all_models
+
+def test_parallel_gauntlet_matches_serial(toy_model_module):
+    """
+    verifies the process-pool scheduler gives the same leaderboard
+    as the serial loop, and drops models that fail to import
+    """
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 4))
+    y = (X[:, 0] + rng.normal(scale=0.5, size=200) > 0).astype(int)
+    modules = [toy_model_module, "missing_model_module"]
+
+    serial = compare_all_models(X, y, model_modules=modules)
+    parallel = compare_all_models(X, y, n_workers=2, model_modules=modules)
+
+    assert parallel["model"].tolist() == ["toy_logistic_model"]
+    assert np.allclose(serial["auc"].values, parallel["auc"].values)
+    assert np.allclose(serial["accuracy"].values, parallel["accuracy"].values)
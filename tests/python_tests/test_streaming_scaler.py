@@ -0,0 +1,37 @@
+import numpy as np
+from scaling.streaming_scaler import StreamingScaler
+
+def test_partial_fit_matches_full_fit():
+    """
+    verifies chunked partial_fit reproduces whole-matrix mean and std
+    """
+    rng = np.random.default_rng(1)
+    X = rng.normal(loc=5.0, scale=3.0, size=(1_000, 4))
+
+    scaler = StreamingScaler()
+    for chunk in np.array_split(X, 7):
+        scaler.partial_fit(chunk)
+
+    assert np.allclose(scaler.mean, X.mean(axis=0))
+    assert np.allclose(scaler.std, X.std(axis=0, ddof=1))
+
+def test_merge_and_transform():
+    """
+    verifies scalers fitted on separate shards merge exactly
+    and transform_batches yields z-scores per chunk, keeping nan rows
+    """
+    rng = np.random.default_rng(2)
+    X = rng.normal(size=(600, 3))
+    X[10, 1] = np.nan
+
+    left = StreamingScaler().partial_fit(X[:250])
+    right = StreamingScaler().partial_fit(X[250:])
+    merged = left.merge(right)
+
+    valid = X[~np.isnan(X[:, 1])]
+    assert np.allclose(merged.mean[1], valid[:, 1].mean())
+    assert np.allclose(merged.std[0], X[:, 0].std(ddof=1))
+
+    scaled = np.vstack(list(merged.transform_batches(np.array_split(X, 4))))
+    assert scaled.shape == X.shape
+    assert np.isnan(scaled[10, 1])
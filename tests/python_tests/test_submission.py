@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+from file_io.submission_writer import write_kaggle_submission
+from generate_submission import create_submission
+from training.prediction_store import PredictionStore
+
+def test_batched_submission_matches_single_pass(tmp_path):
+    """
+    verifies batched scoring (serial and threaded, csv and parquet out)
+    writes exactly what one full predict_proba call would
+    """
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(1037, 3))
+    model = LogisticRegression().fit(X, (X[:, 0] > 0).astype(int))
+    test_csv = tmp_path / "test.csv"
+    pd.DataFrame({"id": np.arange(1037) + 5000, "a": X[:, 0], "b": X[:, 1], "c": X[:, 2]}).to_csv(test_csv, index=False)
+
+    test_df = pd.read_csv(test_csv)
+    expected = tmp_path / "expected.csv"
+    write_kaggle_submission(test_df['id'].tolist(), model.predict_proba(test_df.drop(columns=['id']).values)[:, 1], str(expected))
+
+    serial = tmp_path / "serial.csv"
+    create_submission(model, str(test_csv), str(serial), batch_size=100)
+    threaded = tmp_path / "threaded.parquet"
+    store = PredictionStore(str(tmp_path / "preds"))
+    create_submission(model, str(test_csv), str(threaded), batch_size=64, n_threads=3,
+                      prediction_store=store, model_name="toy")
+
+    assert serial.read_text() == expected.read_text()
+    reference = pd.read_csv(expected)
+    pd.testing.assert_frame_equal(pd.read_parquet(threaded), reference)
+    assert np.array_equal(store.load("test", "toy"), pd.read_parquet(threaded)["smoking"].values)
+    assert store.load_row_ids("test").tolist() == reference["id"].tolist()